@@ -1,6 +1,14 @@
 """Core utilities for skill-split."""
 
-from core.validator import Validator  # noqa: F401
 from models import ValidationResult  # noqa: F401
 
 __all__ = ["Validator", "ValidationResult"]
+
+
+def __getattr__(name):
+    # Validator pulls in the database, recomposer and every handler; load it
+    # on first access so `import core.parser` stays cheap
+    if name == "Validator":
+        from core.validator import Validator
+        return Validator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
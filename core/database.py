@@ -7,13 +7,70 @@ database operations for storing parsed files and their sections.
 
 from __future__ import annotations
 
+import re
 import sqlite3
+from itertools import groupby
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any, Callable
+from typing import List, Optional, Tuple, Dict, Any, Callable, Iterator
 
 from models import FileMetadata, Section, ParsedDocument, FileType
 
+# Per-connection tuning: NORMAL sync (durable under WAL, no fsync per
+# commit), 64 MiB page cache, in-memory temp tables, 256 MiB mmap
+_TUNED_PRAGMAS = (
+    "synchronous=NORMAL",
+    "cache_size=-65536",
+    "temp_store=memory",
+    "mmap_size=268435456",
+    "busy_timeout=5000",
+)
+
+
+def tune_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Apply the per-connection pragmas to a freshly opened connection.
+
+    These settings are not stored in the database file, so every new
+    connection needs them. WAL itself is persistent and is switched on once
+    by DatabaseStore when it creates the schema.
+
+    Args:
+        conn: Open sqlite3 connection
+
+    Returns:
+        The same connection
+    """
+    for pragma in _TUNED_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+def open_tuned(db_path: str, readonly: bool = True) -> sqlite3.Connection:
+    """
+    Open a SQLite connection tuned for bulk scripts (ingest, migrations).
+
+    Writable connections also switch the database to WAL with
+    synchronous=NORMAL, so readers are not blocked by the writer. WAL is a
+    persistent database setting and cannot be changed from a read-only
+    connection, so readers just inherit whatever mode the file is in.
+
+    Args:
+        db_path: Path to SQLite database file
+        readonly: Open with mode=ro (the file must already exist)
+
+    Returns:
+        Open sqlite3 connection
+    """
+    if readonly:
+        uri = Path(db_path).expanduser().absolute().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+    else:
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+
+    return tune_connection(conn)
+
 
 class DatabaseStore:
     """
@@ -23,6 +80,9 @@ class DatabaseStore:
     and sections can have parent-child relationships.
     """
 
+    # Stays under SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999)
+    _MAX_IN_PARAMS = 900
+
     def __init__(self, db_path: str) -> None:
         """
         Initialize the database store.
@@ -32,6 +92,7 @@ class DatabaseStore:
         """
         self.db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+
         self._create_schema()
 
     @property
@@ -40,7 +101,7 @@ class DatabaseStore:
         Lazily-initialized connection for compatibility with integration tests.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
+            self._conn = self._connect()
             self._conn.row_factory = sqlite3.Row
             self._conn.execute("PRAGMA foreign_keys = ON")
         return self._conn
@@ -60,6 +121,10 @@ class DatabaseStore:
             self._conn.close()
             self._conn = None
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new tuned connection to the store's database."""
+        return tune_connection(sqlite3.connect(self.db_path))
+
     def _create_schema(self) -> None:
         """
         Create database tables if they don't exist.
@@ -67,7 +132,10 @@ class DatabaseStore:
         Creates the files and sections tables with proper indexes
         and foreign key constraints.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # Persistent: readers no longer block on the writer, and commits
+            # append to the log instead of rewriting pages
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA foreign_keys = ON")
 
             conn.execute(
@@ -109,6 +177,10 @@ class DatabaseStore:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_sections_parent ON sections(parent_id)"
             )
+            # Serves list_sections' per-file document-order scan
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sections_file_line ON sections(file_id, line_start)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_files_path ON files(path)"
             )
@@ -180,7 +252,7 @@ class DatabaseStore:
         Raises:
             sqlite3.Error: On database error
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("PRAGMA foreign_keys = ON")
 
             # Insert or update file record
@@ -205,118 +277,101 @@ class DatabaseStore:
             row = cursor.fetchone()
             file_id = row[0]
 
-            # Delete existing sections for this file (cascade delete handles children)
+            # Drop the old sections from the external-content FTS index
+            # (it only learns about deletes through the 'delete' command),
+            # then delete them (cascade delete handles children)
+            conn.execute(
+                """
+                INSERT INTO sections_fts(sections_fts, rowid, title, content)
+                SELECT 'delete', id, title, content FROM sections WHERE file_id = ?
+                """,
+                (file_id,)
+            )
             conn.execute("DELETE FROM sections WHERE file_id = ?", (file_id,))
 
-            # Store sections recursively (already includes FTS sync)
-            self._store_sections(conn, file_id, doc.sections, parent_id=None)
-
-            # FINAL FTS SYNC to ensure complete index
-            self._ensure_fts_sync(conn)
-
-            conn.commit()
-            return file_id
-
-    def _store_sections(
-        self,
-        conn: sqlite3.Connection,
-        file_id: int,
-        sections: List[Section],
-        parent_id: Optional[int],
-        order_start: int = 0,
-    ) -> None:
-        """
-        Recursively store sections in the database with FTS5 synchronization.
-
-        Args:
-            conn: Database connection (within transaction)
-            file_id: ID of the parent file
-            sections: List of sections to store
-            parent_id: ID of parent section (None for top-level)
-            order_start: Starting order index for this batch
-        """
-        for order_index, section in enumerate(sections, start=order_start):
-            cursor = conn.execute(
+            # Insert all sections with one executemany, then index them
+            rows: List[tuple] = []
+            self._collect_section_rows(
+                file_id, doc.sections, None, self._next_section_id(conn), rows
+            )
+            conn.executemany(
                 """
                 INSERT INTO sections (
-                    file_id, parent_id, level, title, content,
+                    id, file_id, parent_id, level, title, content,
                     order_index, line_start, line_end, closing_tag_prefix
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.execute(
+                """
+                INSERT INTO sections_fts(rowid, title, content)
+                SELECT id, title, content FROM sections WHERE file_id = ?
                 """,
-                (
-                    file_id,
-                    parent_id,
-                    section.level,
-                    section.title,
-                    section.content,
-                    order_index,
-                    section.line_start,
-                    section.line_end,
-                    section.closing_tag_prefix,
-                ),
+                (file_id,)
             )
-            section_id = cursor.lastrowid
 
-            # Recursively store children
-            if section.children:
-                self._store_sections(conn, file_id, section.children, section_id)
+            conn.commit()
+            return file_id
 
-            # Sync FTS table for this section
-            self._sync_section_fts(conn, file_id, section)
+    @staticmethod
+    def _next_section_id(conn: sqlite3.Connection) -> int:
+        """
+        First unused section id, never reusing ids of deleted sections.
 
-        # ENSURE FTS SYNC after bulk insert
-        # This guarantees FTS index is up-to-date for new sections
-        self._ensure_fts_sync(conn)
+        Ids are assigned up front so parent_id links can be filled in
+        without a round-trip per row; honoring sqlite_sequence keeps the
+        AUTOINCREMENT guarantee that ids are not recycled.
+        """
+        row = conn.execute(
+            """
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'sections'), 0),
+                COALESCE((SELECT MAX(id) FROM sections), 0)
+            )
+            """
+        ).fetchone()
+        return row[0] + 1
 
-    def _sync_section_fts(
+    def _collect_section_rows(
         self,
-        conn: sqlite3.Connection,
         file_id: int,
-        section: Section,
-        parent_id: Optional[int] = None
-    ) -> None:
+        sections: List[Section],
+        parent_id: Optional[int],
+        next_id: int,
+        rows: List[tuple],
+    ) -> int:
         """
-        Sync a single section to FTS table.
+        Flatten a section tree into insert rows, parents before children.
 
         Args:
-            conn: Database connection (within transaction)
             file_id: ID of the parent file
-            section: Section to sync
+            sections: Sections at this level
             parent_id: ID of parent section (None for top-level)
-        """
-        # Get section_id from last insert or query
-        cursor = conn.execute(
-            "SELECT id FROM sections WHERE file_id = ? AND title = ? AND line_start = ?",
-            (file_id, section.title, section.line_start)
-        )
-        row = cursor.fetchone()
-        if row:
-            section_id = row[0]
-            conn.execute(
-                "INSERT OR REPLACE INTO sections_fts(rowid, title, content) VALUES (?, ?, ?)",
-                (section_id, section.title, section.content)
-            )
-        # Recursively sync children
-        if section.children:
-            for child in section.children:
-                self._sync_section_fts(conn, file_id, child, section_id)
-
-    def _ensure_fts_sync(self, conn: sqlite3.Connection) -> None:
-        """
-        Ensure FTS5 index is synchronized with main sections table.
-
-        FTS5 external content tables can become out of sync during bulk
-        operations or CASCADE deletes. This forces an explicit sync.
+            next_id: Id to assign to the next section
+            rows: Output list that rows are appended to
 
-        Args:
-            conn: Active database connection
+        Returns:
+            The next unassigned id
         """
-        try:
-            # FTS5 'optimize' command rebuilds index ensuring sync
-            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES('optimize')")
-        except Exception:
-            # Optimize may fail if index is empty, ignore
-            pass
+        for order_index, section in enumerate(sections):
+            section_id = next_id
+            rows.append((
+                section_id,
+                file_id,
+                parent_id,
+                section.level,
+                section.title,
+                section.content,
+                order_index,
+                section.line_start,
+                section.line_end,
+                section.closing_tag_prefix,
+            ))
+            next_id = self._collect_section_rows(
+                file_id, section.children, section_id, next_id + 1, rows
+            )
+        return next_id
 
     def _sync_single_section_fts(self, conn: sqlite3.Connection, section_id: int) -> None:
         """
@@ -355,7 +410,7 @@ class DatabaseStore:
         Returns:
             Tuple of (FileMetadata, List[Section]) if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             # Get file metadata
@@ -407,7 +462,7 @@ class DatabaseStore:
         Returns:
             Section object with file_id and file_type populated if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             cursor = conn.execute(
@@ -436,6 +491,62 @@ class DatabaseStore:
                 file_type=FileType(row["file_type"]),
             )
 
+    @staticmethod
+    def _list_sections_sql(
+        file_path: Optional[str], limit: Optional[int], offset: int
+    ) -> Tuple[str, List[Any]]:
+        """Build the document-order section listing query and its parameters."""
+        query = "SELECT s.id, s.level, s.title FROM sections s"
+        params: List[Any] = []
+        if file_path is not None:
+            query += " JOIN files f ON s.file_id = f.id WHERE f.path = ?"
+            params.append(file_path)
+        query += " ORDER BY s.file_id, s.line_start, s.id"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
+        return query, params
+
+    def list_sections(
+        self, file_path: Optional[str] = None, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Tuple[int, int, str]]:
+        """
+        List sections in document order as lightweight rows.
+
+        Args:
+            file_path: Optional file path to list sections for (default: all files)
+            limit: Maximum number of rows; applied in SQL so SQLite stops early
+            offset: Number of rows to skip
+
+        Returns:
+            List of (section_id, level, title) tuples ordered by file, then line
+        """
+        query, params = self._list_sections_sql(file_path, limit, offset)
+        with self._connect() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def iter_sections(
+        self, file_path: Optional[str] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Stream (section_id, level, title) rows in document order.
+
+        Rows come straight off the cursor, so memory stays constant no
+        matter how many sections are listed.
+
+        Args:
+            file_path: Optional file path to list sections for (default: all files)
+
+        Yields:
+            (section_id, level, title) tuples ordered by file, then line
+        """
+        query, params = self._list_sections_sql(file_path, None, 0)
+        conn = self._connect()
+        try:
+            yield from conn.execute(query, params)
+        finally:
+            conn.close()
+
     def get_section_tree(self, file_path: str) -> List[Section]:
         """
         Get hierarchical section tree for a file.
@@ -449,7 +560,7 @@ class DatabaseStore:
         Returns:
             List of top-level Section objects with populated children
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             cursor = conn.execute(
@@ -481,6 +592,41 @@ class DatabaseStore:
 
             return self._build_section_tree(rows)
 
+    def get_file_with_sections(self, file_path: str) -> Optional[Tuple[int, List[Section]]]:
+        """
+        Get a file's id and section tree in one query.
+
+        Unlike get_section_tree(), a missing file (None) is told apart from
+        a file with no sections ((file_id, [])) without a second lookup,
+        and both come from the same read snapshot.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Tuple of (file_id, top-level Sections with children populated),
+            or None if the file is not in the database
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                """
+                SELECT f.id AS file_id, s.id, s.parent_id, s.level, s.title,
+                       s.content, s.order_index, s.line_start, s.line_end
+                FROM files f
+                LEFT JOIN sections s ON s.file_id = f.id
+                WHERE f.path = ?
+                ORDER BY s.order_index
+                """,
+                (file_path,),
+            ).fetchall()
+
+        if not rows:
+            return None
+        # A file without sections comes back as one row of NULL section columns
+        section_rows = [row for row in rows if row["id"] is not None]
+        return rows[0]["file_id"], self._build_section_tree(section_rows)
+
     def _build_section_tree(self, rows: List[sqlite3.Row]) -> List[Section]:
         """
         Build hierarchical section tree from flat database rows.
@@ -506,6 +652,7 @@ class DatabaseStore:
                 line_start=row["line_start"],
                 line_end=row["line_end"],
                 closing_tag_prefix=prefix,
+                id=row["id"],
             )
             sections_by_id[row["id"]] = section
 
@@ -539,7 +686,7 @@ class DatabaseStore:
         Returns:
             Section object with file_type populated if next section exists, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             # Get current section's order_index and parent_id
@@ -591,57 +738,42 @@ class DatabaseStore:
         self, query: str, file_path: Optional[str] = None
     ) -> List[Tuple[int, Section]]:
         """
-        Search sections by title/content.
+        Search sections by title/content using the FTS5 index.
 
-        Performs case-insensitive search across section titles and content.
-        If file_path is provided, restricts search to that file.
+        Matches go through sections_fts rather than a LIKE scan, so cost
+        grows with the number of hits instead of the total section count.
+        The query is preprocessed the same way as search_sections_with_rank()
+        and results come back in the same BM25 order.
 
         Args:
-            query: Search query string
+            query: Search query string (natural language or FTS5 MATCH syntax)
             file_path: Optional file path to restrict search to
 
         Returns:
-            List of (section_id, Section) tuples matching the query
+            List of (section_id, Section) tuples matching the query, most
+            relevant first
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        processed_query = self.preprocess_fts5_query(query)
+        if not processed_query:
+            return []
 
-            # Build query with search conditions
-            if file_path:
-                # First get file_id from path
-                cursor = conn.execute(
-                    "SELECT id FROM files WHERE path = ?",
-                    (file_path,)
-                )
-                file_row = cursor.fetchone()
-                if not file_row:
-                    return []
-                file_id = file_row["id"]
+        sql = """
+            SELECT s.id, s.level, s.title, s.content, s.line_start, s.line_end,
+                   s.closing_tag_prefix, s.file_id, f.type as file_type
+            FROM sections_fts
+            JOIN sections s ON sections_fts.rowid = s.id
+            JOIN files f ON s.file_id = f.id
+            WHERE sections_fts MATCH ?
+        """
+        params: Tuple = (processed_query,)
+        if file_path:
+            sql += " AND f.path = ?"
+            params += (file_path,)
+        sql += " ORDER BY bm25(sections_fts)"
 
-                cursor = conn.execute(
-                    """
-                    SELECT s.id, s.level, s.title, s.content, s.line_start, s.line_end,
-                           s.closing_tag_prefix, s.file_id, f.type as file_type
-                    FROM sections s
-                    JOIN files f ON s.file_id = f.id
-                    WHERE s.file_id = ?
-                      AND (s.title LIKE ? OR s.content LIKE ?)
-                    ORDER BY s.file_id, s.order_index
-                    """,
-                    (file_id, f"%{query}%", f"%{query}%"),
-                )
-            else:
-                cursor = conn.execute(
-                    """
-                    SELECT s.id, s.level, s.title, s.content, s.line_start, s.line_end,
-                           s.closing_tag_prefix, s.file_id, f.type as file_type
-                    FROM sections s
-                    JOIN files f ON s.file_id = f.id
-                    WHERE s.title LIKE ? OR s.content LIKE ?
-                    ORDER BY s.file_id, s.order_index
-                    """,
-                    (f"%{query}%", f"%{query}%"),
-                )
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = self._execute_match(conn, sql, params)
 
             results = []
             for row in cursor.fetchall():
@@ -716,11 +848,11 @@ class DatabaseStore:
 
         # Check for single word
         if ' ' not in query:
-            # Single word - check for special characters that need quoting
-            # FTS5 treats certain characters as operators (-, *, ", etc.)
-            special_chars = set('-*"\'<>')
-            if any(char in query for char in special_chars):
-                return f'"{query}"'
+            # Single word - FTS5 barewords may only hold word characters;
+            # anything else (-, *, ., (, :, etc.) is syntax, so quote it
+            if re.search(r'\W', query):
+                # Double embedded quotes so a stray " cannot break the string
+                return '"' + query.replace('"', '""') + '"'
             return query
 
         # Multi-word unquoted: convert to OR for discovery
@@ -729,10 +861,45 @@ class DatabaseStore:
         words = query.split()
 
         # Quote each word for exact matching (handles special chars)
-        or_terms = ' OR '.join(f'"{w}"' for w in words)
+        or_terms = ' OR '.join('"' + w.replace('"', '""') + '"' for w in words)
 
         return or_terms
 
+    @staticmethod
+    def _quote_fts5_terms(query: str) -> str:
+        """
+        Quote every term of a MATCH query, keeping AND/OR between terms.
+
+        The result is always valid FTS5 syntax: each quoted term is matched
+        literally, and operators left dangling at either end are dropped.
+        """
+        parts: List[str] = []
+        for token in query.split():
+            if token in ('AND', 'OR'):
+                if parts and parts[-1] not in ('AND', 'OR'):
+                    parts.append(token)
+            else:
+                parts.append('"' + token.strip('"').replace('"', '""') + '"')
+        if parts and parts[-1] in ('AND', 'OR'):
+            parts.pop()
+        return ' '.join(parts)
+
+    def _execute_match(
+        self, conn: sqlite3.Connection, sql: str, params: Tuple
+    ) -> sqlite3.Cursor:
+        """
+        Run a MATCH query whose first parameter is the preprocessed query.
+
+        Queries with AND/OR/NEAR go to FTS5 as typed, so punctuation in them
+        can still be a syntax error. If FTS5 rejects the query, it is retried
+        with every term quoted.
+        """
+        try:
+            return conn.execute(sql, params)
+        except sqlite3.OperationalError:
+            quoted = self._quote_fts5_terms(params[0])
+            return conn.execute(sql, (quoted,) + tuple(params[1:]))
+
     def search_sections_with_rank(
         self, query: str, file_path: Optional[str] = None
     ) -> List[Tuple[int, float]]:
@@ -763,12 +930,13 @@ class DatabaseStore:
         if not processed_query:
             return []
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             if file_path:
                 # Single file search with FTS
-                cursor = conn.execute(
+                cursor = self._execute_match(
+                    conn,
                     """
                     SELECT s.id, bm25(sections_fts) as rank
                     FROM sections_fts
@@ -781,7 +949,8 @@ class DatabaseStore:
                 )
             else:
                 # Cross-file search with FTS
-                cursor = conn.execute(
+                cursor = self._execute_match(
+                    conn,
                     """
                     SELECT s.id, bm25(sections_fts) as rank
                     FROM sections_fts
@@ -797,6 +966,45 @@ class DatabaseStore:
             results = [(row["id"], -row["rank"]) for row in cursor.fetchall()]
             return results
 
+    def search_snippets(
+        self, query: str, limit: int = 10
+    ) -> List[Tuple[int, float, str, str]]:
+        """
+        Top BM25 matches with a highlighted content snippet, in one query.
+
+        Ranking, limiting and snippet extraction all happen inside FTS5, so
+        full section content is never read back for display.
+
+        Args:
+            query: Search string (preprocessed like search_sections_with_rank)
+            limit: Maximum number of results
+
+        Returns:
+            List of (section_id, score, title, snippet) tuples, most relevant
+            first; score is the negated BM25 rank (higher = more relevant)
+        """
+        processed_query = self.preprocess_fts5_query(query)
+        if not processed_query:
+            return []
+
+        with self._connect() as conn:
+            cursor = self._execute_match(
+                conn,
+                """
+                SELECT rowid, bm25(sections_fts) AS rank, title,
+                       snippet(sections_fts, 1, '[', ']', '…', 16)
+                FROM sections_fts
+                WHERE sections_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+                """,
+                (processed_query, limit)
+            )
+            return [
+                (section_id, -rank, title, snippet)
+                for section_id, rank, title, snippet in cursor.fetchall()
+            ]
+
     def delete_file(self, file_id: int) -> bool:
         """
         Delete a file and all its sections with FTS cleanup.
@@ -810,7 +1018,7 @@ class DatabaseStore:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("PRAGMA foreign_keys = ON")
 
             # Check file exists
@@ -866,7 +1074,7 @@ class DatabaseStore:
         # Types that always use file stem
         _STEM_NAME_TYPES = {"command", "config", "script", "python", "javascript", "typescript", "shell"}
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT id, path, type, frontmatter, hash, created_at, updated_at FROM files ORDER BY path"
@@ -916,13 +1124,34 @@ class DatabaseStore:
                 result.append(d)
             return result
 
+    def get_section_stats(self) -> Dict[str, int]:
+        """
+        Aggregate section counts in a single SQL query.
+
+        Returns:
+            Dictionary with 'total_sections', 'files' (files that have
+            sections) and 'total_content_bytes'
+        """
+        with self._connect() as conn:
+            total_sections, files, total_content_bytes = conn.execute(
+                """
+                SELECT COUNT(*), COUNT(DISTINCT file_id), COALESCE(SUM(LENGTH(content)), 0)
+                FROM sections
+                """
+            ).fetchone()
+        return {
+            "total_sections": total_sections,
+            "files": files,
+            "total_content_bytes": total_content_bytes,
+        }
+
     def get_file_by_path(self, path: str):
         """Get a file by its path, returning (metadata, sections) tuple or None."""
         return self.get_file(path)
 
     def get_file_by_id(self, file_id: int):
         """Get a file by its integer ID, returning (metadata, sections) tuple or None."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT id, path, type, frontmatter, hash FROM files WHERE id = ?",
@@ -934,9 +1163,101 @@ class DatabaseStore:
             # Delegate to get_file using the path
             return self.get_file(row["path"])
 
+    def get_file_summary(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored file's id, hash and section count without loading sections.
+
+        Cheap enough to check before parsing whether a file has changed
+        since it was last stored.
+
+        Args:
+            path: File path as stored
+
+        Returns:
+            Dictionary with 'id', 'hash' and 'sections', or None if the
+            file is not in the database
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT f.id, f.hash,
+                       (SELECT COUNT(*) FROM sections s WHERE s.file_id = f.id)
+                FROM files f
+                WHERE f.path = ?
+                """,
+                (path,),
+            ).fetchone()
+        if row is None:
+            return None
+        file_id, file_hash, sections = row
+        return {"id": file_id, "hash": file_hash, "sections": sections}
+
+    def get_files_bulk(
+        self, file_ids: List[int]
+    ) -> Dict[int, Tuple[FileMetadata, List[Section]]]:
+        """
+        Retrieve many files with their sections in two queries.
+
+        Args:
+            file_ids: Integer file IDs to fetch
+
+        Returns:
+            Dict mapping file_id to (FileMetadata, List[Section]); IDs that
+            are not in the database are absent from the result
+        """
+        results: Dict[int, Tuple[FileMetadata, List[Section]]] = {}
+        ids = list(dict.fromkeys(file_ids))
+        if not ids:
+            return results
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), self._MAX_IN_PARAMS):
+                chunk = ids[start:start + self._MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+
+                metadata_by_id = {
+                    row["id"]: FileMetadata(
+                        path=row["path"],
+                        type=FileType(row["type"]),
+                        frontmatter=row["frontmatter"],
+                        hash=row["hash"],
+                    )
+                    for row in conn.execute(
+                        f"""
+                        SELECT id, path, type, frontmatter, hash
+                        FROM files WHERE id IN ({placeholders})
+                        """,
+                        chunk,
+                    )
+                }
+
+                cursor = conn.execute(
+                    f"""
+                    SELECT id, file_id, parent_id, level, title, content,
+                           order_index, line_start, line_end, closing_tag_prefix
+                    FROM sections
+                    WHERE file_id IN ({placeholders})
+                    ORDER BY file_id, order_index
+                    """,
+                    chunk,
+                )
+                rows_by_file = {
+                    file_id: list(rows)
+                    for file_id, rows in groupby(cursor, key=lambda row: row["file_id"])
+                }
+
+                for file_id, metadata in metadata_by_id.items():
+                    sections = self._build_section_tree(rows_by_file.get(file_id, []))
+                    results[file_id] = (metadata, sections)
+
+        return results
+
     def checkout_file(self, file_id, user: str, target_path: str, notes: str = "") -> int:
         """Record a file checkout. Returns checkout id."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO checkouts (file_id, user, target_path, status, notes)
@@ -949,7 +1270,7 @@ class DatabaseStore:
 
     def checkin_file(self, checkout_id: int) -> None:
         """Mark a checkout as returned."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 UPDATE checkouts SET status='returned', returned_at=CURRENT_TIMESTAMP
@@ -961,7 +1282,7 @@ class DatabaseStore:
 
     def get_checkout_info(self, target_path: str) -> Optional[Dict]:
         """Get active checkout info for a target path."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """
@@ -976,7 +1297,7 @@ class DatabaseStore:
 
     def get_active_checkouts(self, user: Optional[str] = None) -> List[Dict]:
         """Get all active checkouts, optionally filtered by user."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             if user:
                 cursor = conn.execute(
@@ -1011,7 +1332,7 @@ class DatabaseStore:
         Returns:
             List of file dictionaries with id, path, type, frontmatter, hash
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             cursor = conn.execute(
@@ -14,6 +14,11 @@ except ModuleNotFoundError:  # pragma: no cover
     OpenAI = None
     openai = None
 
+try:
+    import tiktoken
+except ModuleNotFoundError:  # pragma: no cover
+    tiktoken = None
+
 # Lazy import for SecretManager
 SecretManager = None
 
@@ -44,8 +49,13 @@ class EmbeddingService:
     # Token estimation (rough average ~100 tokens per 1000 characters for English text)
     TOKENS_PER_1K_CHARS = 0.1
 
-    # OpenAI pricing (as of Feb 2025)
-    PRICE_PER_1M_TOKENS = 0.00002  # $0.02 per 1M tokens for text-embedding-3-small
+    # OpenAI pricing (as of Feb 2025): USD per 1M tokens by model; shared
+    # with scripts/estimate_costs.py and scripts/generate_embeddings.py
+    PRICING = {
+        "text-embedding-3-small": 0.02,
+        "text-embedding-3-large": 0.13,
+        "text-embedding-ada-002": 0.10,
+    }
 
     def __init__(
         self,
@@ -67,7 +77,8 @@ class EmbeddingService:
 
         Raises:
             ImportError: If OpenAI client is not available
-            ValueError: If no API key found from any source
+            ValueError: If the model has no pricing entry or no API key found
+                from any source
 
         Credential priority order:
             1. api_key parameter (direct)
@@ -79,6 +90,12 @@ class EmbeddingService:
                 "OpenAI client not available. Install 'openai' package to use embedding features."
             )
 
+        if model not in self.PRICING:
+            raise ValueError(
+                f"Unknown embedding model: {model}. "
+                f"Supported: {', '.join(self.PRICING)}"
+            )
+
         # Ensure SecretManager imports if needed
         _ensure_secret_manager_imports()
 
@@ -133,6 +150,29 @@ class EmbeddingService:
         self.supabase_client = supabase_client
         self._embedding_cache: Dict[str, List[float]] = {}
         self._token_usage = 0
+        # tiktoken encoding, loaded on first count_tokens() call
+        self._encoding: Optional[Any] = None
+        self._encoding_loaded = False
+
+    def _get_encoding(self) -> Optional[Any]:
+        """
+        Get (and cache) the tiktoken encoding for this service's model.
+
+        Returns:
+            tiktoken Encoding, or None if tiktoken is unavailable
+        """
+        if not self._encoding_loaded:
+            self._encoding_loaded = True
+            if tiktoken is not None:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    # Unknown model name; current embedding models use cl100k_base
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    # e.g. encoding file could not be downloaded
+                    print(f"Warning: tiktoken unavailable, estimating tokens: {str(e)}")
+        return self._encoding
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -167,7 +207,7 @@ class EmbeddingService:
             return response.data[0].embedding
 
         except Exception as e:
-            raise RuntimeError(f"Failed to generate embedding: {str(e)}")
+            raise RuntimeError(f"Failed to generate embedding: {str(e)}") from e
 
     def batch_generate(
         self,
@@ -225,12 +265,18 @@ class EmbeddingService:
                 if hasattr(response, 'usage'):
                     self._token_usage += response.usage.prompt_tokens
 
-                # Embeddings come back in order
-                for item in response.data:
-                    embeddings.append(item.embedding)
+                batch_embeddings = [item.embedding for item in response.data]
 
             except Exception as e:
-                raise RuntimeError(f"Failed to generate batch embedding: {str(e)}")
+                raise RuntimeError(f"Failed to generate batch embedding: {str(e)}") from e
+
+            if len(batch_embeddings) != len(clean_batch):
+                # Unexpected response shape: fall back to one request per
+                # text rather than pair embeddings with the wrong texts
+                batch_embeddings = [self.generate_embedding(text) for text in clean_batch]
+
+            # Embeddings come back in order
+            embeddings.extend(batch_embeddings)
 
         return embeddings
 
@@ -351,7 +397,7 @@ class EmbeddingService:
             Estimated cost in USD
         """
         tokens = tokens_used if tokens_used is not None else self._token_usage
-        return (tokens / 1_000_000) * self.PRICE_PER_1M_TOKENS
+        return (tokens / 1_000_000) * self.PRICING[self.model]
 
     def estimate_tokens(self, text: str) -> int:
         """
@@ -369,6 +415,23 @@ class EmbeddingService:
         char_count = len(text)
         return max(1, int(char_count * self.TOKENS_PER_1K_CHARS))
 
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text using the model's tokenizer.
+
+        Falls back to estimate_tokens() when tiktoken is not installed.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Token count
+        """
+        encoding = self._get_encoding()
+        if encoding is None:
+            return self.estimate_tokens(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
     def _create_token_aware_batches(
         self,
         texts: List[str],
@@ -395,7 +458,7 @@ class EmbeddingService:
         current_indices = []
 
         for i, text in enumerate(texts):
-            text_tokens = self.estimate_tokens(text)
+            text_tokens = self.count_tokens(text)
 
             # Check if adding this text would exceed limits
             if (len(current_batch) >= max_batch_size or
@@ -211,13 +211,14 @@ class HybridSearch:
         self,
         query: str,
         limit: int = 10,
-        vector_weight: float = 0.7
+        vector_weight: float = 0.7,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Tuple[int, float]]:
         """
         Execute hybrid search combining vector and text approaches.
 
         Process:
-        1. Generate embedding for query
+        1. Generate embedding for query (unless query_embedding is given)
         2. Run vector search in parallel
         3. Run text search in parallel
         4. Merge results with hybrid scoring
@@ -227,6 +228,8 @@ class HybridSearch:
             query: Search query string
             limit: Maximum results to return
             vector_weight: Weight for vector results (0.0-1.0)
+            query_embedding: Precomputed embedding for query, e.g. from one
+                batched request covering several queries
 
         Returns:
             List of (section_id, score) tuples, ranked by score
@@ -241,18 +244,19 @@ class HybridSearch:
         start_time = datetime.now()
 
         try:
-            # Track embedding generation time
-            embedding_start = datetime.now()
-            query_embedding = self.embedding_service.generate_embedding(query)
-            embedding_time = (datetime.now() - embedding_start).total_seconds() * 1000
-            self.metrics["total_embedding_time_ms"] += embedding_time
-
-            # Check if embedding was cached
-            if hasattr(self.embedding_service, 'last_cached'):
-                if self.embedding_service.last_cached:
-                    self.metrics["embedding_cache_hits"] += 1
-                else:
-                    self.metrics["embedding_cache_misses"] += 1
+            if query_embedding is None:
+                # Track embedding generation time
+                embedding_start = datetime.now()
+                query_embedding = self.embedding_service.generate_embedding(query)
+                embedding_time = (datetime.now() - embedding_start).total_seconds() * 1000
+                self.metrics["total_embedding_time_ms"] += embedding_time
+
+                # Check if embedding was cached
+                if hasattr(self.embedding_service, 'last_cached'):
+                    if self.embedding_service.last_cached:
+                        self.metrics["embedding_cache_hits"] += 1
+                    else:
+                        self.metrics["embedding_cache_misses"] += 1
 
             # Run both searches with expanded limits to get more candidates
             expanded_limit = limit * 2
@@ -9,10 +9,32 @@ of large documents for token-efficient Claude interactions.
 from __future__ import annotations
 
 import sqlite3
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from models import Section
-from core.database import DatabaseStore
+from core.database import DatabaseStore, tune_connection
+
+# Navigation queries, kept as constants so every call passes the identical
+# string and hits the connection's prepared-statement cache
+_SQL_SECTION_POSITION = """
+    SELECT parent_id, order_index, level
+    FROM sections WHERE id = ?
+"""
+_SQL_FILE_ID = "SELECT id FROM files WHERE path = ?"
+_SQL_FIRST_CHILD = """
+    SELECT id, level, title, content, line_start, line_end
+    FROM sections
+    WHERE file_id = ? AND parent_id = ?
+    ORDER BY order_index ASC
+    LIMIT 1
+"""
+_SQL_NEXT_SIBLING = """
+    SELECT id, level, title, content, line_start, line_end
+    FROM sections
+    WHERE file_id = ? AND parent_id IS ? AND order_index > ?
+    ORDER BY order_index ASC
+    LIMIT 1
+"""
 
 
 class QueryAPI:
@@ -33,6 +55,26 @@ class QueryAPI:
         """
         self.store = DatabaseStore(db_path)
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        Long-lived read connection, opened on first use.
+
+        Reusing one connection keeps its prepared statements cached across
+        calls, so repeated navigation skips SQL parsing and planning.
+        """
+        if self._conn is None:
+            self._conn = tune_connection(sqlite3.connect(self.db_path, cached_statements=256))
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def close(self) -> None:
+        """Close the read connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def get_section(self, section_id: int) -> Optional[Section]:
         """
@@ -69,86 +111,54 @@ class QueryAPI:
         Returns:
             The next Section object if one exists, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        conn = self.conn
 
-            # Get current section info
-            cursor = conn.execute(
-                """
-                SELECT parent_id, order_index, level
-                FROM sections WHERE id = ?
-                """,
-                (current_section_id,),
-            )
-            row = cursor.fetchone()
+        # Get current section info
+        row = conn.execute(_SQL_SECTION_POSITION, (current_section_id,)).fetchone()
 
-            if not row:
-                return None
+        if not row:
+            return None
 
-            parent_id = row["parent_id"]
-            current_order = row["order_index"]
-            current_level = row["level"]
+        parent_id = row["parent_id"]
+        current_order = row["order_index"]
 
-            # Get file_id from file path
-            cursor = conn.execute(
-                "SELECT id FROM files WHERE path = ?",
-                (file_path,),
-            )
-            file_row = cursor.fetchone()
-
-            if not file_row:
-                return None
-
-            file_id = file_row["id"]
-
-            # FIRST CHILD: Return first child subsection
-            if first_child:
-                cursor = conn.execute(
-                    """
-                    SELECT id, level, title, content, line_start, line_end
-                    FROM sections
-                    WHERE file_id = ? AND parent_id = ?
-                    ORDER BY order_index ASC
-                    LIMIT 1
-                    """,
-                    (file_id, current_section_id),
-                )
-                child_row = cursor.fetchone()
-
-                if child_row:
-                    return Section(
-                        level=child_row["level"],
-                        title=child_row["title"],
-                        content=child_row["content"],
-                        line_start=child_row["line_start"],
-                        line_end=child_row["line_end"],
-                    )
-
-                # No children, fall through to sibling behavior
-                # (or could return None to indicate no children)
-
-            # NEXT SIBLING: Query for next section with same parent
-            cursor = conn.execute(
-                """
-                SELECT id, level, title, content, line_start, line_end
-                FROM sections
-                WHERE file_id = ? AND parent_id IS ? AND order_index > ?
-                ORDER BY order_index ASC
-                LIMIT 1
-                """,
-                (file_id, parent_id, current_order),
-            )
-            next_row = cursor.fetchone()
+        # Get file_id from file path
+        file_row = conn.execute(_SQL_FILE_ID, (file_path,)).fetchone()
+
+        if not file_row:
+            return None
 
-            if next_row:
+        file_id = file_row["id"]
+
+        # FIRST CHILD: Return first child subsection
+        if first_child:
+            child_row = conn.execute(_SQL_FIRST_CHILD, (file_id, current_section_id)).fetchone()
+
+            if child_row:
                 return Section(
-                    level=next_row["level"],
-                    title=next_row["title"],
-                    content=next_row["content"],
-                    line_start=next_row["line_start"],
-                    line_end=next_row["line_end"],
+                    level=child_row["level"],
+                    title=child_row["title"],
+                    content=child_row["content"],
+                    line_start=child_row["line_start"],
+                    line_end=child_row["line_end"],
                 )
 
+            # No children, fall through to sibling behavior
+
+        # NEXT SIBLING: Query for next section with same parent
+        next_row = conn.execute(
+            _SQL_NEXT_SIBLING, (file_id, parent_id, current_order)
+        ).fetchone()
+
+        if next_row:
+            return Section(
+                level=next_row["level"],
+                title=next_row["title"],
+                content=next_row["content"],
+                line_start=next_row["line_start"],
+                line_end=next_row["line_end"],
+            )
+
         return None
 
     def get_section_tree(self, file_path: str) -> List[Section]:
@@ -166,14 +176,44 @@ class QueryAPI:
         """
         return self.store.get_section_tree(file_path)
 
+    def list_sections(
+        self, file_path: Optional[str] = None, limit: Optional[int] = None, offset: int = 0
+    ) -> List[tuple[int, int, str]]:
+        """
+        List sections in document order without loading their content.
+
+        Args:
+            file_path: Optional file path to list sections for (default: all files)
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+
+        Returns:
+            List of (section_id, level, title) tuples
+        """
+        return self.store.list_sections(file_path, limit=limit, offset=offset)
+
+    def iter_sections(self, file_path: Optional[str] = None) -> Iterator[tuple[int, int, str]]:
+        """
+        Stream sections in document order without building a list.
+
+        Args:
+            file_path: Optional file path to list sections for (default: all files)
+
+        Yields:
+            (section_id, level, title) tuples
+        """
+        return self.store.iter_sections(file_path)
+
     def search_sections(
         self, query: str, file_path: Optional[str] = None
     ) -> List[tuple[int, Section]]:
         """
         Search sections by title or content using FTS5 full-text search.
 
-        Now delegates to search_sections_with_rank() for BM25 relevance ranking.
-        Returns (section_id, Section) tuples ordered by relevance.
+        Runs as a single FTS5 query joined to the sections table, so the
+        matching Section objects come back without a lookup per hit.
+        Results are ordered by BM25 relevance, same as
+        search_sections_with_rank().
 
         Args:
             query: Search string (FTS5 MATCH syntax supported)
@@ -182,17 +222,7 @@ class QueryAPI:
         Returns:
             List of (section_id, Section) tuples matching the query, ranked by relevance
         """
-        # Get ranked results
-        ranked_results = self.search_sections_with_rank(query, file_path)
-
-        # Convert to (section_id, Section) tuples
-        results = []
-        for section_id, rank in ranked_results:
-            section = self.get_section(section_id)
-            if section:
-                results.append((section_id, section))
-
-        return results
+        return self.store.search_sections(query, file_path)
 
     def search_sections_with_rank(
         self, query: str, file_path: Optional[str] = None
@@ -0,0 +1,138 @@
+"""Direct Postgres writer for bulk loads into the Supabase schema."""
+from typing import Any, Dict, List
+from pathlib import Path
+import threading
+try:
+    import psycopg
+except ModuleNotFoundError:  # pragma: no cover - handled at runtime
+    psycopg = None
+from models import FileMetadata, Section
+from core.supabase_store import SupabaseStore
+
+
+class SupabasePgStore:
+    """
+    Write files and sections over a direct Postgres connection with COPY.
+
+    PostgREST parses every row as JSON and plans each insert; COPY streams
+    rows straight into the table, which is much faster for large loads.
+    Only the write path is provided - reads still go through SupabaseStore.
+    """
+
+    SECTION_COLUMNS = (
+        "id", "file_id", "parent_id", "level", "title", "content",
+        "order_index", "line_start", "line_end",
+    )
+
+    def __init__(self, database_url: str) -> None:
+        """
+        Open the Postgres connection.
+
+        Args:
+            database_url: Postgres connection string (Supabase's direct
+                connection URL, e.g. DATABASE_URL)
+
+        Raises:
+            ImportError: If psycopg is not installed
+        """
+        if psycopg is None:
+            raise ImportError(
+                "SupabasePgStore requires 'psycopg'. Install it with: pip install 'psycopg[binary]'"
+            )
+        self.conn = psycopg.connect(database_url)
+        # One connection can run one transaction at a time
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SupabasePgStore":
+        """
+        Context manager support for SupabasePgStore.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        Close the connection when leaving context.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the Postgres connection."""
+        self.conn.close()
+
+    def store_files_bulk(
+        self,
+        file_metas: List[FileMetadata],
+        sections_per_file: List[List[Section]],
+    ) -> List[str]:
+        """
+        Store or update many files and their sections in one transaction.
+
+        Files are copied into a temporary table and upserted on storage_path
+        from there (COPY alone cannot resolve conflicts), old sections are
+        deleted, and the new sections are copied straight into sections.
+        Same contract as SupabaseStore.store_files_bulk().
+
+        Args:
+            file_metas: Metadata for each file (path is used as storage_path)
+            sections_per_file: Top-level sections for each file, aligned
+                with file_metas
+
+        Returns:
+            List of file_ids (UUID strings) in the same order as file_metas
+        """
+        if len(file_metas) != len(sections_per_file):
+            raise ValueError("file_metas and sections_per_file must be the same length")
+        if not file_metas:
+            return []
+
+        with self._lock:
+            try:
+                with self.conn.cursor() as cur:
+                    cur.execute(
+                        "CREATE TEMP TABLE files_in "
+                        "(name TEXT, storage_path TEXT, type TEXT, frontmatter TEXT, hash TEXT) "
+                        "ON COMMIT DROP"
+                    )
+                    with cur.copy(
+                        "COPY files_in (name, storage_path, type, frontmatter, hash) FROM STDIN"
+                    ) as copy:
+                        for meta in file_metas:
+                            copy.write_row((
+                                Path(meta.path).stem,
+                                meta.path,
+                                meta.type.value,
+                                meta.frontmatter if meta.frontmatter else None,
+                                meta.hash,
+                            ))
+                    cur.execute(
+                        "INSERT INTO files (name, storage_path, type, frontmatter, hash) "
+                        "SELECT name, storage_path, type, frontmatter, hash FROM files_in "
+                        "ON CONFLICT (storage_path) DO UPDATE SET "
+                        "name = EXCLUDED.name, type = EXCLUDED.type, "
+                        "frontmatter = EXCLUDED.frontmatter, hash = EXCLUDED.hash, "
+                        "updated_at = NOW() "
+                        "RETURNING id, storage_path"
+                    )
+                    id_by_path = {path: str(file_id) for file_id, path in cur.fetchall()}
+                    file_ids = [id_by_path[meta.path] for meta in file_metas]
+
+                    # Replace existing sections (no-op for newly inserted files)
+                    cur.execute("DELETE FROM sections WHERE file_id = ANY(%s::uuid[])", (file_ids,))
+
+                    rows: List[Dict[str, Any]] = []
+                    for file_id, sections in zip(file_ids, sections_per_file):
+                        SupabaseStore._collect_section_rows(file_id, sections, None, rows)
+
+                    if rows:
+                        with cur.copy(
+                            f"COPY sections ({', '.join(self.SECTION_COLUMNS)}) FROM STDIN"
+                        ) as copy:
+                            for row in rows:
+                                copy.write_row(tuple(row[column] for column in self.SECTION_COLUMNS))
+
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+        return file_ids
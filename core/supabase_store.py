@@ -1,11 +1,20 @@
 """Supabase database store for parsed documents."""
 from typing import List, Optional, Tuple, Dict, Any
+from pathlib import Path
 import os
+import random
+import threading
+import time
+import uuid
 try:
     from supabase import create_client, Client
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime
     create_client = None
     Client = object
+try:
+    import httpx
+except ModuleNotFoundError:  # pragma: no cover - installed alongside supabase
+    httpx = None
 from models import ParsedDocument, FileMetadata, Section, FileType
 
 # Lazy import for SecretManager
@@ -23,9 +32,22 @@ def _ensure_secret_manager_imports():
             SecretManager = None
 
 
+class CircuitOpen(Exception):
+    """Raised when too many consecutive Supabase writes have failed."""
+    pass
+
+
 class SupabaseStore:
     """Supabase database store for parsed documents and sections."""
 
+    # Retry policy for transient write failures (network errors, 429, 5xx)
+    STORE_RETRY_ATTEMPTS = 4
+    STORE_RETRY_BASE_DELAY = 0.5
+    STORE_RETRY_MAX_DELAY = 8.0
+    # Consecutive failed writes (after retries) before CircuitOpen is raised
+    CIRCUIT_BREAKER_THRESHOLD = 10
+    TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -162,6 +184,35 @@ class SupabaseStore:
 
         self.client: Client = create_client(self.url, self.key)
 
+        self._consecutive_failures = 0
+        self._failures_lock = threading.Lock()
+
+    def __enter__(self) -> "SupabaseStore":
+        """
+        Context manager support for SupabaseStore.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        Close pooled HTTP connections when leaving context.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the keep-alive HTTP/2 connections held by the PostgREST client.
+
+        All table calls share that one pooled session, so a long run pays
+        the TCP/TLS handshake once; closing releases the sockets
+        deterministically instead of at interpreter exit.
+        """
+        postgrest = getattr(self.client, "postgrest", None)
+        # postgrest's sync client names its close method aclose()
+        close = getattr(postgrest, "aclose", None) or getattr(postgrest, "close", None)
+        if close is not None:
+            close()
+
     def _get_supabase_key_from_env(self) -> Optional[str]:
         """
         Get Supabase key from environment variables.
@@ -230,34 +281,19 @@ class SupabaseStore:
         Returns:
             file_id (UUID string)
         """
-        # Check if file already exists
-        existing = self.client.table("files").select("id").eq("storage_path", storage_path).execute()
-
-        if existing.data:
-            # File exists - update it
-            file_id = existing.data[0]["id"]
-
-            # Delete all existing sections for this file
-            self.client.table("sections").delete().eq("file_id", file_id).execute()
-
-            # Update file metadata
-            self.client.table("files").update({
-                "name": name,
-                "type": doc.file_type.value,
-                "frontmatter": doc.frontmatter if doc.frontmatter else None,
-                "hash": content_hash
-            }).eq("id", file_id).execute()
-        else:
-            # New file - insert it
-            result = self.client.table("files").insert({
-                "name": name,
-                "storage_path": storage_path,
-                "type": doc.file_type.value,
-                "frontmatter": doc.frontmatter if doc.frontmatter else None,
-                "hash": content_hash
-            }).execute()
-
-            file_id = result.data[0]["id"]
+        # Upsert on storage_path so a retried or resumed upload updates the
+        # existing row instead of failing on the unique key
+        result = self.client.table("files").upsert({
+            "name": name,
+            "storage_path": storage_path,
+            "type": doc.file_type.value,
+            "frontmatter": doc.frontmatter if doc.frontmatter else None,
+            "hash": content_hash
+        }, on_conflict="storage_path").execute()
+        file_id = result.data[0]["id"]
+
+        # Replace existing sections (no-op for a new file)
+        self.client.table("sections").delete().eq("file_id", file_id).execute()
 
         # Store sections recursively
         for order_index, section in enumerate(doc.sections):
@@ -273,6 +309,199 @@ class SupabaseStore:
 
         return file_id
 
+    def store_file_with_retry(
+        self, storage_path: str, name: str, doc: ParsedDocument, content_hash: str
+    ) -> str:
+        """
+        store_file() with retries on transient errors and a circuit breaker.
+
+        Args:
+            storage_path: Source path where file is stored
+            name: File name
+            doc: Parsed document
+            content_hash: SHA256 hash of file content
+
+        Returns:
+            file_id (UUID string)
+
+        Raises:
+            CircuitOpen: If too many consecutive writes have failed
+        """
+        return self._call_with_retry(self.store_file, storage_path, name, doc, content_hash)
+
+    def store_files_bulk_with_retry(
+        self,
+        file_metas: List[FileMetadata],
+        sections_per_file: List[List[Section]],
+    ) -> List[str]:
+        """
+        store_files_bulk() with retries on transient errors and a circuit breaker.
+
+        Both store methods replace a file's sections wholesale, so retrying
+        a partially applied call is safe.
+
+        Raises:
+            CircuitOpen: If too many consecutive writes have failed
+        """
+        return self._call_with_retry(self.store_files_bulk, file_metas, sections_per_file)
+
+    def _call_with_retry(self, func, *args):
+        """
+        Call a store method, retrying transient failures with backoff.
+
+        Non-transient errors are raised immediately. Each call that still
+        fails counts towards the circuit breaker; a success resets it.
+
+        Raises:
+            CircuitOpen: If CIRCUIT_BREAKER_THRESHOLD consecutive calls have failed
+        """
+        with self._failures_lock:
+            if self._consecutive_failures >= self.CIRCUIT_BREAKER_THRESHOLD:
+                raise CircuitOpen(
+                    f"{self._consecutive_failures} consecutive Supabase writes failed; giving up"
+                )
+
+        for attempt in range(self.STORE_RETRY_ATTEMPTS):
+            try:
+                result = func(*args)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is not None and attempt < self.STORE_RETRY_ATTEMPTS - 1:
+                    time.sleep(delay)
+                    continue
+                with self._failures_lock:
+                    self._consecutive_failures += 1
+                raise
+            with self._failures_lock:
+                self._consecutive_failures = 0
+            return result
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a failed request.
+
+        Args:
+            error: Exception raised by the store call
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait (the Retry-After header when present, else
+            randomized exponential backoff), or None if the error is not transient
+        """
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        if status is None:
+            # postgrest's APIError carries the HTTP status as its code
+            try:
+                status = int(getattr(error, "code", None))
+            except (TypeError, ValueError):
+                status = None
+
+        is_network_error = httpx is not None and isinstance(error, httpx.TransportError)
+        if not is_network_error and status not in self.TRANSIENT_STATUS_CODES:
+            return None
+
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            ceiling = min(self.STORE_RETRY_MAX_DELAY, self.STORE_RETRY_BASE_DELAY * 2 ** attempt)
+            return random.uniform(0, ceiling)
+
+    def store_files_bulk(
+        self,
+        file_metas: List[FileMetadata],
+        sections_per_file: List[List[Section]],
+    ) -> List[str]:
+        """
+        Store or update many files and their sections in three requests.
+
+        Files are upserted on storage_path in one request, their old sections
+        are deleted in one request, and all new sections are inserted in one
+        request. Section ids are generated client-side so parent_id links can
+        be filled in without waiting for the server to assign ids.
+
+        Args:
+            file_metas: Metadata for each file (path is used as storage_path)
+            sections_per_file: Top-level sections for each file, aligned
+                with file_metas
+
+        Returns:
+            List of file_ids (UUID strings) in the same order as file_metas
+        """
+        if len(file_metas) != len(sections_per_file):
+            raise ValueError("file_metas and sections_per_file must be the same length")
+        if not file_metas:
+            return []
+
+        files_payload = [
+            {
+                "name": Path(meta.path).stem,
+                "storage_path": meta.path,
+                "type": meta.type.value,
+                "frontmatter": meta.frontmatter if meta.frontmatter else None,
+                "hash": meta.hash,
+            }
+            for meta in file_metas
+        ]
+        result = self.client.table("files").upsert(
+            files_payload, on_conflict="storage_path"
+        ).execute()
+        id_by_path = {row["storage_path"]: row["id"] for row in result.data}
+        file_ids = [id_by_path[meta.path] for meta in file_metas]
+
+        # Replace existing sections (no-op for newly inserted files)
+        self.client.table("sections").delete().in_("file_id", file_ids).execute()
+
+        sections_payload: List[Dict[str, Any]] = []
+        for file_id, sections in zip(file_ids, sections_per_file):
+            self._collect_section_rows(file_id, sections, None, sections_payload)
+
+        if sections_payload:
+            self.client.table("sections").insert(
+                sections_payload, returning="minimal"
+            ).execute()
+
+        if os.getenv('ENABLE_EMBEDDINGS', 'false') == 'true':
+            for file_id, sections in zip(file_ids, sections_per_file):
+                try:
+                    self._generate_section_embeddings(file_id, sections)
+                except Exception as e:
+                    print(f"Warning: Failed to generate embeddings: {str(e)}", file=__import__('sys').stderr)
+
+        return file_ids
+
+    @staticmethod
+    def _collect_section_rows(
+        file_id: str,
+        sections: List[Section],
+        parent_id: Optional[str],
+        rows: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Flatten a section tree into insert rows, parents before children.
+
+        Args:
+            file_id: UUID of the parent file
+            sections: Sections at this level
+            parent_id: UUID of parent section (None for top-level)
+            rows: Output list that rows are appended to
+        """
+        for order_index, section in enumerate(sections):
+            section_id = str(uuid.uuid4())
+            rows.append({
+                "id": section_id,
+                "file_id": file_id,
+                "parent_id": parent_id,
+                "level": section.level,
+                "title": section.title,
+                "content": section.content,
+                "order_index": order_index,
+                "line_start": section.line_start,
+                "line_end": section.line_end
+            })
+            SupabaseStore._collect_section_rows(file_id, section.children, section_id, rows)
+
     def _store_section_recursive(
         self, file_id: str, section, parent_id: Optional[str], order_index: int
     ) -> str:
@@ -655,6 +884,51 @@ class SupabaseStore:
         result = self.client.table("files").select("*").execute()
         return result.data
 
+    def get_ingest_checkpoint(self, script: str) -> Optional[Dict]:
+        """
+        Get the saved ingest high-water mark for a script.
+
+        Args:
+            script: Name of the ingest script
+
+        Returns:
+            Dict with last_ingested_id and source_db_mtime, or None if the
+            script has no checkpoint yet
+        """
+        result = self.client.table("ingest_progress").select(
+            "last_ingested_id, source_db_mtime"
+        ).eq("script", script).limit(1).execute()
+        return result.data[0] if result.data else None
+
+    def save_ingest_checkpoint(
+        self, script: str, last_ingested_id: int, source_db_mtime: int
+    ) -> None:
+        """
+        Record that every local file up to last_ingested_id has been uploaded.
+
+        Args:
+            script: Name of the ingest script
+            last_ingested_id: Highest local file id uploaded so far
+            source_db_mtime: mtime_ns of the local database the ids refer to
+        """
+        from datetime import datetime, timezone
+
+        self.client.table("ingest_progress").upsert({
+            "script": script,
+            "last_ingested_id": last_ingested_id,
+            "source_db_mtime": source_db_mtime,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }, on_conflict="script", returning="minimal").execute()
+
+    def clear_ingest_checkpoint(self, script: str) -> None:
+        """
+        Delete a script's checkpoint so the next run starts from the beginning.
+
+        Args:
+            script: Name of the ingest script
+        """
+        self.client.table("ingest_progress").delete().eq("script", script).execute()
+
     def _generate_section_embeddings(self, file_id: str, sections: List[Section]) -> None:
         """
         Generate embeddings for all sections in a file using batch processing.
@@ -8,7 +8,7 @@ can be parsed, stored in the database, and recomposed without data loss.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from core.database import DatabaseStore
 from core.hashing import compute_file_hash
@@ -38,7 +38,12 @@ class Validator:
         self.db = db
         self.recomposer = recomposer
 
-    def validate_round_trip(self, file_path: str) -> ValidationResult:
+    def validate_round_trip(
+        self,
+        file_path: str,
+        original_hash: Optional[str] = None,
+        original_content: Optional[str] = None,
+    ) -> ValidationResult:
         """
         Verify round-trip: original -> DB -> recomposed matches original.
 
@@ -51,8 +56,14 @@ class Validator:
         3. Compute hash of recomposed content
         4. Compare original vs recomposed (primary check)
 
+        Callers that have just read the file (e.g. to store it) can pass
+        its hash and text so the file is not read from disk again.
+
         Args:
             file_path: Path to the file to validate
+            original_hash: SHA256 of the file's bytes, if already computed
+            original_content: The file's text, if already read; only used
+                for diagnostics when the hashes differ
 
         Returns:
             ValidationResult with detailed comparison results.
@@ -63,7 +74,8 @@ class Validator:
         errors = []
 
         # Step 1: Verify original file exists and compute its hash
-        original_hash = compute_file_hash(file_path)
+        if original_hash is None:
+            original_hash = compute_file_hash(file_path)
         if not original_hash:
             errors.append(f"Original file not found: {file_path}")
             result.errors.extend(errors)
@@ -107,7 +119,9 @@ class Validator:
             result.errors.extend(errors)
 
             # Add diagnostic information to help identify the issue
-            self._add_diagnostics(result, file_path, recomposed_content)
+            self._add_diagnostics(
+                result, file_path, recomposed_content, original_content
+            )
 
         return result
 
@@ -126,7 +140,11 @@ class Validator:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
     def _add_diagnostics(
-        self, result: ValidationResult, file_path: str, recomposed_content: str
+        self,
+        result: ValidationResult,
+        file_path: str,
+        recomposed_content: str,
+        original_content: Optional[str] = None,
     ) -> None:
         """
         Add diagnostic information when validation fails.
@@ -141,16 +159,18 @@ class Validator:
             result: ValidationResult to add warnings to
             file_path: Original file path
             recomposed_content: The recomposed content
+            original_content: The original text, if already read
         """
         original_path = Path(file_path)
 
-        if not original_path.exists():
+        if original_content is None and not original_path.exists():
             result.add_warning("Original file no longer exists for comparison")
             return
 
         try:
-            with open(original_path, "r", encoding="utf-8") as f:
-                original_content = f.read()
+            if original_content is None:
+                with open(original_path, "r", encoding="utf-8") as f:
+                    original_content = f.read()
 
             # Calculate character-level differences
             original_lines = original_content.splitlines(keepends=True)
@@ -0,0 +1,13 @@
+-- Create ingest_progress table for resumable Supabase ingests
+-- Purpose: Let scripts/ingest/batch_ingest_supabase.py and
+--          ingest_to_supabase.py record the highest local file id they have
+--          uploaded, so an interrupted run resumes there instead of
+--          re-uploading everything from the first file
+-- Dependencies: none
+
+CREATE TABLE IF NOT EXISTS ingest_progress (
+    script TEXT PRIMARY KEY,
+    last_ingested_id BIGINT NOT NULL DEFAULT 0,
+    source_db_mtime BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
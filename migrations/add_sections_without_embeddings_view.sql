@@ -0,0 +1,11 @@
+-- Create sections_without_embeddings view for embedding migration
+-- Purpose: Let scripts/generate_embeddings.py fetch only sections that still
+--          need an embedding, in one query, instead of fetching every section
+--          and filtering against section_embeddings in a second round-trip
+-- Dependencies: create_embeddings_table.sql (section_embeddings must exist)
+
+CREATE OR REPLACE VIEW sections_without_embeddings AS
+SELECT s.id, s.content, s.content_hash
+FROM sections s
+LEFT JOIN section_embeddings e ON e.section_id = s.id
+WHERE e.section_id IS NULL;
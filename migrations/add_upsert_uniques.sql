@@ -0,0 +1,22 @@
+-- Unique keys that make Supabase ingest writes idempotent
+-- Purpose: SupabaseStore.store_file/store_files_bulk upsert files on
+--          storage_path (Prefer: resolution=merge-duplicates), and a retried
+--          or resumed upload must never leave a second copy of a section.
+--          A section's position (file, parent, sibling order) identifies it;
+--          NULLS NOT DISTINCT makes top-level sections (parent_id NULL)
+--          collide too.
+-- Dependencies: PostgreSQL 15+ (NULLS NOT DISTINCT)
+
+CREATE UNIQUE INDEX IF NOT EXISTS files_storage_path_key
+    ON files (storage_path);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'sections_position_key'
+    ) THEN
+        ALTER TABLE sections
+            ADD CONSTRAINT sections_position_key
+            UNIQUE NULLS NOT DISTINCT (file_id, parent_id, order_index);
+    END IF;
+END $$;
@@ -0,0 +1,105 @@
+-- Store section embeddings as half-precision vectors
+-- Purpose: Halve storage, index memory and transfer size of section_embeddings
+--          (1536 dims x 2 bytes instead of 4). Recall for text-embedding-3-small
+--          is essentially unchanged at fp16 precision.
+-- Dependencies: pgvector >= 0.7.0, create_embeddings_table.sql,
+--               optimize_vector_search.sql
+--
+-- After applying, run scripts/generate_embeddings.py with --halfvec.
+-- RPC signatures are unchanged: callers still pass VECTOR(1536) query
+-- embeddings, which are cast to halfvec inside the functions.
+
+DROP INDEX IF EXISTS section_embeddings_vector_idx;
+
+ALTER TABLE section_embeddings
+ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+CREATE INDEX section_embeddings_vector_idx
+ON section_embeddings
+USING ivfflat (embedding halfvec_cosine_ops)
+WITH (lists = 100);
+
+CREATE OR REPLACE FUNCTION match_sections(
+  query_embedding VECTOR(1536),
+  match_threshold FLOAT8 = 0.7,
+  match_count INT = 10
+)
+RETURNS TABLE (
+  section_id BIGINT,
+  similarity FLOAT8
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  query_half halfvec(1536) := query_embedding::halfvec(1536);
+BEGIN
+  RETURN QUERY
+  SELECT
+    se.section_id,
+    (1 - (se.embedding <=> query_half))::FLOAT8 as similarity
+  FROM section_embeddings se
+  WHERE (1 - (se.embedding <=> query_half)) > match_threshold
+  ORDER BY se.embedding <=> query_half
+  LIMIT match_count;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION hybrid_search(
+  query_embedding VECTOR(1536),
+  query_text TEXT,
+  vector_weight FLOAT8 = 0.7,
+  match_count INT = 10
+)
+RETURNS TABLE (
+  section_id BIGINT,
+  hybrid_score FLOAT8,
+  vector_similarity FLOAT8,
+  text_relevance FLOAT8,
+  title TEXT
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  query_half halfvec(1536) := query_embedding::halfvec(1536);
+BEGIN
+  RETURN QUERY
+  WITH vector_results AS (
+    SELECT
+      se.section_id,
+      (1 - (se.embedding <=> query_half))::FLOAT8 as vector_sim
+    FROM section_embeddings se
+    ORDER BY se.embedding <=> query_half
+    LIMIT match_count * 2
+  ),
+  text_results AS (
+    SELECT
+      s.id,
+      ts_rank(to_tsvector('english', s.content), plainto_tsquery('english', query_text))::FLOAT8 as text_rel
+    FROM sections s
+    WHERE to_tsvector('english', s.content) @@ plainto_tsquery('english', query_text)
+    ORDER BY text_rel DESC
+    LIMIT match_count * 2
+  ),
+  combined AS (
+    SELECT
+      COALESCE(v.section_id, t.id) as section_id,
+      COALESCE(v.vector_sim, 0.0)::FLOAT8 as vector_sim,
+      COALESCE(t.text_rel, 0.0)::FLOAT8 as text_rel,
+      s.title
+    FROM vector_results v
+    FULL OUTER JOIN text_results t ON v.section_id = t.id
+    JOIN sections s ON COALESCE(v.section_id, t.id) = s.id
+  )
+  SELECT
+    section_id,
+    (vector_weight * vector_sim + (1 - vector_weight) * text_rel)::FLOAT8 as hybrid_score,
+    vector_sim,
+    text_rel,
+    title
+  FROM combined
+  ORDER BY hybrid_score DESC
+  LIMIT match_count;
+END;
+$$;
+
+COMMENT ON INDEX section_embeddings_vector_idx IS 'IVFFlat index over half-precision embeddings using cosine distance';
@@ -60,13 +60,15 @@ def verify_sqlite_migration(db_path: str, verbose: bool = False) -> Dict:
             "sections_file_parent": False
         },
         "errors": [],
-        "warnings": []
+        "warnings": [],
+        "all_required_present": False,
+        "no_errors": True
     }
 
     # Check database exists
     if not os.path.exists(db_path):
         results["errors"].append(f"Database not found: {db_path}")
-        return results
+        return _summarize_results(results)
 
     results["database_exists"] = True
 
@@ -173,11 +175,16 @@ def verify_sqlite_migration(db_path: str, verbose: bool = False) -> Dict:
 
     except sqlite3.Error as e:
         results["errors"].append(f"SQLite error: {e}")
-        return results
     except Exception as e:
         results["errors"].append(f"Unexpected error: {e}")
-        return results
 
+    return _summarize_results(results)
+
+
+def _summarize_results(results: Dict) -> Dict:
+    """Compute the overall status flags once so callers don't re-derive them."""
+    results["all_required_present"] = all(results["required_columns"].values())
+    results["no_errors"] = not results["errors"]
     return results
 
 
@@ -232,10 +239,9 @@ def print_verification_results(results: Dict, verbose: bool = False):
             print(f"   - {warning}")
 
     # Overall status
-    all_required_present = all(results["required_columns"].values())
-    no_errors = len(results["errors"]) == 0
+    all_required_present = results["all_required_present"]
 
-    if all_required_present and no_errors:
+    if all_required_present and results["no_errors"]:
         print("\n✅ Migration appears complete and successful!")
     elif all_required_present:
         print("\n⚠️  Migration complete but with warnings")
@@ -305,10 +311,7 @@ def main():
     print_verification_results(results, verbose=args.verbose)
 
     # Exit code based on results
-    all_required_present = all(results["required_columns"].values())
-    no_errors = len(results["errors"]) == 0
-
-    if all_required_present and no_errors:
+    if results["all_required_present"] and results["no_errors"]:
         sys.exit(0)
     else:
         sys.exit(1)
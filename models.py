@@ -61,6 +61,7 @@ class Section:
         parent: Reference to parent section (for tree navigation)
         file_id: Origin file ID (UUID for Supabase, int for SQLite) - optional
         file_type: Origin file type - optional, used for composition
+        id: Database row ID when loaded from SQLite - optional
     """
 
     level: int
@@ -73,6 +74,7 @@ class Section:
     parent: Optional[Section] = field(default=None, repr=False)
     file_id: Optional[str] = None  # UUID for Supabase, int for SQLite (stored as str for consistency)
     file_type: Optional[FileType] = None  # Origin file type, preserves context through composition
+    id: Optional[int] = field(default=None, compare=False)  # Set by DatabaseStore; not part of equality
 
     def add_child(self, child: Section) -> None:
         """Add a child section, setting parent reference."""
@@ -10,17 +10,16 @@ Usage:
 
 import sys
 import argparse
+import string
 from datetime import datetime
 
+# Spaces and underscores become hyphens in skill slugs
+_SLUG_TABLE = str.maketrans({' ': '-', '_': '-'})
 
-def create_skill_template(name, output_path, description=""):
-    """Create a new skill file with template structure."""
-
-    slug = name.lower().replace(" ", "-").replace("_", "-")
-
-    frontmatter = f'''---
-name: {slug}
-description: {description or f"Skill for {name}"}
+# Parsed once at import; filled in by create_skill_template()
+_SKILL_TEMPLATE = string.Template('''---
+name: $slug
+description: $short_description
 
 # INVOCATION CONTROL
 disable-model-invocation: false
@@ -52,16 +51,16 @@ hooks:
           prompt: "Verify all changes align with the skill's purpose."
 ---
 
-# {name}
+# $name
 
-**Purpose**: {description or f"A comprehensive skill for {name}"}
+**Purpose**: $purpose
 
 ## When to Use
 
 Use this skill when:
-- You need to {name.lower()}
-- Working with {name.lower()} related tasks
-- Automating {name.lower()} workflows
+- You need to $name_lower
+- Working with $name_lower related tasks
+- Automating $name_lower workflows
 
 ## What It Does
 
@@ -75,12 +74,12 @@ Use this skill when:
 ## Usage
 
 ```bash
-/{slug}
+/$slug
 ```
 
 With arguments:
 ```bash
-/{slug} argument-value
+/$slug argument-value
 ```
 
 ## Examples
@@ -98,7 +97,7 @@ With arguments:
 Edit the configuration section at the top of this file:
 
 ```yaml
-name: {slug}          # Skill name (lowercase, hyphens)
+name: $slug          # Skill name (lowercase, hyphens)
 description: "..."    # One-line description
 user-invocable: true  # Can users invoke this skill?
 ```
@@ -107,7 +106,7 @@ user-invocable: true  # Can users invoke this skill?
 
 ```python
 def main():
-    """Main entry point for {slug}."""
+    """Main entry point for $slug."""
     # Your implementation here
     pass
 
@@ -127,10 +126,26 @@ Test cases:
 
 - [Related Skill](other-skill.md)
 - [Documentation](../../docs/)
-'''
+''')
+
+
+def create_skill_template(name, output_path, description=""):
+    """Create a new skill file with template structure."""
+
+    slug = name.lower().translate(_SLUG_TABLE)
+
+    frontmatter = _SKILL_TEMPLATE.substitute(
+        name=name,
+        slug=slug,
+        name_lower=name.lower(),
+        short_description=description or f"Skill for {name}",
+        purpose=description or f"A comprehensive skill for {name}",
+    )
 
-    with open(output_path, 'w') as f:
-        f.write(frontmatter)
+    # Encode once and write unbuffered in binary mode (no text codec layer)
+    payload = frontmatter.encode('utf-8')
+    with open(output_path, 'wb', buffering=0) as f:
+        f.write(payload)
 
     print(f"✅ Created skill template: {output_path}")
     print(f"   Name: {name}")
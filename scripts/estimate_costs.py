@@ -12,12 +12,10 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Pricing (as of 2025)
-PRICING = {
-    "text-embedding-3-small": 0.02,  # per 1M tokens
-    "text-embedding-3-large": 0.13,
-    "ada-002": 0.10,
-}
+from core.embedding_service import EmbeddingService
+
+# Pricing per 1M tokens (single source of truth lives on EmbeddingService)
+PRICING = EmbeddingService.PRICING
 
 AVG_SECTION_TOKENS = 150  # Average tokens per section
 
@@ -8,17 +8,20 @@ run once to initialize the vector search system and can be resumed if
 interrupted.
 
 Features:
-- Batch processing (100 sections at a time)
+- Batch processing (100 sections at a time, several batches in flight)
 - Progress tracking and resumable processing
 - Cost estimation and tracking
 - Error handling and failure reporting
-- Cache awareness to skip already-embedded sections
+- Server-side filtering of already-embedded sections
 """
 
 import os
 import sys
 import json
 import time
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -27,24 +30,75 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
+
+try:
+    import openai
+except ModuleNotFoundError:  # pragma: no cover
+    openai = None
+
+# Optional dependencies for --bulk (binary COPY straight into Postgres)
+try:
+    import numpy as np
+    import psycopg
+    from pgvector import HalfVector
+    from pgvector.psycopg import register_vector
+except ModuleNotFoundError:  # pragma: no cover
+    np = None
+    psycopg = None
+    HalfVector = None
+    register_vector = None
+
 from core.supabase_store import SupabaseStore
 from core.embedding_service import EmbeddingService
 from core.database import DatabaseStore
+from scripts.estimate_costs import estimate_embedding_cost
+
+
+class CostLimitExceeded(Exception):
+    """Raised when the projected migration cost exceeds the configured cap."""
+    pass
 
 
 class EmbeddingMigration:
     """Manages batch embedding generation and migration."""
 
-    def __init__(self, supabase_store: SupabaseStore, embedding_service: EmbeddingService):
+    # Batches fetched/embedded/stored concurrently; kept small to stay
+    # well inside OpenAI and PostgREST rate limits.
+    DEFAULT_MAX_WORKERS = 4
+
+    # Attempts per embedding request when the API returns 429
+    MAX_RATE_LIMIT_RETRIES = 6
+
+    # In --bulk mode, commit the COPY transaction every N batches
+    BULK_COMMIT_EVERY = 10
+
+    def __init__(
+        self,
+        supabase_store: SupabaseStore,
+        embedding_service: EmbeddingService,
+        bulk_conn: Optional[Any] = None,
+        halfvec: bool = False
+    ):
         """
         Initialize migration manager.
 
         Args:
             supabase_store: SupabaseStore instance for database access
             embedding_service: EmbeddingService for generating embeddings
+            bulk_conn: Optional psycopg connection (see open_bulk_connection).
+                When given, embeddings are written with binary COPY instead
+                of PostgREST upserts - much faster for a first, cold load.
+            halfvec: Set when section_embeddings.embedding is halfvec(1536)
+                (migrations/quantize_embeddings_halfvec.sql). Vectors are then
+                sent at half precision, roughly halving bytes per row.
         """
         self.supabase_store = supabase_store
         self.embedding_service = embedding_service
+        self.bulk_conn = bulk_conn
+        self.halfvec = halfvec
+        self._bulk_lock = threading.Lock()
+        self._bulk_batches_uncommitted = 0
+        self._bulk_rows_uncommitted = 0
         self.stats = {
             "total_sections": 0,
             "already_embedded": 0,
@@ -55,6 +109,13 @@ class EmbeddingMigration:
             "end_time": None,
             "estimated_cost_usd": 0.0,
         }
+        # Guards self.stats, which worker threads update concurrently
+        self._stats_lock = threading.Lock()
+
+    def _add_stat(self, key: str, amount: int) -> None:
+        """Thread-safely increment a numeric counter in self.stats."""
+        with self._stats_lock:
+            self.stats[key] += amount
 
     def count_uneeded_embeddings(self) -> int:
         """
@@ -64,7 +125,7 @@ class EmbeddingMigration:
             Number of sections without embeddings
         """
         try:
-            result = self.supabase_store.client.table('sections').select(
+            result = self.supabase_store.client.table('sections_without_embeddings').select(
                 'id',
                 count='exact'
             ).execute()
@@ -76,21 +137,46 @@ class EmbeddingMigration:
             print(f"Error counting sections: {e}")
             return 0
 
-    def get_uneeded_sections(self, batch_size: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    def count_existing_embeddings(self) -> int:
+        """
+        Count sections that already have embeddings.
+
+        Returns:
+            Number of rows in section_embeddings
+        """
+        try:
+            result = self.supabase_store.client.table('section_embeddings').select(
+                'section_id',
+                count='exact'
+            ).limit(1).execute()
+
+            return result.count or 0
+
+        except Exception as e:
+            print(f"Error counting existing embeddings: {e}")
+            return 0
+
+    def get_uneeded_sections(self, batch_size: int = 100, after_id: int = 0) -> List[Dict[str, Any]]:
         """
         Get sections that need embeddings in batches.
 
+        Reads from the sections_without_embeddings view, so already-embedded
+        sections are filtered out server-side (see
+        migrations/add_sections_without_embeddings_view.sql). Pages are
+        fetched by id (keyset pagination) rather than OFFSET, so each page
+        is an index range scan regardless of how far into the table it is.
+
         Args:
             batch_size: Number of sections per batch
-            offset: Starting offset for pagination
+            after_id: Only return sections with an id greater than this
 
         Returns:
             List of section dictionaries with id, content, content_hash
         """
         try:
-            result = self.supabase_store.client.table('sections').select(
+            result = self.supabase_store.client.table('sections_without_embeddings').select(
                 'id, content, content_hash'
-            ).range(offset, offset + batch_size - 1).execute()
+            ).gt('id', after_id).order('id').limit(batch_size).execute()
 
             return result.data or []
 
@@ -98,66 +184,201 @@ class EmbeddingMigration:
             print(f"Error fetching sections: {e}")
             return []
 
-    def check_existing_embeddings(self, section_ids: List[int]) -> Dict[int, bool]:
+    @staticmethod
+    def _rate_limit_delay(error: Exception, attempt: int) -> Optional[float]:
         """
-        Check which sections already have embeddings.
+        Work out how long to wait before retrying a rate-limited request.
 
         Args:
-            section_ids: List of section IDs to check
+            error: Exception raised by the embedding call
+            attempt: Zero-based attempt number
 
         Returns:
-            Dictionary mapping section_id to has_embedding (bool)
+            Seconds to wait (the Retry-After header when present, else
+            exponential backoff), or None if the error is not a rate limit
         """
+        cause = error.__cause__ or error
+        error_str = str(error).lower()
+        is_rate_limit = (
+            (openai is not None and isinstance(cause, openai.RateLimitError))
+            or 'rate_limit' in error_str or '429' in error_str
+        )
+        if not is_rate_limit:
+            return None
+
+        headers = getattr(getattr(cause, 'response', None), 'headers', None) or {}
+        retry_after = headers.get('retry-after')
         try:
-            result = self.supabase_store.client.table('section_embeddings').select(
-                'section_id'
-            ).in_('section_id', section_ids).execute()
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return float(2 ** attempt)
+
+    def _call_with_backoff(self, func, *args):
+        """
+        Call an embedding function, backing off and retrying on rate limits.
+
+        Other errors are raised immediately.
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES):
+            try:
+                return func(*args)
+            except Exception as e:
+                delay = self._rate_limit_delay(e, attempt)
+                if delay is None or attempt == self.MAX_RATE_LIMIT_RETRIES - 1:
+                    raise
+                print(f"⏳ Rate limited, retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def get_cached_embeddings(self, content_hashes: List[str]) -> Dict[str, Any]:
+        """
+        Look up stored embeddings for sections with the given content hashes.
 
-            embedded_ids = {row['section_id'] for row in (result.data or [])}
-            return {sid: sid in embedded_ids for sid in section_ids}
+        Sections with identical content share a content_hash, so an
+        embedding stored for one of them can be reused for all the others.
+
+        Args:
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Dictionary mapping content_hash to embedding
+        """
+        if not content_hashes:
+            return {}
+
+        try:
+            result = self.supabase_store.client.table('sections').select(
+                'content_hash, section_embeddings!inner(embedding)'
+            ).in_('content_hash', content_hashes).eq(
+                'section_embeddings.model_name', self.embedding_service.model
+            ).execute()
+
+            cached = {}
+            for row in result.data or []:
+                for stored in row.get('section_embeddings') or []:
+                    cached.setdefault(row['content_hash'], stored['embedding'])
+            return cached
 
         except Exception as e:
-            print(f"Error checking existing embeddings: {e}")
-            return {sid: False for sid in section_ids}
+            print(f"Warning: Could not look up cached embeddings: {e}")
+            return {}
 
     def generate_batch_embeddings(self, sections: List[Dict[str, Any]]) -> List[tuple]:
         """
         Generate embeddings for a batch of sections.
 
+        Sections are grouped by content_hash so identical content is only
+        embedded once, and hashes that already have a stored embedding are
+        reused without calling the API. The remaining unique contents are
+        sent to the embeddings API together (token-aware batches via
+        EmbeddingService.batch_generate). If a batched call fails, they are
+        retried one by one so that failures are still reported per section.
+
         Args:
             sections: List of section dictionaries
 
         Returns:
             List of (section_id, embedding) tuples
         """
-        embeddings = []
+        hash_to_sections: Dict[str, List[int]] = defaultdict(list)
+        hash_to_content: Dict[str, str] = {}
+        stored_hashes = set()
 
         for section in sections:
-            try:
-                section_id = section['id']
-                content = section.get('content', '')
+            section_id = section['id']
+            content = section.get('content', '')
+
+            # Skip empty content
+            if not content or not content.strip():
+                print(f"⊘ Skipping section {section_id}: empty content")
+                continue
+
+            # Sections without a stored hash are keyed (and deduplicated) by content
+            content_hash = section.get('content_hash')
+            if content_hash:
+                stored_hashes.add(content_hash)
+            else:
+                content_hash = content
+            hash_to_sections[content_hash].append(section_id)
+            hash_to_content.setdefault(content_hash, content)
+
+        if not hash_to_content:
+            return []
 
-                # Skip empty content
-                if not content or not content.strip():
-                    print(f"⊘ Skipping section {section_id}: empty content")
-                    continue
+        embeddings = []
 
-                # Generate embedding
-                embedding = self.embedding_service.generate_embedding(content)
+        # Reuse embeddings already stored for identical content
+        cached = self.get_cached_embeddings(list(stored_hashes))
+        for content_hash, embedding in cached.items():
+            for section_id in hash_to_sections[content_hash]:
                 embeddings.append((section_id, embedding))
+                print(f"✓ Reused cached embedding for section {section_id}")
+
+        hashes = [h for h in hash_to_content if h not in cached]
+        if not hashes:
+            return embeddings
 
-                # Estimate tokens (roughly 1 token per 4 characters)
-                tokens = len(content) // 4
-                self.stats["total_tokens_used"] += tokens
+        contents = [hash_to_content[h] for h in hashes]
 
+        try:
+            vectors = self._call_with_backoff(self.embedding_service.batch_generate, contents)
+        except Exception as e:
+            print(f"⚠ Batch embedding failed ({e}), retrying sections individually")
+            return embeddings + self._generate_embeddings_individually(
+                hashes, hash_to_content, hash_to_sections
+            )
+
+        for content_hash, content, embedding in zip(hashes, contents, vectors):
+            tokens = self.embedding_service.count_tokens(content)
+            self._add_stat("total_tokens_used", tokens)
+
+            for section_id in hash_to_sections[content_hash]:
+                embeddings.append((section_id, embedding))
                 print(f"✓ Embedded section {section_id} ({tokens} tokens)")
 
+        return embeddings
+
+    def _generate_embeddings_individually(
+        self,
+        hashes: List[str],
+        hash_to_content: Dict[str, str],
+        hash_to_sections: Dict[str, List[int]]
+    ) -> List[tuple]:
+        """
+        Embed unique contents one request at a time, recording each failure.
+
+        Args:
+            hashes: Content hashes to embed
+            hash_to_content: Content for each hash
+            hash_to_sections: Section IDs sharing each hash
+
+        Returns:
+            List of (section_id, embedding) tuples for the sections that succeeded
+        """
+        embeddings = []
+
+        for content_hash in hashes:
+            content = hash_to_content[content_hash]
+            section_ids = hash_to_sections[content_hash]
+            try:
+                embedding = self._call_with_backoff(
+                    self.embedding_service.generate_embedding, content
+                )
+
+                tokens = self.embedding_service.count_tokens(content)
+                self._add_stat("total_tokens_used", tokens)
+
+                for section_id in section_ids:
+                    embeddings.append((section_id, embedding))
+                    print(f"✓ Embedded section {section_id} ({tokens} tokens)")
+
             except Exception as e:
-                print(f"✗ Failed to embed section {section['id']}: {e}")
-                self.stats["failed_sections"].append({
-                    "section_id": section['id'],
-                    "error": str(e)
-                })
+                for section_id in section_ids:
+                    print(f"✗ Failed to embed section {section_id}: {e}")
+                    with self._stats_lock:
+                        self.stats["failed_sections"].append({
+                            "section_id": section_id,
+                            "error": str(e)
+                        })
 
         return embeddings
 
@@ -165,43 +386,166 @@ class EmbeddingMigration:
         """
         Store batch of embeddings to Supabase.
 
+        All rows are sent in a single upsert request. Sections that already
+        have an embedding are filtered out by the sections_without_embeddings
+        view, and any that slip through are resolved server-side by the
+        (section_id, model_name) unique constraint.
+
         Args:
             embeddings: List of (section_id, embedding) tuples
 
         Returns:
             Number of successfully stored embeddings
         """
-        stored_count = 0
+        if not embeddings:
+            return 0
 
-        for section_id, embedding in embeddings:
-            try:
-                result = self.supabase_store.client.table('section_embeddings').insert({
-                    'section_id': section_id,
-                    'embedding': embedding,
-                    'model_name': self.embedding_service.model,
-                }).execute()
+        if self.bulk_conn is not None:
+            return self._copy_embeddings_batch(embeddings)
+
+        rows = [
+            {
+                'section_id': section_id,
+                'embedding': self._halfvec_literal(embedding) if self.halfvec else embedding,
+                'model_name': self.embedding_service.model,
+            }
+            for section_id, embedding in embeddings
+        ]
+
+        try:
+            # returning='minimal' avoids shipping the vectors back in the response
+            self.supabase_store.client.table('section_embeddings').upsert(
+                rows,
+                on_conflict="section_id,model_name",
+                returning='minimal'
+            ).execute()
+        except Exception as e:
+            print(f"Error storing batch of {len(rows)} embeddings: {e}")
+            return 0
 
-                stored_count += 1
-                self.stats["newly_embedded"] += 1
+        self._add_stat("newly_embedded", len(rows))
+        return len(rows)
 
-            except Exception as e:
-                # If embedding already exists, count as existing
-                if "unique" in str(e).lower() or "duplicate" in str(e).lower():
-                    self.stats["already_embedded"] += 1
-                else:
-                    print(f"Error storing embedding for section {section_id}: {e}")
+    @staticmethod
+    def _halfvec_literal(embedding: Any) -> Any:
+        """
+        Format an embedding as a compact pgvector text literal.
 
-        return stored_count
+        Five significant digits are enough to round-trip every fp16 value,
+        so nothing a halfvec column can store is lost, while each element
+        shrinks from ~20 JSON characters to ~8.
+        """
+        if isinstance(embedding, str):
+            # Reused from PostgREST; already a literal
+            return embedding
+        return '[' + ','.join(f'{x:.5g}' for x in embedding) + ']'
+
+    def _copy_embeddings_batch(self, embeddings: List[tuple]) -> int:
+        """
+        Write a batch of embeddings with binary COPY over bulk_conn.
+
+        Binary COPY skips JSON serialization of the vectors and per-row
+        planning. Only suitable when none of the sections are embedded yet,
+        since COPY does not resolve unique-constraint conflicts.
+
+        Args:
+            embeddings: List of (section_id, embedding) tuples
+
+        Returns:
+            Number of stored embeddings
+        """
+        model = self.embedding_service.model
+
+        with self._bulk_lock:
+            try:
+                with self.bulk_conn.cursor() as cur:
+                    with cur.copy(
+                        "COPY section_embeddings (section_id, embedding, model_name) "
+                        "FROM STDIN WITH (FORMAT BINARY)"
+                    ) as copy:
+                        vector_type = 'halfvec' if self.halfvec else 'vector'
+                        copy.set_types(['integer', vector_type, 'text'])
+                        for section_id, embedding in embeddings:
+                            # Embeddings reused from PostgREST come back as text
+                            if isinstance(embedding, str):
+                                embedding = json.loads(embedding)
+                            if self.halfvec:
+                                value = HalfVector(np.asarray(embedding, dtype=np.float16))
+                            else:
+                                value = np.asarray(embedding, dtype=np.float32)
+                            copy.write_row((section_id, value, model))
+
+                # Counted only once the COPY succeeded, so the rollback below
+                # never takes back rows that were not added to the stats
+                self._add_stat("newly_embedded", len(embeddings))
+                self._bulk_batches_uncommitted += 1
+                self._bulk_rows_uncommitted += len(embeddings)
+                if self._bulk_batches_uncommitted >= self.BULK_COMMIT_EVERY:
+                    self.bulk_conn.commit()
+                    self._bulk_batches_uncommitted = 0
+                    self._bulk_rows_uncommitted = 0
+
+            except Exception as e:
+                # Rolling back discards every uncommitted batch; those sections
+                # stay in sections_without_embeddings for a rerun
+                lost = self._bulk_rows_uncommitted
+                print(f"Error copying batch of {len(embeddings)} embeddings: {e}")
+                if lost:
+                    print(f"  (rolled back {lost} uncommitted embeddings)")
+                self.bulk_conn.rollback()
+                self._add_stat("newly_embedded", -lost)
+                self._bulk_batches_uncommitted = 0
+                self._bulk_rows_uncommitted = 0
+                return 0
+
+        return len(embeddings)
 
     def calculate_cost(self) -> float:
         """
         Calculate estimated cost based on tokens used.
 
-        OpenAI text-embedding-3-small pricing: $0.02 per 1M tokens
+        Uses the per-model pricing table on EmbeddingService.
         """
-        cost = (self.stats["total_tokens_used"] / 1_000_000) * 0.02
+        price_per_m = self.embedding_service.PRICING[self.embedding_service.model]
+        cost = (self.stats["total_tokens_used"] / 1_000_000) * price_per_m
         return cost
 
+    def check_projected_cost(
+        self,
+        total: int,
+        max_cost_usd: Optional[float] = None,
+        assume_yes: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Project the cost of embedding ``total`` sections and enforce a cap.
+
+        Args:
+            total: Number of sections to embed
+            max_cost_usd: Abort if the projected cost is above this (None = no cap)
+            assume_yes: Proceed without asking when the cap is exceeded
+
+        Returns:
+            Cost estimate from estimate_embedding_cost()
+
+        Raises:
+            ValueError: If the model has no known pricing
+            CostLimitExceeded: If over the cap and not confirmed
+        """
+        projected = estimate_embedding_cost(total, self.embedding_service.model)
+        print(f"💰 Projected cost: ${projected['cost_one_time']:.4f} "
+              f"(~{projected['total_tokens']:,} tokens)")
+
+        if max_cost_usd is None or projected['cost_one_time'] <= max_cost_usd or assume_yes:
+            return projected
+
+        message = (f"Projected cost ${projected['cost_one_time']:.4f} exceeds "
+                   f"--max-cost-usd ${max_cost_usd:.4f}")
+        if sys.stdin.isatty():
+            answer = input(f"⚠ {message}. Continue? [y/N] ")
+            if answer.strip().lower() in ('y', 'yes'):
+                return projected
+        raise CostLimitExceeded(message)
+
     def update_metadata(self) -> None:
         """Update embedding metadata in database."""
         try:
@@ -219,12 +563,48 @@ class EmbeddingMigration:
         except Exception as e:
             print(f"Warning: Could not update metadata: {e}")
 
-    def run(self, resume_from: int = 0) -> Dict[str, Any]:
+    def process_batch(self, sections: List[Dict[str, Any]]) -> int:
+        """
+        Embed and store a single batch of sections.
+
+        Args:
+            sections: Section dictionaries fetched by get_uneeded_sections
+
+        Returns:
+            Number of sections in this batch
+        """
+        first_id, last_id = sections[0]['id'], sections[-1]['id']
+        print(f"\n📦 Processing batch: sections {first_id}-{last_id}")
+
+        # Generate embeddings
+        embeddings = self.generate_batch_embeddings(sections)
+
+        # Store embeddings
+        stored = self.store_embeddings_batch(embeddings)
+        print(f"💾 Stored {stored} embeddings in batch {first_id}-{last_id}")
+
+        return len(sections)
+
+    def run(
+        self,
+        resume_from: int = 0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_cost_usd: Optional[float] = None,
+        assume_yes: bool = False
+    ) -> Dict[str, Any]:
         """
         Execute the embedding migration.
 
+        Pages are fetched sequentially (each page starts after the last id
+        of the previous one) while up to ``max_workers`` batches are being
+        embedded and stored concurrently.
+
         Args:
-            resume_from: Section offset to resume from (for resuming interrupted runs)
+            resume_from: Section id to resume after (for resuming interrupted runs)
+            max_workers: Maximum number of batches processed concurrently
+            max_cost_usd: Abort before embedding anything if the projected
+                cost exceeds this
+            assume_yes: Proceed even if the projected cost exceeds max_cost_usd
 
         Returns:
             Dictionary with migration statistics
@@ -239,44 +619,37 @@ class EmbeddingMigration:
             # Get total count
             total = self.count_uneeded_embeddings()
             self.stats["total_sections"] = total
+            self.stats["already_embedded"] = self.count_existing_embeddings()
             print(f"📊 Total sections to process: {total}")
-            print(f"📊 Starting from offset: {resume_from}\n")
+            self.check_projected_cost(total, max_cost_usd, assume_yes)
+            print(f"📊 Starting after section id: {resume_from}\n")
 
             batch_size = 100
             processed = 0
-            offset = resume_from
-
-            while offset < total:
-                print(f"\n📦 Processing batch: {offset}-{min(offset + batch_size, total)} / {total}")
+            last_id = resume_from
+            in_flight = set()
 
-                # Fetch sections
-                sections = self.get_uneeded_sections(batch_size, offset)
-                if not sections:
-                    break
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while True:
+                    sections = self.get_uneeded_sections(batch_size, after_id=last_id)
+                    if not sections:
+                        break
+                    last_id = sections[-1]['id']
 
-                section_ids = [s['id'] for s in sections]
+                    # Bound the number of fetched-but-unprocessed batches
+                    if len(in_flight) >= max_workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            processed += future.result()
+                        print(f"📊 Progress: {processed} / {total}")
 
-                # Check which ones already have embeddings
-                existing = self.check_existing_embeddings(section_ids)
-                sections_to_embed = [s for s in sections if not existing.get(s['id'], False)]
+                    in_flight.add(executor.submit(self.process_batch, sections))
 
-                self.stats["already_embedded"] += len(section_ids) - len(sections_to_embed)
+                for future in as_completed(in_flight):
+                    processed += future.result()
 
-                if sections_to_embed:
-                    # Generate embeddings
-                    embeddings = self.generate_batch_embeddings(sections_to_embed)
-
-                    # Store embeddings
-                    stored = self.store_embeddings_batch(embeddings)
-                    print(f"💾 Stored {stored} embeddings in this batch")
-                else:
-                    print(f"⊘ All {len(section_ids)} sections in this batch already embedded")
-
-                processed += len(sections)
-                offset += batch_size
-
-                # Small delay to avoid rate limiting
-                time.sleep(1)
+            if self.bulk_conn is not None:
+                self.bulk_conn.commit()
 
             # Calculate cost and update stats
             self.stats["estimated_cost_usd"] = self.calculate_cost()
@@ -325,8 +698,58 @@ class EmbeddingMigration:
         return "N/A"
 
 
+def open_bulk_connection(database_url: str) -> Any:
+    """
+    Open a direct Postgres connection for --bulk binary COPY loads.
+
+    Args:
+        database_url: Postgres connection string (DATABASE_URL)
+
+    Returns:
+        psycopg connection with pgvector types registered
+
+    Raises:
+        ImportError: If psycopg, pgvector or numpy are not installed
+    """
+    if psycopg is None:
+        raise ImportError(
+            "--bulk requires 'psycopg', 'pgvector' and 'numpy'. "
+            "Install them with: pip install 'psycopg[binary]' pgvector numpy"
+        )
+    conn = psycopg.connect(database_url)
+    register_vector(conn)
+    return conn
+
+
 def main():
     """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Generate embeddings for all sections in Supabase"
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Write embeddings with binary COPY over DATABASE_URL (first load into an empty table)"
+    )
+    parser.add_argument(
+        "--halfvec",
+        action="store_true",
+        help="Send half-precision vectors (after applying migrations/quantize_embeddings_halfvec.sql)"
+    )
+    parser.add_argument(
+        "--max-cost-usd",
+        type=float,
+        help="Abort if the projected embedding cost exceeds this amount"
+    )
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Do not stop when the projected cost exceeds --max-cost-usd"
+    )
+    args = parser.parse_args()
+
     load_dotenv()
 
     # Check required environment variables
@@ -344,19 +767,39 @@ def main():
             print("  - OPENAI_API_KEY")
         sys.exit(1)
 
+    bulk_conn = None
+    if args.bulk:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            print("Error: --bulk requires the DATABASE_URL environment variable")
+            sys.exit(1)
+        try:
+            bulk_conn = open_bulk_connection(database_url)
+        except ImportError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
     # Initialize services
     supabase_store = SupabaseStore(supabase_url, supabase_key)
     embedding_service = EmbeddingService(openai_key)
 
     # Run migration
-    migration = EmbeddingMigration(supabase_store, embedding_service)
+    migration = EmbeddingMigration(
+        supabase_store, embedding_service, bulk_conn=bulk_conn, halfvec=args.halfvec
+    )
 
     try:
-        stats = migration.run()
+        stats = migration.run(max_cost_usd=args.max_cost_usd, assume_yes=args.yes)
         sys.exit(0)
+    except CostLimitExceeded as e:
+        print(f"Aborted: {e}")
+        sys.exit(2)
     except Exception as e:
         print(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        if bulk_conn is not None:
+            bulk_conn.close()
 
 
 if __name__ == "__main__":
@@ -2,29 +2,143 @@
 """
 Batch ingest all Claude Code files from local database to Supabase.
 Reads files from SQLite and uploads to Supabase with progress tracking.
+
+Each batch is uploaded with one bulk request per table, and batches run
+concurrently on a thread pool so the blocking HTTP round-trips overlap
+instead of leaving the connection idle between requests. With
+--use-postgres, batches are written with COPY over DATABASE_URL instead.
 """
-import sqlite3
+import argparse
 import os
 import sys
-from pathlib import Path
-from core.database import DatabaseStore
-from core.supabase_store import SupabaseStore
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from core.database import DatabaseStore, open_tuned
+from core.supabase_store import CircuitOpen, SupabaseStore
+from core.supabase_pg_store import SupabasePgStore
+from ingest_checkpoint import IngestCheckpoint
+from ingest_tuning import load_batch_size, probe_batch_sizes, save_batch_size
+try:
+    from tqdm import tqdm
+except ModuleNotFoundError:  # pragma: no cover - falls back to plain progress lines
+    tqdm = None
+try:
+    from itertools import batched
+except ImportError:  # pragma: no cover - Python < 3.12
+    def batched(iterable, n):
+        """Yield successive n-sized tuples from iterable"""
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
 
 DB_PATH = os.path.expanduser("~/.claude/databases/skill-split.db")
-BATCH_SIZE = 50
+# Batches uploaded concurrently; gains flatten out past ~8-16 workers
+DEFAULT_CONCURRENCY = 16
+SCRIPT_NAME = "batch_ingest_supabase"
+FAILED_ITEMS_KEPT = 100
 
-def get_claude_files():
-    """Get all files from database where path LIKE '%/.claude/%'"""
-    conn = sqlite3.connect(DB_PATH)
+def get_claude_files(after_id=0):
+    """Get files from database where path LIKE '%/.claude/%' and id > after_id"""
+    conn = open_tuned(DB_PATH)
     cursor = conn.cursor()
     cursor.execute(
-        "SELECT id, path, type FROM files WHERE path LIKE '%/.claude/%' ORDER BY id"
+        "SELECT id, path, type FROM files WHERE path LIKE '%/.claude/%' AND id > ? ORDER BY id",
+        (after_id,)
     )
     rows = cursor.fetchall()
     conn.close()
     return rows
 
+def upload_batch(local_db, store_bulk, batch):
+    """
+    Copy one batch of files and their sections to Supabase in bulk.
+
+    All files in the batch go up in a single store_bulk() call, so a
+    failure there marks every file in the batch as failed.
+
+    Args:
+        local_db: Local DatabaseStore
+        store_bulk: SupabaseStore.store_files_bulk_with_retry or
+            SupabasePgStore.store_files_bulk
+        batch: (file_id, path, type) rows
+
+    Returns:
+        Tuple of (successful_count, failed_items)
+    """
+    file_metas = []
+    sections_per_file = []
+    pending = []
+    failed_items = []
+    ids, paths, _types = zip(*batch)
+
+    try:
+        # Two SQLite queries for the whole batch instead of two per file
+        local_files = local_db.get_files_bulk(ids)
+    except Exception as e:
+        error = str(e)[:80]
+        return 0, [(file_id, path, error) for file_id, path in zip(ids, paths)]
+
+    for file_id, path in zip(ids, paths):
+        result = local_files.get(file_id)
+        if result is None:
+            failed_items.append((file_id, path, "Not found in local db"))
+            continue
+        file_meta, sections = result
+        file_metas.append(file_meta)
+        sections_per_file.append(sections)
+        pending.append((file_id, path))
+
+    if not pending:
+        return 0, failed_items
+
+    try:
+        store_bulk(file_metas, sections_per_file)
+    except CircuitOpen:
+        raise
+    except Exception as e:
+        error = str(e)[:80]
+        failed_items.extend((file_id, path, error) for file_id, path in pending)
+        return 0, failed_items
+
+    return len(pending), failed_items
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Batch ingest Claude Code files from the local database to Supabase"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Files per bulk upload (default: last --probe result, else 50)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Batches uploaded concurrently (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--probe",
+        action="store_true",
+        help="Time a sweep of batch sizes on the first 500 files, save the best, and exit"
+    )
+    parser.add_argument(
+        "--use-postgres",
+        action="store_true",
+        help="Write with COPY over a direct Postgres connection (DATABASE_URL) instead of the REST API"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the saved checkpoint and ingest from the first file"
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     # Check for Supabase credentials
     supabase_url = os.getenv("SUPABASE_URL")
     supabase_key = os.getenv("SUPABASE_KEY")
@@ -39,48 +153,94 @@ def main():
         print("  SUPABASE_KEY=eyJxxx...")
         return
     
-    files = get_claude_files()
+    # Initialize stores
+    local_db = DatabaseStore(DB_PATH)
+    supabase = SupabaseStore(supabase_url, supabase_key)
+    
+    # Checkpoints always go through the REST client; only file/section
+    # writes switch to COPY
+    if args.use_postgres:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            print("ERROR: --use-postgres needs DATABASE_URL (Supabase's direct Postgres connection string)")
+            return
+        store_bulk = SupabasePgStore(database_url).store_files_bulk
+    else:
+        store_bulk = supabase.store_files_bulk_with_retry
+    
+    if args.probe:
+        files = get_claude_files()
+        best = probe_batch_sizes(files, lambda batch: upload_batch(local_db, store_bulk, batch))
+        if best is not None:
+            save_batch_size(best)
+        return
+    
+    checkpoint = IngestCheckpoint(supabase, SCRIPT_NAME, DB_PATH)
+    files = get_claude_files(checkpoint.resume_id(args.restart))
     total = len(files)
     
+    if not files:
+        print("Nothing to ingest: all files are already uploaded")
+        return
+    
+    batch_size = args.batch_size or load_batch_size()
+    
     print(f"Starting batch ingestion to Supabase")
     print(f"Files to ingest: {total}")
-    print(f"Batch size: {BATCH_SIZE}\n")
-    
-    # Initialize stores
-    local_db = DatabaseStore(DB_PATH)
-    supabase = SupabaseStore(supabase_url, supabase_key)
+    print(f"Batch size: {batch_size}, concurrent batches: {args.concurrency}\n")
     
     attempted = 0
     successful = 0
     failed = 0
-    failed_items = []
+    # Only the most recent failures are kept for the report; `failed` has the total
+    failed_items = deque(maxlen=FAILED_ITEMS_KEPT)
+    
+    # Live bar with rate/ETA on a terminal; plain per-batch lines in logs
+    pbar = None
+    if tqdm is not None and sys.stdout.isatty():
+        pbar = tqdm(total=total, unit='file', smoothing=0.1)
     
-    for batch_start in range(0, total, BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, total)
-        batch = files[batch_start:batch_end]
-        
-        for file_id, path, file_type in batch:
-            attempted += 1
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        batches = list(batched(files, batch_size))
+        futures = [
+            executor.submit(upload_batch, local_db, store_bulk, batch)
+            for batch in batches
+        ]
+
+        batch_end = 0
+        for batch, future in zip(batches, futures):
             try:
-                # Get file data from local database
-                file_meta, sections = local_db.get_file(str(file_id))
-                
-                if file_meta is None:
-                    failed += 1
-                    failed_items.append((file_id, path, "Not found in local db"))
-                    continue
-                
-                # Upload to Supabase
-                supabase.store_file(file_meta, sections)
-                successful += 1
-                
-            except Exception as e:
-                failed += 1
-                failed_items.append((file_id, path, str(e)[:80]))
-        
-        # Progress report every batch
-        pct = (batch_end / total) * 100
-        print(f"Progress: {batch_end}/{total} ({pct:.1f}%) - Successful: {successful}, Failed: {failed}")
+                batch_ok, batch_failed = future.result()
+            except CircuitOpen as e:
+                # Supabase is down or throttling hard; stop instead of hammering it
+                for pending in futures:
+                    pending.cancel()
+                checkpoint.stop()
+                print(f"\n❌ {e}; stopping early. Rerun to resume from the last checkpoint.")
+                break
+            batch_end += len(batch)
+            attempted += len(batch)
+            successful += batch_ok
+            failed += len(batch_failed)
+            failed_items.extend(batch_failed)
+
+            # Batches finish in order here, so the checkpoint only ever
+            # covers a fully uploaded prefix; a failure freezes it
+            if batch_failed:
+                checkpoint.stop()
+            else:
+                checkpoint.advance(batch[-1][0])
+
+            # Progress report every batch
+            if pbar is not None:
+                pbar.update(len(batch))
+                pbar.set_postfix(ok=successful, fail=failed)
+            else:
+                pct = (batch_end / total) * 100
+                print(f"Progress: {batch_end}/{total} ({pct:.1f}%) - Successful: {successful}, Failed: {failed}")
+    
+    if pbar is not None:
+        pbar.close()
     
     # Final summary
     print("\n" + "="*60)
@@ -89,18 +249,18 @@ def main():
     print(f"Total Attempted: {attempted}")
     print(f"Successful:     {successful}")
     print(f"Failed:         {failed}")
-    print(f"Success Rate:   {(successful/attempted*100):.1f}%")
+    if attempted:
+        print(f"Success Rate:   {(successful/attempted*100):.1f}%")
     
-    if failed_items and len(failed_items) <= 20:
-        print(f"\nFailed Items ({len(failed_items)}):")
+    if failed_items:
+        if failed > len(failed_items):
+            print(f"\nFailed Items: {failed} (showing last {len(failed_items)})")
+        else:
+            print(f"\nFailed Items ({failed}):")
         for fid, path, error in failed_items:
             print(f"  ID {fid}: {path[:60]}")
             if error:
                 print(f"    Error: {error}")
-    elif failed_items:
-        print(f"\nFailed Items: {len(failed_items)} (showing first 20)")
-        for fid, path, error in failed_items[:20]:
-            print(f"  ID {fid}: {path[:60]}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Resumable progress for the Supabase ingest scripts.
+
+The highest local file id that has been fully uploaded is kept in the
+Supabase ingest_progress table (migrations/add_ingest_progress.sql), keyed
+by script name. It is only trusted while the local database is unchanged:
+if its mtime differs from the one recorded, ids may have been reassigned,
+so the run starts over.
+"""
+import os
+
+
+class IngestCheckpoint:
+    """High-water mark of uploaded local file ids for one ingest script."""
+
+    def __init__(self, supabase, script, db_path):
+        self.supabase = supabase
+        self.script = script
+        self.source_db_mtime = os.stat(db_path).st_mtime_ns
+        self.enabled = True
+
+    def resume_id(self, restart=False):
+        """
+        Return the local file id to resume after (0 to start from the top).
+
+        Args:
+            restart: Delete any saved checkpoint and start from the top
+        """
+        try:
+            if restart:
+                self.supabase.clear_ingest_checkpoint(self.script)
+                return 0
+            checkpoint = self.supabase.get_ingest_checkpoint(self.script)
+        except Exception as e:
+            print(f"⚠️  Checkpoint unavailable, progress will not be saved: {str(e)[:80]}")
+            self.enabled = False
+            return 0
+
+        if not checkpoint:
+            return 0
+        if checkpoint["source_db_mtime"] != self.source_db_mtime:
+            print("Local database changed since the last run; starting from the beginning")
+            return 0
+
+        last_id = checkpoint["last_ingested_id"]
+        print(f"Resuming after file id {last_id} (use --restart to start over)")
+        return last_id
+
+    def advance(self, last_id):
+        """Record that every file up to last_id has been uploaded."""
+        if not self.enabled:
+            return
+        try:
+            self.supabase.save_ingest_checkpoint(self.script, last_id, self.source_db_mtime)
+        except Exception as e:
+            print(f"⚠️  Failed to save checkpoint, progress will not be saved: {str(e)[:80]}")
+            self.enabled = False
+
+    def stop(self):
+        """Freeze the checkpoint (after a failed batch) so the next run retries from here."""
+        self.enabled = False
@@ -3,51 +3,108 @@
 Batch ingest Claude Code component files to Supabase.
 Reads from local SQLite database and uploads to Supabase.
 """
-import sqlite3
+import argparse
 import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from core.supabase_store import SupabaseStore
-from core.database import DatabaseStore
+from core.supabase_store import CircuitOpen, SupabaseStore
+from core.database import DatabaseStore, open_tuned
+from models import FileFormat, ParsedDocument
+from ingest_checkpoint import IngestCheckpoint
+from ingest_tuning import load_batch_size, probe_batch_sizes, save_batch_size
+try:
+    from tqdm import tqdm
+except ModuleNotFoundError:  # pragma: no cover - falls back to plain progress lines
+    tqdm = None
 
 DB_PATH = os.path.expanduser("~/.claude/databases/skill-split.db")
-BATCH_SIZE = 50
+DEFAULT_CONCURRENCY = 16
+SCRIPT_NAME = "ingest_to_supabase"
+FAILED_ITEMS_KEPT = 100
 
-def get_files_from_db():
-    """Get all file IDs and paths from database"""
-    db = DatabaseStore(DB_PATH)
-    conn = sqlite3.connect(DB_PATH)
+def get_files_from_db(after_id=0):
+    """Get file IDs and paths from database with id > after_id"""
+    conn = open_tuned(DB_PATH)
     cursor = conn.cursor()
-    cursor.execute("SELECT id, path FROM files WHERE path LIKE '%/.claude/%' ORDER BY id")
+    cursor.execute(
+        "SELECT id, path FROM files WHERE path LIKE '%/.claude/%' AND id > ? ORDER BY id",
+        (after_id,)
+    )
     rows = cursor.fetchall()
     conn.close()
     return rows
 
-def get_file_data(file_id):
-    """Get file data from local database"""
-    db = DatabaseStore(DB_PATH)
-    result = db.get_file(str(file_id))
-    return result
+def get_file_data(db, file_id):
+    """Get file data from the shared local database store"""
+    return db.get_file_by_id(file_id)
 
-def upload_to_supabase(supabase_url, supabase_key, file_id):
-    """Upload single file to Supabase"""
+def upload_to_supabase(db, supabase, file_id):
+    """Upload single file to Supabase using the shared local and remote stores"""
     try:
         # Get file data from local database
-        db = DatabaseStore(DB_PATH)
-        file_meta, sections = db.get_file(str(file_id))
+        result = get_file_data(db, file_id)
         
-        if file_meta is None:
+        if result is None:
             return False, "File not found in local database"
         
-        # Initialize Supabase store
-        supabase = SupabaseStore(supabase_url, supabase_key)
+        file_meta, sections = result
+        doc = ParsedDocument(
+            frontmatter=file_meta.frontmatter or "",
+            sections=sections,
+            file_type=file_meta.type,
+            format=FileFormat.UNKNOWN,
+            original_path=file_meta.path,
+        )
         
-        # Store in Supabase
-        supabase.store_file(file_meta, sections)
+        # Store in Supabase, retrying transient errors
+        supabase.store_file_with_retry(file_meta.path, Path(file_meta.path).name, doc, file_meta.hash)
         return True, None
+    except CircuitOpen:
+        raise
     except Exception as e:
         return False, str(e)[:100]
 
+def upload_batch(executor, db, supabase, batch):
+    """Upload one batch of (file_id, path) rows, returning one (success, error) per row"""
+    futures = [
+        executor.submit(upload_to_supabase, db, supabase, file_id)
+        for file_id, path in batch
+    ]
+    return [future.result() for future in futures]
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Ingest Claude Code component files from the local database to Supabase"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Files per batch (default: last --probe result, else 50)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Uploads in flight within a batch (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--probe",
+        action="store_true",
+        help="Time a sweep of batch sizes on the first 500 files, save the best, and exit"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the saved checkpoint and ingest from the first file"
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     # Check for Supabase credentials
     supabase_url = os.getenv("SUPABASE_URL")
     supabase_key = os.getenv("SUPABASE_KEY")
@@ -59,32 +116,81 @@ def main():
         print("  export SUPABASE_KEY='your-key'")
         return
     
-    files = get_files_from_db()
+    # One local store and one Supabase client (and its pooled HTTP
+    # connection) for the whole run instead of one of each per file
+    db = DatabaseStore(DB_PATH)
+    supabase = SupabaseStore(supabase_url, supabase_key)
+    
+    if args.probe:
+        files = get_files_from_db()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            best = probe_batch_sizes(
+                files, lambda batch: upload_batch(executor, db, supabase, batch)
+            )
+        if best is not None:
+            save_batch_size(best)
+        return
+    
+    checkpoint = IngestCheckpoint(supabase, SCRIPT_NAME, DB_PATH)
+    files = get_files_from_db(checkpoint.resume_id(args.restart))
     total = len(files)
+    
+    if not files:
+        print("Nothing to ingest: all files are already uploaded")
+        return
+    
+    batch_size = args.batch_size or load_batch_size()
+    
     print(f"Found {total} Claude Code files to ingest")
-    print(f"Target: Supabase ({supabase_url[:40]}...)\n")
+    print(f"Target: Supabase ({supabase_url[:40]}...)")
+    print(f"Batch size: {batch_size}, concurrency: {args.concurrency}\n")
     
     attempted = 0
     successful = 0
     failed = 0
-    failed_ids = []
+    # Only the most recent failures are kept for the report; `failed` has the total
+    failed_ids = deque(maxlen=FAILED_ITEMS_KEPT)
     
-    for batch_start in range(0, total, BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, total)
-        batch = files[batch_start:batch_end]
-        
-        for file_id, path in batch:
-            attempted += 1
-            success, error = upload_to_supabase(supabase_url, supabase_key, file_id)
-            
-            if success:
-                successful += 1
+    # Live bar with rate/ETA on a terminal; plain per-batch lines in logs
+    pbar = None
+    if tqdm is not None and sys.stdout.isatty():
+        pbar = tqdm(total=total, unit='file', smoothing=0.1)
+    
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for batch_start in range(0, total, batch_size):
+            batch_end = min(batch_start + batch_size, total)
+            batch = files[batch_start:batch_end]
+
+            try:
+                results = upload_batch(executor, db, supabase, batch)
+            except CircuitOpen as e:
+                # Supabase is down or throttling hard; stop instead of hammering it
+                checkpoint.stop()
+                print(f"\n❌ {e}; stopping early. Rerun to resume from the last checkpoint.")
+                break
+            for (file_id, path), (success, error) in zip(batch, results):
+                attempted += 1
+                if success:
+                    successful += 1
+                else:
+                    failed += 1
+                    failed_ids.append((file_id, path, error))
+
+            # Only a fully uploaded prefix is checkpointed; a failure freezes it
+            if all(success for success, _ in results):
+                checkpoint.advance(batch[-1][0])
             else:
-                failed += 1
-                failed_ids.append((file_id, path, error))
-        
-        pct = (batch_end / total) * 100
-        print(f"Progress: {batch_end}/{total} ({pct:.1f}%) - Successful: {successful}, Failed: {failed}")
+                checkpoint.stop()
+
+            if pbar is not None:
+                pbar.update(len(batch))
+                pbar.set_postfix(ok=successful, fail=failed)
+            else:
+                pct = (batch_end / total) * 100
+                print(f"Progress: {batch_end}/{total} ({pct:.1f}%) - Successful: {successful}, Failed: {failed}")
+    
+    if pbar is not None:
+        pbar.close()
     
     print("\n" + "="*60)
     print("FINAL RESULTS")
@@ -92,11 +198,15 @@ def main():
     print(f"Total Attempted: {attempted}")
     print(f"Successful:     {successful}")
     print(f"Failed:         {failed}")
-    print(f"Success Rate:   {(successful/attempted*100):.1f}%")
+    if attempted:
+        print(f"Success Rate:   {(successful/attempted*100):.1f}%")
     
-    if failed_ids and len(failed_ids) < 20:
-        print(f"\nFailed Files ({len(failed_ids)}):")
-        for fid, path, error in failed_ids[:20]:
+    if failed_ids:
+        if failed > len(failed_ids):
+            print(f"\nFailed Files: {failed} (showing last {len(failed_ids)})")
+        else:
+            print(f"\nFailed Files ({failed}):")
+        for fid, path, error in failed_ids:
             print(f"  ID {fid}: {path[:50]}")
             if error:
                 print(f"    Error: {error}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Batch-size tuning shared by the Supabase ingest scripts.
+
+The best batch size depends on payload limits and latency of the target,
+so it is measured rather than hardcoded: --probe times a sweep of batch
+sizes on a sample of files, prints seconds/file for each, and saves the
+fastest to TUNING_PATH where later runs pick it up.
+"""
+import json
+import os
+import time
+
+TUNING_PATH = os.path.expanduser("~/.claude/skill_split_tuning.json")
+DEFAULT_BATCH_SIZE = 50
+PROBE_SIZES = (8, 16, 32, 64, 128, 256)
+PROBE_SAMPLE = 500
+
+
+def load_batch_size(default=DEFAULT_BATCH_SIZE):
+    """Return the batch size saved by the last --probe run, or default."""
+    try:
+        with open(TUNING_PATH) as f:
+            value = json.load(f).get("batch_size")
+    except (OSError, ValueError, AttributeError):
+        return default
+    return value if isinstance(value, int) and value > 0 else default
+
+
+def save_batch_size(batch_size):
+    """Persist batch_size to TUNING_PATH, keeping any other saved keys."""
+    try:
+        with open(TUNING_PATH) as f:
+            tuning = json.load(f)
+        if not isinstance(tuning, dict):
+            tuning = {}
+    except (OSError, ValueError):
+        tuning = {}
+
+    tuning["batch_size"] = batch_size
+    os.makedirs(os.path.dirname(TUNING_PATH), exist_ok=True)
+    with open(TUNING_PATH, "w") as f:
+        json.dump(tuning, f, indent=2)
+
+
+def probe_batch_sizes(files, upload_batch, sizes=PROBE_SIZES, sample=PROBE_SAMPLE):
+    """
+    Time upload_batch over the first `sample` files at each batch size.
+
+    Args:
+        files: Rows to upload; only the first `sample` are used
+        upload_batch: Callable taking a list of rows and uploading them
+        sizes: Batch sizes to try
+        sample: Number of files per trial
+
+    Returns:
+        The batch size with the lowest seconds/file, or None if no files
+    """
+    rows = files[:sample]
+    if not rows:
+        return None
+
+    print(f"Probing batch sizes on {len(rows)} files")
+    print(f"{'batch size':>10}  {'seconds/file':>12}")
+
+    timings = {}
+    for size in sizes:
+        start = time.perf_counter()
+        for i in range(0, len(rows), size):
+            upload_batch(rows[i:i + size])
+        timings[size] = (time.perf_counter() - start) / len(rows)
+        print(f"{size:>10}  {timings[size]:>12.4f}")
+
+    best = min(timings, key=timings.get)
+    print(f"\nBest batch size: {best}")
+    return best
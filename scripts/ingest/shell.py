@@ -5,32 +5,148 @@ skill-split Interactive Shell
 A REPL for exploring skill-split functionality interactively.
 """
 
+import atexit
+import functools
 import sys
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if TYPE_CHECKING:
+    from models import ParsedDocument
 
-from skill_split import SkillSplit
-from core.database import Database
-from core.query import QueryAPI
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# skill-split modules (core, handlers, models) are imported on first use, so
+# `help`/`quit` and scripted runs that never touch the database start fast
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - e.g. Windows without pyreadline
+    readline = None
+
+
+# Persistent scratch database, so stored files survive between sessions
+SHELL_DB_PATH = Path.home() / ".cache" / "skill-split" / "shell.db"
+HISTORY_PATH = Path.home() / ".skill_split_history"
+PROMPT = "skill-split> "
+SECTION_CACHE_SIZE = 512
+
+# Indentation per nesting depth, built once instead of per printed row
+_INDENTS = tuple("  " * depth for depth in range(32))
+
+
+def _write_lines(lines):
+    """Write lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
 
 class SkillSplitShell:
     """Interactive shell for skill-split."""
 
-    def __init__(self):
-        self.ss = SkillSplit()
-        self.db = Database(":memory:")
-        self.query = QueryAPI(self.db)
+    # Parsed documents kept in memory, least recently used evicted first
+    PARSE_CACHE_SIZE = 128
+    # Rows shown by `list`
+    LIST_LIMIT = 20
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            SHELL_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            db_path = str(SHELL_DB_PATH)
+        self.db_path = db_path
+        self._db = None
+        self._query = None
         self.running = True
+        # abspath -> (st_mtime_ns, st_size, ParsedDocument)
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        # Navigation revisits the same sections; cleared whenever we store
+        self._get_section = functools.lru_cache(maxsize=SECTION_CACHE_SIZE)(
+            self._load_section
+        )
+        self._get_next_section = functools.lru_cache(maxsize=SECTION_CACHE_SIZE)(
+            self._load_next_section
+        )
+        # command name -> bound cmd_* method, resolved once
+        self._dispatch = {
+            name[4:]: getattr(self, name) for name in dir(self) if name.startswith("cmd_")
+        }
+
+    @property
+    def db(self):
+        """DatabaseStore for the shell database, opened on first use."""
+        if self._db is None:
+            from core.database import DatabaseStore
+            self._db = DatabaseStore(self.db_path)
+        return self._db
+
+    @property
+    def query(self):
+        """QueryAPI for the shell database, opened on first use."""
+        if self._query is None:
+            from core.query import QueryAPI
+            self._query = QueryAPI(self.db_path)
+        return self._query
+
+    def _load_section(self, section_id):
+        """Fetch one section; wrapped by the _get_section cache."""
+        return self.query.get_section(section_id)
+
+    def _load_next_section(self, section_id, file_path, first_child):
+        """Fetch the section after one; wrapped by the _get_next_section cache."""
+        return self.query.get_next_section(section_id, file_path, first_child=first_child)
+
+    def _clear_section_caches(self):
+        """Drop cached sections after the database changes."""
+        self._get_section.cache_clear()
+        self._get_next_section.cache_clear()
+
+    def _parse_file(self, path) -> "ParsedDocument":
+        """Parse a file with its handler, or the markdown parser as a fallback."""
+        # Same detection as the CLI, so each file's format is resolved once
+        from skill_split import _detect_document, _parse_document
+
+        with open(path) as f:
+            content = f.read()
+        handler, file_type, file_format = _detect_document(path, content)
+        return _parse_document(path, content, handler, file_type, file_format)
+
+    def _get_doc(self, path) -> "ParsedDocument":
+        """
+        Parse a file, reusing the previous result while it is unchanged.
+
+        Cached documents are keyed by absolute path and validated against
+        the file's mtime and size, so an edited file is always re-parsed.
+        """
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        with self._parse_cache_lock:
+            hit = self._parse_cache.get(key)
+            if hit and hit[:2] == (st.st_mtime_ns, st.st_size):
+                self._parse_cache.move_to_end(key)
+                return hit[2]
+
+        # Parse outside the lock so store_dir workers parse in parallel
+        doc = self._parse_file(path)
+        with self._parse_cache_lock:
+            self._parse_cache[key] = (st.st_mtime_ns, st.st_size, doc)
+            self._parse_cache.move_to_end(key)
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return doc
 
     def cmd_help(self, args=None):
         """Show available commands."""
         commands = [
             ("parse <file>", "Parse a markdown file"),
             ("store <file>", "Store file in database"),
+            ("store_dir <dir>", "Store every .md file under a directory"),
             ("list [file]", "List sections in file"),
             ("get <id>", "Get section by ID"),
             ("search <query>", "BM25 keyword search"),
@@ -50,9 +166,9 @@ class SkillSplitShell:
             print("Usage: parse <file>")
             return
         try:
-            doc = self.ss.parse_file(args)
+            doc = self._get_doc(args)
             print(f"Parsed {len(doc.sections)} sections from {args}")
-            print(f"Title: {doc.metadata.frontmatter.get('title', 'N/A')}")
+            print(f"Type: {doc.file_type.value}, format: {doc.format.value}")
         except Exception as e:
             print(f"Error: {e}")
 
@@ -62,22 +178,71 @@ class SkillSplitShell:
             print("Usage: store <file>")
             return
         try:
-            doc = self.ss.parse_file(args)
-            self.db.store_document(doc)
-            print(f"Stored {len(doc.sections)} sections")
+            doc = self._get_doc(args)
+            from core.hashing import compute_file_hash
+            file_id = self.db.store_file(args, doc, compute_file_hash(args))
+            self._clear_section_caches()
+            print(f"Stored {len(doc.sections)} sections (file ID {file_id})")
         except Exception as e:
             print(f"Error: {e}")
 
+    def cmd_store_dir(self, args):
+        """Store every markdown file under a directory."""
+        if not args:
+            print("Usage: store_dir <dir>")
+            return
+        from core.hashing import compute_file_hash
+
+        paths = sorted(str(path) for path in Path(args).rglob("*.md"))
+        if not paths:
+            print(f"No .md files under {args}")
+            return
+
+        def parse(path):
+            try:
+                return self._get_doc(path), None
+            except Exception as e:
+                return None, e
+
+        stored = sections = 0
+        failed = []
+        # Files are read and parsed on worker threads; SQLite takes one
+        # writer at a time, so results are stored here in order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for path, (doc, error) in zip(paths, executor.map(parse, paths)):
+                if error is None:
+                    try:
+                        self.db.store_file(path, doc, compute_file_hash(path))
+                        stored += 1
+                        sections += len(doc.sections)
+                        continue
+                    except Exception as e:
+                        error = e
+                failed.append((path, error))
+        if stored:
+            self._clear_section_caches()
+
+        print(f"Stored {stored} files ({sections} top-level sections)")
+        if failed:
+            print(f"Failed: {len(failed)}")
+            for path, error in failed[:10]:
+                print(f"  {path}: {error}")
+
     def cmd_list(self, args):
         """List sections."""
         filename = args if args else None
         try:
-            sections = self.query.list_sections(filename) if filename else self.query.list_sections()
-            for section in sections[:20]:  # Limit output
-                indent = "  " * (section.level - 1)
-                print(f"{indent}[{section.id}] {section.heading}")
-            if len(sections) > 20:
-                print(f"... and {len(sections) - 20} more")
+            # One extra row tells us whether there is more without counting
+            sections = self.query.list_sections(filename, limit=self.LIST_LIMIT + 1)
+            # Build the listing and write it once instead of a print per row
+            lines = []
+            append = lines.append
+            for section_id, level, title in sections[:self.LIST_LIMIT]:
+                indent = _INDENTS[min(max(level - 1, 0), 31)]
+                append(f"{indent}[{section_id}] {title}")
+            if len(sections) > self.LIST_LIMIT:
+                append("... and more (use 'stats' for the total)")
+            _write_lines(lines)
         except Exception as e:
             print(f"Error: {e}")
 
@@ -87,8 +252,11 @@ class SkillSplitShell:
             print("Usage: get <id>")
             return
         try:
-            section = self.query.get_section(int(args))
-            print(f"\n[{section.id}] {section.heading}")
+            section = self._get_section(int(args))
+            if section is None:
+                print(f"Section {args} not found")
+                return
+            print(f"\n[{args}] {section.title}")
             print(f"Level: {section.level}")
             print(f"Lines: {section.line_start}-{section.line_end}")
             print(f"\n{section.content}\n")
@@ -101,12 +269,13 @@ class SkillSplitShell:
             print("Usage: search <query>")
             return
         try:
-            results = self.query.search_sections(args, limit=10)
-            print(f"\nFound {len(results)} results for '{args}':\n")
-            for result in results:
-                section = result.section
-                print(f"[{section.id}] ({result.score:.3f}) {section.heading}")
-                print(f"  {section.content[:80]}...\n")
+            results = self.db.search_snippets(args, limit=10)
+            lines = [f"\nFound {len(results)} results for '{args}':\n"]
+            append = lines.append
+            for section_id, score, title, snippet in results:
+                append(f"[{section_id}] ({score:.3f}) {title}")
+                append(f"  {snippet}\n")
+            _write_lines(lines)
         except Exception as e:
             print(f"Error: {e}")
 
@@ -120,9 +289,9 @@ class SkillSplitShell:
             section_id = int(parts[0])
             filename = parts[1]
             child = "--child" in parts
-            section = self.query.get_next_section(section_id, filename, child=child)
+            section = self._get_next_section(section_id, filename, child)
             if section:
-                print(f"[{section.id}] {section.heading}")
+                print(f"{section.title} (level {section.level}, lines {section.line_start}-{section.line_end})")
             else:
                 print("No more sections")
         except Exception as e:
@@ -134,24 +303,27 @@ class SkillSplitShell:
             print("Usage: tree <file>")
             return
         try:
-            sections = self.query.list_sections(args)
-            print(f"\nSection tree for {args}:\n")
-            for section in sections:
-                indent = "  " * (section.level - 1)
-                prefix = "├─" if section.level > 1 else ""
-                print(f"{indent}{prefix} [{section.id}] {section.heading}")
-            print()
+            lines = [f"\nSection tree for {args}:\n"]
+            append = lines.append
+            for section_id, level, title in self.query.iter_sections(args):
+                indent = _INDENTS[min(max(level - 1, 0), 31)]
+                prefix = "├─" if level > 1 else ""
+                append(f"{indent}{prefix} [{section_id}] {title}")
+            append("")
+            _write_lines(lines)
         except Exception as e:
             print(f"Error: {e}")
 
     def cmd_stats(self, args=None):
         """Show database statistics."""
         try:
-            sections = self.query.list_sections()
+            stats = self.db.get_section_stats()
+            total = stats["total_sections"]
+            avg = stats["total_content_bytes"] // total if total else 0
             print(f"\nDatabase Statistics:")
-            print(f"  Total sections: {len(sections)}")
-            print(f"  Files: {len(set(s.file_path for s in sections))}")
-            print(f"  Avg section size: {sum(len(s.content) for s in sections) // len(sections)} bytes")
+            print(f"  Total sections: {total}")
+            print(f"  Files: {stats['files']}")
+            print(f"  Avg section size: {avg} bytes")
             print()
         except Exception as e:
             print(f"Error: {e}")
@@ -161,32 +333,67 @@ class SkillSplitShell:
         self.running = False
         print("Goodbye!")
 
+    def _complete(self, text, state):
+        """readline completer for command names."""
+        matches = [name for name in self._dispatch if name.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    def _setup_readline(self):
+        """Enable line editing, persistent history and tab completion."""
+        if readline is None:
+            return
+        try:
+            readline.read_history_file(HISTORY_PATH)
+        except OSError:
+            pass
+        atexit.register(readline.write_history_file, HISTORY_PATH)
+        readline.set_completer(self._complete)
+        readline.parse_and_bind("tab: complete")
+
+    def execute(self, line):
+        """Run one command line."""
+        # split(None, 1) skips leading whitespace itself
+        parts = line.split(None, 1)
+        if not parts:
+            return
+
+        command = parts[0].lower()
+        args = parts[1].rstrip() if len(parts) > 1 else ""
+
+        method = self._dispatch.get(command)
+        if method:
+            method(args)
+        else:
+            print(f"Unknown command: {command}. Type 'help' for commands.")
+
     def run(self):
-        """Run the interactive shell."""
+        """Run the shell: interactive on a terminal, line by line from a pipe."""
+        if not sys.stdin.isatty():
+            # Scripted mode: no banner or prompt, stop at end of input
+            for line in sys.stdin:
+                try:
+                    self.execute(line)
+                except Exception as e:
+                    print(f"Error: {e}")
+                if not self.running:
+                    break
+            return
+
         print("╔════════════════════════════════════════════════╗")
         print("║     skill-split Interactive Shell v1.0.0      ║")
         print("║    Type 'help' for available commands          ║")
         print("╚════════════════════════════════════════════════╝")
         print()
+        self._setup_readline()
 
         while self.running:
             try:
-                cmd_input = input("skill-split> ").strip()
-                if not cmd_input:
-                    continue
-
-                parts = cmd_input.split(maxsplit=1)
-                command = parts[0].lower()
-                args = parts[1] if len(parts) > 1 else ""
-
-                method = getattr(self, f"cmd_{command}", None)
-                if method:
-                    method(args)
-                else:
-                    print(f"Unknown command: {command}. Type 'help' for commands.")
-
-            except (KeyboardInterrupt, EOFError):
+                self.execute(input(PROMPT))
+            except KeyboardInterrupt:
                 print("\nUse 'quit' to exit.")
+            except EOFError:
+                print()
+                break
             except Exception as e:
                 print(f"Error: {e}")
 
@@ -11,11 +11,16 @@ Usage:
 """
 
 import argparse
-import sqlite3
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import open_tuned
 
 MIGRATIONS: Dict[str, str] = {
     "001_add_closing_tag_prefix": """
@@ -36,12 +41,18 @@ MIGRATIONS: Dict[str, str] = {
         CREATE INDEX IF NOT EXISTS idx_sections_hash
         ON sections(content_hash);
     """,
+    # Partial covering index for the ingest scripts' '%/.claude/%' scan,
+    # which a plain index cannot serve because of the leading wildcard
+    "006_add_claude_partial_index": """
+        CREATE INDEX IF NOT EXISTS idx_files_claude_partial
+        ON files(id, path, type)
+        WHERE path LIKE '%/.claude/%';
+    """,
 }
 
 
-def get_applied_migrations(db_path: str) -> set:
-    """Get list of applied migrations."""
-    conn = sqlite3.connect(db_path)
+def _read_applied_migrations(conn) -> set:
+    """Read applied migration names, creating the tracking table if needed."""
     cursor = conn.cursor()
 
     # Create migrations table if not exists
@@ -57,6 +68,41 @@ def get_applied_migrations(db_path: str) -> set:
     return {row[0] for row in cursor.fetchall()}
 
 
+def _db_version(db_path: str) -> tuple:
+    """Modification stamps for the database and its WAL (commits land in -wal)."""
+    stamps = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+@lru_cache(maxsize=None)
+def _cached_applied_migrations(db_path: str, version: tuple) -> frozenset:
+    """Applied migrations for db_path as of `version` (see _db_version)."""
+    conn = open_tuned(db_path, readonly=False)
+    try:
+        return frozenset(_read_applied_migrations(conn))
+    finally:
+        conn.close()
+
+
+def get_applied_migrations(db_path: str, conn=None) -> set:
+    """
+    Get list of applied migrations.
+
+    With conn, reads through that connection (so callers can reuse it for
+    the migrations themselves). Without it, results are cached per database
+    file and modification time, so repeated calls in one run are free until
+    the database changes.
+    """
+    if conn is not None:
+        return _read_applied_migrations(conn)
+    return set(_cached_applied_migrations(db_path, _db_version(db_path)))
+
+
 def list_migrations(db_path: str):
     """List all migrations and their status."""
     applied = get_applied_migrations(db_path)
@@ -76,35 +122,39 @@ def list_migrations(db_path: str):
 
 def apply_migrations(db_path: str, dry_run: bool = False):
     """Apply pending migrations."""
-    applied = get_applied_migrations(db_path)
-    pending = [name for name in MIGRATIONS if name not in applied]
+    conn = open_tuned(db_path, readonly=False)
+    # Manage the transaction explicitly so the whole set is all-or-nothing
+    conn.isolation_level = None
+    try:
+        applied = get_applied_migrations(db_path, conn)
+        pending = [name for name in MIGRATIONS if name not in applied]
 
-    if not pending:
-        print("✅ All migrations applied!")
-        return 0
+        if not pending:
+            print("✅ All migrations applied!")
+            return 0
 
-    print(f"🔄 Applying {len(pending)} migrations...")
-    print(f"Database: {db_path}\n")
+        print(f"🔄 Applying {len(pending)} migrations...")
+        print(f"Database: {db_path}\n")
 
-    if dry_run:
-        print("🔍 DRY RUN - no changes will be made\n")
+        if dry_run:
+            print("🔍 DRY RUN - no changes will be made\n")
+        else:
+            # IMMEDIATE takes the write lock up front instead of on first write
+            conn.execute("BEGIN IMMEDIATE")
 
-    conn = sqlite3.connect(db_path)
-    try:
         for name in pending:
             sql = MIGRATIONS[name]
             print(f"Applying: {name}")
 
             if not dry_run:
-                cursor = conn.cursor()
-                cursor.execute(sql)
-                cursor.execute(
+                conn.execute(sql)
+                conn.execute(
                     "INSERT INTO schema_migrations (name) VALUES (?)",
                     (name,)
                 )
-                conn.commit()
 
         if not dry_run:
+            conn.execute("COMMIT")
             print(f"\n✅ Successfully applied {len(pending)} migrations")
         else:
             print(f"\n✅ Would apply {len(pending)} migrations")
@@ -112,8 +162,10 @@ def apply_migrations(db_path: str, dry_run: bool = False):
         return 0
 
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
         print(f"\n❌ Migration failed: {e}")
+        print("   No migrations were applied")
         return 1
 
     finally:
@@ -122,16 +174,16 @@ def apply_migrations(db_path: str, dry_run: bool = False):
 
 def rollback_migration(db_path: str, name: str):
     """Rollback a specific migration."""
-    applied = get_applied_migrations(db_path)
+    conn = open_tuned(db_path, readonly=False)
+    try:
+        applied = get_applied_migrations(db_path, conn)
 
-    if name not in applied:
-        print(f"❌ Migration '{name}' not applied")
-        return 1
+        if name not in applied:
+            print(f"❌ Migration '{name}' not applied")
+            return 1
 
-    print(f"⏪ Rolling back: {name}")
+        print(f"⏪ Rolling back: {name}")
 
-    conn = sqlite3.connect(db_path)
-    try:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM schema_migrations WHERE name = ?", (name,))
         conn.commit()
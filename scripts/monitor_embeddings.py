@@ -13,13 +13,23 @@ Tracks:
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Any
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - only needed for --sweep
+    np = None
+
 # Load environment variables
 load_dotenv()
 
+# Scenario grid for --sweep
+SWEEP_SECTION_COUNTS = (50, 500, 5000, 20000, 100000)
+SWEEP_QUERY_COUNTS = (1000, 3000, 10000, 30000, 100000)
+
 
 class EmbeddingMonitor:
     """Monitor and report on embedding metrics and costs."""
@@ -37,6 +47,7 @@ class EmbeddingMonitor:
         # Cost constants
         self.cost_per_1k_tokens = 0.00002  # text-embedding-3-small
         self.tokens_per_section = 100  # Average estimate
+        self._cost_per_token = self.cost_per_1k_tokens / 1000
 
         # Initialize Supabase if credentials available
         self.supabase_client = None
@@ -57,17 +68,15 @@ class EmbeddingMonitor:
             return self._get_demo_stats()
 
         try:
-            # Get total sections
-            sections_response = self.supabase_client.table('sections').select('COUNT(*)').execute()
-            total_sections = sections_response.count if hasattr(sections_response, 'count') else 0
-
-            # Get embedded sections count
-            embeddings_response = self.supabase_client.table('section_embeddings').select('COUNT(*)').execute()
-            embedded_sections = embeddings_response.count if hasattr(embeddings_response, 'count') else 0
+            # The three reads are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                sections_future = executor.submit(self._count_rows, 'sections')
+                embeddings_future = executor.submit(self._count_rows, 'section_embeddings')
+                metadata_future = executor.submit(self._get_metadata)
 
-            # Get embedding metadata (if exists)
-            metadata_response = self.supabase_client.table('embedding_metadata').select('*').execute()
-            metadata = metadata_response.data[0] if metadata_response.data else {}
+                total_sections = sections_future.result()
+                embedded_sections = embeddings_future.result()
+                metadata = metadata_future.result()
 
             return {
                 'total_sections': total_sections,
@@ -82,6 +91,30 @@ class EmbeddingMonitor:
             print(f"⚠️  Error fetching embedding stats: {e}")
             return self._get_demo_stats()
 
+    def _count_rows(self, table: str) -> int:
+        """Count rows in a table without downloading them.
+
+        Issues a HEAD request with Prefer: count=exact, so PostgREST returns
+        only the total in the Content-Range header.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Exact row count
+        """
+        response = self.supabase_client.table(table).select('id', count='exact', head=True).execute()
+        return response.count or 0
+
+    def _get_metadata(self) -> Dict[str, Any]:
+        """Fetch the embedding_metadata row, if any.
+
+        Returns:
+            Metadata row or an empty dict
+        """
+        response = self.supabase_client.table('embedding_metadata').select('*').limit(1).execute()
+        return response.data[0] if response.data else {}
+
     def _get_demo_stats(self) -> Dict[str, Any]:
         """Return demo statistics for testing without Supabase.
 
@@ -108,8 +141,7 @@ class EmbeddingMonitor:
             Tuple of (tokens_needed, cost_usd)
         """
         tokens = section_count * self.tokens_per_section
-        cost = (tokens / 1000) * self.cost_per_1k_tokens
-        return tokens, cost
+        return tokens, tokens * self._cost_per_token
 
     def estimate_monthly_cost(self, new_sections_per_month: int = 50) -> float:
         """Estimate monthly embedding cost.
@@ -120,8 +152,7 @@ class EmbeddingMonitor:
         Returns:
             Estimated monthly cost in USD
         """
-        tokens = new_sections_per_month * self.tokens_per_section
-        return (tokens / 1000) * self.cost_per_1k_tokens
+        return new_sections_per_month * self.tokens_per_section * self._cost_per_token
 
     def estimate_query_cost(self, queries_per_month: int = 3000) -> float:
         """Estimate monthly query cost.
@@ -134,7 +165,45 @@ class EmbeddingMonitor:
         """
         # Each query embeds the query text (~20 tokens) + vector search (no cost)
         tokens = queries_per_month * 20  # Query text is small
-        return (tokens / 1000) * self.cost_per_1k_tokens
+        return tokens * self._cost_per_token
+
+    def sweep_costs(self, section_counts: Any, query_counts: Any) -> Any:
+        """Monthly cost for every combination of new sections and queries.
+
+        Args:
+            section_counts: 1-D array of new sections per month
+            query_counts: 1-D array of queries per month
+
+        Returns:
+            2-D array with one row per section count and one column per
+            query count, in USD
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("--sweep requires numpy. Install it with: pip install numpy")
+        section_tokens = np.asarray(section_counts)[:, None] * self.tokens_per_section
+        query_tokens = np.asarray(query_counts)[None, :] * 20
+        return (section_tokens + query_tokens) * self._cost_per_token
+
+    def print_sweep(self, section_counts: Any, query_counts: Any):
+        """Print a monthly cost matrix over section and query counts.
+
+        Args:
+            section_counts: New sections per month (rows)
+            query_counts: Queries per month (columns)
+        """
+        costs = self.sweep_costs(section_counts, query_counts)
+
+        print("\n" + "=" * 70)
+        print("MONTHLY COST SWEEP (rows: new sections, columns: queries)")
+        print("=" * 70)
+        print(f"{'':>10}" + "".join(f"{queries:>12,}" for queries in query_counts))
+        for sections, row in zip(section_counts, costs):
+            print(f"{sections:>10,}" + "".join(f"{self.format_cost(cost):>12}" for cost in row))
+        print("=" * 70)
+        print()
 
     def format_cost(self, cost: float) -> str:
         """Format cost as currency string.
@@ -158,6 +227,17 @@ class EmbeddingMonitor:
         if stats is None:
             stats = self.get_embedding_stats()
 
+        total_sections, embedded, failed, total_tokens, current_cost, last_batch_at, coverage = (
+            stats[key] for key in (
+                'total_sections', 'embedded_sections', 'failed_embeddings',
+                'total_tokens_used', 'estimated_cost_usd', 'last_batch_at', 'coverage_percent'
+            )
+        )
+        remaining = total_sections - embedded
+        monthly_new = self.estimate_monthly_cost(50)
+        monthly_query = self.estimate_query_cost(3000)
+        monthly_total = monthly_new + monthly_query
+
         print("\n" + "=" * 70)
         print("EMBEDDING MONITORING REPORT")
         print("=" * 70)
@@ -166,62 +246,55 @@ class EmbeddingMonitor:
 
         # Section Coverage
         print("📊 SECTION COVERAGE")
-        print(f"  Total Sections:      {stats['total_sections']:>10,}")
-        print(f"  Embedded Sections:   {stats['embedded_sections']:>10,}")
-        print(f"  Coverage:            {stats['coverage_percent']:>10.1f}%")
-        if stats['failed_embeddings'] > 0:
-            print(f"  Failed Embeddings:   {stats['failed_embeddings']:>10,} ⚠️")
+        print(f"  Total Sections:      {total_sections:>10,}")
+        print(f"  Embedded Sections:   {embedded:>10,}")
+        print(f"  Coverage:            {coverage:>10.1f}%")
+        if failed > 0:
+            print(f"  Failed Embeddings:   {failed:>10,} ⚠️")
         print()
 
         # Token Usage
         print("🔤 TOKEN USAGE")
-        total_tokens = stats['total_tokens_used']
         print(f"  Total Tokens Used:   {total_tokens:>10,}")
         if total_tokens > 0:
-            avg_tokens = total_tokens / max(1, stats['embedded_sections'])
+            avg_tokens = total_tokens / max(1, embedded)
             print(f"  Avg per Section:     {avg_tokens:>10.0f}")
         print()
 
         # Costs
         print("💰 COST ANALYSIS")
-        current_cost = stats['estimated_cost_usd']
         print(f"  Current Cost:        {self.format_cost(current_cost):>10}")
 
         # Projected costs
-        monthly_new = self.estimate_monthly_cost(50)
-        monthly_query = self.estimate_query_cost(3000)
-        monthly_total = monthly_new + monthly_query
-
         print(f"  Monthly (50 new):    {self.format_cost(monthly_new):>10}")
         print(f"  Monthly (3K queries):{self.format_cost(monthly_query):>10}")
         print(f"  Monthly Total:       {self.format_cost(monthly_total):>10}")
 
         # ROI
-        if stats['embedded_sections'] > 0 and stats['estimated_cost_usd'] > 0:
-            cost_per_section = stats['estimated_cost_usd'] / stats['embedded_sections']
+        if embedded > 0 and current_cost > 0:
+            cost_per_section = current_cost / embedded
             print(f"  Cost/Section:        {self.format_cost(cost_per_section):>10}")
         print()
 
         # Status
         print("⏱️  TIMING")
-        print(f"  Last Batch:          {stats['last_batch_at']:>20}")
+        print(f"  Last Batch:          {last_batch_at:>20}")
         print()
 
         # Recommendations
         print("📋 RECOMMENDATIONS")
-        if stats['coverage_percent'] < 50:
+        if coverage < 50:
             print("  • Run initial batch embedding to reach 100% coverage")
-            tokens, cost = self.calculate_batch_cost(stats['total_sections'] - stats['embedded_sections'])
+            tokens, cost = self.calculate_batch_cost(remaining)
             print(f"    Estimated cost: {self.format_cost(cost)} for {tokens:,} tokens")
-        elif stats['coverage_percent'] < 100:
-            remaining = stats['total_sections'] - stats['embedded_sections']
+        elif coverage < 100:
             tokens, cost = self.calculate_batch_cost(remaining)
             print(f"  • {remaining:,} sections still need embeddings ({self.format_cost(cost)})")
         else:
             print("  ✓ All sections have embeddings - vector search fully operational")
 
-        if stats['failed_embeddings'] > 0:
-            print(f"  ⚠️  {stats['failed_embeddings']} failed embeddings - investigate and retry")
+        if failed > 0:
+            print(f"  ⚠️  {failed} failed embeddings - investigate and retry")
 
         if monthly_total < 0.05:
             print("  ✓ Monthly cost is negligible - no action needed")
@@ -264,6 +337,8 @@ def main():
                        help='Expected queries per month (default: 3000)')
     parser.add_argument('--json', action='store_true',
                        help='Output stats as JSON')
+    parser.add_argument('--sweep', action='store_true',
+                       help='Print monthly costs over a grid of section and query counts')
 
     args = parser.parse_args()
 
@@ -275,6 +350,14 @@ def main():
         monitor.print_batch_estimate(args.estimate)
         return 0
 
+    if args.sweep:
+        try:
+            monitor.print_sweep(SWEEP_SECTION_COUNTS, SWEEP_QUERY_COUNTS)
+        except ImportError as e:
+            print(f"❌ {e}")
+            return 1
+        return 0
+
     # Get and display stats
     stats = monitor.get_embedding_stats()
 
@@ -7,36 +7,61 @@ sections stored in a database, enabling progressive disclosure.
 """
 
 import argparse
+import functools
 import sys
 import os
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-# Load environment variables from .env file
-load_dotenv()
+if TYPE_CHECKING:
+    from models import FileMetadata, Section
+
+
+def _find_env_file() -> Optional[Path]:
+    """Find the nearest .env at or above this script, as load_dotenv() would."""
+    here = Path(os.path.abspath(__file__)).parent
+    for directory in (here, *here.parents):
+        env_file = directory / ".env"
+        if env_file.is_file():
+            return env_file
+    return None
+
+
+# Load environment variables from .env file. python-dotenv (and the logging
+# machinery it pulls in) is only imported when there is a file to load
+_env_file = _find_env_file()
+if _env_file is not None:
+    from dotenv import load_dotenv
+    load_dotenv(_env_file)
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.parser import Parser
-from core.detector import FormatDetector
-from core.database import DatabaseStore
-from core.hashing import compute_file_hash, compute_combined_hash
-from core.validator import Validator
-from core.recomposer import Recomposer
-from core.query import QueryAPI
-from models import FileFormat, FileType, Section
-
-# Import HandlerFactory for script and component file handling
-from handlers.factory import HandlerFactory
+# core, handlers and models are imported inside the commands that use them,
+# so `--help` and argument errors don't pay for loading the whole package
 
 # Lazy imports for Supabase-dependent modules
 # (to allow running core commands without Supabase installed)
 SupabaseStore = None
-from core.checkout_manager import CheckoutManager
 SecretManager = None
 
+# Title, level and owning file path of one section, for commands that only
+# display those; run on QueryAPI.conn so the statement stays prepared
+_SQL_SECTION_ROW = """
+    SELECT s.title, s.level, f.path
+    FROM sections s
+    JOIN files f ON s.file_id = f.id
+    WHERE s.id = ?
+"""
+
+# Hybrid searches run at once by search-semantic-batch
+SEMANTIC_BATCH_WORKERS = 8
+
+# Files sent to Supabase per bulk request by the ingest command
+INGEST_BATCH_SIZE = 50
+# Below this many files, starting worker processes costs more than it saves
+INGEST_PARALLEL_MIN_FILES = 64
+
 
 def get_default_db_path():
     """Get database path from env var or use default location."""
@@ -137,6 +162,74 @@ def _get_supabase_key(use_secret_manager: bool = True, secrets_config: Optional[
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_detector():
+    """Shared FormatDetector; it keeps no state between calls."""
+    from core.detector import FormatDetector
+    return FormatDetector()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser():
+    """Shared Parser; it keeps no state between calls."""
+    from core.parser import Parser
+    return Parser()
+
+
+def _detect_document(file_path: str, content: str):
+    """
+    Decide how a file is parsed.
+
+    Script and component files go to their HandlerFactory handler; anything
+    else falls back to FormatDetector and the markdown Parser.
+
+    Args:
+        file_path: Path to the file
+        content: The file's text
+
+    Returns:
+        Tuple of (handler or None, FileType, FileFormat)
+    """
+    from handlers.factory import HandlerFactory
+
+    # create_handler() returns None for markdown types, so an is_supported()
+    # check first would only run the same path detection twice
+    try:
+        handler = HandlerFactory.create_handler(file_path)
+    except (ValueError, FileNotFoundError):
+        # File not supported or doesn't exist, fall back to parser
+        handler = None
+    if handler:
+        return handler, handler.get_file_type(), handler.get_file_format()
+
+    file_type, file_format = _get_detector().detect(file_path, content)
+    return None, file_type, file_format
+
+
+def _parse_document(file_path: str, content: str, handler, file_type, file_format):
+    """Parse a file the way _detect_document() decided."""
+    if handler:
+        return handler.parse()
+    return _get_parser().parse(file_path, content, file_type, file_format)
+
+
+def _document_hash(file_path: str, handler, file_hash: str) -> str:
+    """
+    Return the hash stored for a file.
+
+    Multi-file components hash their related files too; everything else
+    uses the plain file hash.
+    """
+    from core.hashing import compute_combined_hash
+
+    related_paths = []
+    if handler and hasattr(handler, "get_related_files"):
+        related_paths = handler.get_related_files()
+    if related_paths:
+        return compute_combined_hash(file_path, related_paths)
+    return file_hash
+
+
 def cmd_parse(args) -> int:
     """Parse a file and display its structure."""
     file_path = args.file
@@ -148,26 +241,8 @@ def cmd_parse(args) -> int:
     with open(file_path) as f:
         content = f.read()
 
-    # Try to use HandlerFactory for script and component files
-    handler = None
-    try:
-        if HandlerFactory.is_supported(file_path):
-            handler = HandlerFactory.create_handler(file_path)
-    except (ValueError, FileNotFoundError):
-        # File not supported or doesn't exist, fall back to parser
-        pass
-
-    if handler:
-        # Use handler for script/component files
-        doc = handler.parse()
-        file_type = handler.get_file_type()
-        file_format = handler.get_file_format()
-    else:
-        # Fall back to existing Parser for markdown files
-        detector = FormatDetector()
-        file_type, file_format = detector.detect(file_path, content)
-        parser = Parser()
-        doc = parser.parse(file_path, content, file_type, file_format)
+    handler, file_type, file_format = _detect_document(file_path, content)
+    doc = _parse_document(file_path, content, handler, file_type, file_format)
 
     # Display results
     print(f"File: {file_path}")
@@ -189,15 +264,21 @@ def cmd_parse(args) -> int:
 
 
 def _print_sections(sections, indent: int) -> None:
-    """Print sections with indentation."""
-    for section in sections:
-        prefix = "  " * indent
+    """Print sections with indentation, depth-first in document order."""
+    # Explicit stack: no Python frame per section and no recursion limit.
+    # Lines are collected and written once rather than printed one by one
+    lines = []
+    stack = [(section, indent) for section in reversed(sections)]
+    while stack:
+        section, depth = stack.pop()
+        prefix = "  " * depth
         level_indicator = "#" * section.level
-        print(f"{prefix}{level_indicator} {section.title}")
-        print(f"{prefix}  Lines: {section.line_start}-{section.line_end}")
+        lines.append(f"{prefix}{level_indicator} {section.title}")
+        lines.append(f"{prefix}  Lines: {section.line_start}-{section.line_end}")
 
-        if section.children:
-            _print_sections(section.children, indent + 1)
+        stack.extend((child, depth + 1) for child in reversed(section.children))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_validate(args) -> int:
@@ -211,30 +292,15 @@ def cmd_validate(args) -> int:
     with open(file_path) as f:
         content = f.read()
 
-    # Try to use HandlerFactory for script and component files
-    handler = None
-    try:
-        if HandlerFactory.is_supported(file_path):
-            handler = HandlerFactory.create_handler(file_path)
-    except (ValueError, FileNotFoundError):
-        # File not supported or doesn't exist, fall back to parser
-        pass
+    handler, file_type, file_format = _detect_document(file_path, content)
+    doc = _parse_document(file_path, content, handler, file_type, file_format)
 
     if handler:
         # Use handler for script/component files
-        doc = handler.parse()
-        file_type = handler.get_file_type()
-        file_format = handler.get_file_format()
         result = handler.validate()
         errors = result.errors
         warnings = result.warnings
     else:
-        # Fall back to existing Parser for markdown files
-        detector = FormatDetector()
-        file_type, file_format = detector.detect(file_path, content)
-        parser = Parser()
-        doc = parser.parse(file_path, content, file_type, file_format)
-
         # Basic validation
         errors = []
         warnings = []
@@ -242,15 +308,16 @@ def cmd_validate(args) -> int:
         if not doc.sections:
             errors.append("No sections found in file")
 
-        # Check for empty sections
-        def check_empty(sections, path=""):
-            for section in sections:
-                full_path = f"{path}/{section.title}" if path else section.title
-                if not section.content.strip() and not section.children:
-                    warnings.append(f"Empty section: {full_path}")
-                check_empty(section.children, full_path)
-
-        check_empty(doc.sections)
+        # Check for empty sections, depth-first in document order
+        stack = [(section, section.title) for section in reversed(doc.sections)]
+        while stack:
+            section, full_path = stack.pop()
+            if not section.content.strip() and not section.children:
+                warnings.append(f"Empty section: {full_path}")
+            stack.extend(
+                (child, f"{full_path}/{child.title}")
+                for child in reversed(section.children)
+            )
 
     # Report
     print(f"Validating: {file_path}")
@@ -273,8 +340,26 @@ def cmd_validate(args) -> int:
     return 1 if errors else 0
 
 
+def _stored_if_unchanged(store, file_path: str, content_hash: str, args) -> Optional[dict]:
+    """
+    Return the stored file's summary if it matches content_hash.
+
+    Only used for plain-parser files, whose stored hash is the file hash;
+    handler files hash their related files too. --force always returns None.
+    """
+    if getattr(args, "force", False):
+        return None
+    summary = store.get_file_summary(file_path)
+    if summary is not None and summary["hash"] == content_hash:
+        return summary
+    return None
+
+
 def cmd_store(args) -> int:
     """Store a parsed file in the database."""
+    from core.database import DatabaseStore
+    from core.hashing import hash_and_read
+
     file_path = args.file
     db_path = args.db or get_default_db_path()
 
@@ -282,44 +367,32 @@ def cmd_store(args) -> int:
         print(f"Error: File not found: {file_path}", file=sys.stderr)
         return 1
 
-    with open(file_path) as f:
-        content = f.read()
+    content_hash, content = hash_and_read(file_path)
+    store = DatabaseStore(db_path)
 
-    # Try to use HandlerFactory for script and component files
-    handler = None
-    try:
-        if HandlerFactory.is_supported(file_path):
-            handler = HandlerFactory.create_handler(file_path)
-    except (ValueError, FileNotFoundError):
-        # File not supported or doesn't exist, fall back to parser
-        pass
+    handler, file_type, file_format = _detect_document(file_path, content)
+    if not handler:
+        # Unchanged since the last store: skip parsing and rewriting it
+        stored = _stored_if_unchanged(store, file_path, content_hash, args)
+        if stored is not None:
+            print(f"File: {file_path}")
+            print(f"File ID: {stored['id']}")
+            print(f"Hash: {content_hash}")
+            print(f"Type: {file_type.value}")
+            print(f"Format: {file_format.value}")
+            print(f"Sections: {stored['sections']}")
+            print("Unchanged since last store (use --force to store again)")
+            return 0
 
-    if handler:
-        # Use handler for script/component files
-        doc = handler.parse()
-        file_type = handler.get_file_type()
-        file_format = handler.get_file_format()
-    else:
-        # Fall back to existing Parser for markdown files
-        detector = FormatDetector()
-        file_type, file_format = detector.detect(file_path, content)
-        parser = Parser()
-        doc = parser.parse(file_path, content, file_type, file_format)
+    doc = _parse_document(file_path, content, handler, file_type, file_format)
 
     # Compute hash (combined for multi-file components)
-    related_paths = []
-    if handler and hasattr(handler, "get_related_files"):
-        related_paths = handler.get_related_files()
-    if related_paths:
-        content_hash = compute_combined_hash(file_path, related_paths)
-    else:
-        content_hash = compute_file_hash(file_path)
+    content_hash = _document_hash(file_path, handler, content_hash)
     if not content_hash:
         print(f"Error: Unable to compute hash for {file_path}", file=sys.stderr)
         return 1
 
     # Store in database
-    store = DatabaseStore(db_path)
     try:
         file_id = store.store_file(file_path, doc, content_hash)
     except Exception as e:
@@ -339,6 +412,8 @@ def cmd_store(args) -> int:
 
 def cmd_get(args) -> int:
     """Retrieve a file from the database and display metadata."""
+    from core.database import DatabaseStore
+
     file_path = args.file
     db_path = args.db or get_default_db_path()
 
@@ -369,34 +444,38 @@ def cmd_get(args) -> int:
 
 def cmd_tree(args) -> int:
     """Show section hierarchy for a file in the database."""
+    from core.database import DatabaseStore
+
     file_path = args.file
     db_path = args.db or get_default_db_path()
 
     store = DatabaseStore(db_path)
-    sections = store.get_section_tree(file_path)
+    result = store.get_file_with_sections(file_path)
+    if result is None:
+        print(f"Error: File not found in database: {file_path}", file=sys.stderr)
+        return 1
+    _, sections = result
 
     if not sections:
-        # File might not exist or have no sections
-        result = store.get_file(file_path)
-        if result is None:
-            print(f"Error: File not found in database: {file_path}", file=sys.stderr)
-            return 1
         print(f"File: {file_path}")
         print("(No sections)")
         return 0
 
-    id_map = _build_section_id_map(db_path, file_path)
-
     print(f"File: {file_path}")
     print()
     print("Sections:")
-    _print_sections_with_ids(sections, indent=0, id_map=id_map)
+    _print_sections_with_ids(sections, indent=0)
 
     return 0
 
 
 def cmd_verify(args) -> int:
     """Verify a file by storing it and validating round-trip integrity."""
+    from core.database import DatabaseStore
+    from core.hashing import hash_and_read
+    from core.validator import Validator
+    from core.recomposer import Recomposer
+
     file_path = args.file
     db_path = args.db or get_default_db_path()
 
@@ -404,54 +483,41 @@ def cmd_verify(args) -> int:
         print(f"Error: File not found: {file_path}", file=sys.stderr)
         return 1
 
-    with open(file_path) as f:
-        content = f.read()
+    content_hash, content = hash_and_read(file_path)
+    # Kept aside: content_hash may become the combined hash below
+    file_hash = content_hash
+    store = DatabaseStore(db_path)
+    stored = None
 
-    # Try to use HandlerFactory for script and component files
-    handler = None
-    try:
-        if HandlerFactory.is_supported(file_path):
-            handler = HandlerFactory.create_handler(file_path)
-    except (ValueError, FileNotFoundError):
-        # File not supported or doesn't exist, fall back to parser
-        pass
+    handler, file_type, file_format = _detect_document(file_path, content)
+    if not handler:
+        # Unchanged since the last store: validate the stored copy as is
+        stored = _stored_if_unchanged(store, file_path, content_hash, args)
 
-    if handler:
-        # Use handler for script/component files
-        doc = handler.parse()
-        file_type = handler.get_file_type()
-        file_format = handler.get_file_format()
+    if stored is not None:
+        file_id = stored["id"]
     else:
-        # Fall back to existing Parser for markdown files
-        detector = FormatDetector()
-        file_type, file_format = detector.detect(file_path, content)
-        parser = Parser()
-        doc = parser.parse(file_path, content, file_type, file_format)
+        doc = _parse_document(file_path, content, handler, file_type, file_format)
 
-    # Compute hash (combined for multi-file components)
-    related_paths = []
-    if handler and hasattr(handler, "get_related_files"):
-        related_paths = handler.get_related_files()
-    if related_paths:
-        content_hash = compute_combined_hash(file_path, related_paths)
-    else:
-        content_hash = compute_file_hash(file_path)
-    if not content_hash:
-        print(f"Error: Unable to compute hash for {file_path}", file=sys.stderr)
-        return 1
+        # Compute hash (combined for multi-file components)
+        content_hash = _document_hash(file_path, handler, content_hash)
+        if not content_hash:
+            print(f"Error: Unable to compute hash for {file_path}", file=sys.stderr)
+            return 1
 
-    # Store in database (or update if exists)
-    store = DatabaseStore(db_path)
-    try:
-        file_id = store.store_file(file_path, doc, content_hash)
-    except Exception as e:
-        print(f"Error storing file: {e}", file=sys.stderr)
-        return 1
+        # Store in database (or update if exists)
+        try:
+            file_id = store.store_file(file_path, doc, content_hash)
+        except Exception as e:
+            print(f"Error storing file: {e}", file=sys.stderr)
+            return 1
 
     # Run round-trip validation
     recomposer = Recomposer(store)
     validator = Validator(store, recomposer)
-    result = validator.validate_round_trip(file_path)
+    result = validator.validate_round_trip(
+        file_path, original_hash=file_hash, original_content=content
+    )
 
     # Display results
     print(f"File: {file_path}")
@@ -491,15 +557,61 @@ def cmd_verify(args) -> int:
 
 
 def _count_sections(sections) -> int:
-    """Count all sections recursively."""
-    count = len(sections)
-    for section in sections:
-        count += _count_sections(section.children)
+    """Count all sections, including nested children."""
+    count = 0
+    stack = list(sections)
+    while stack:
+        section = stack.pop()
+        count += 1
+        stack.extend(section.children)
     return count
 
 
+def _parse_for_ingest(file_path: str) -> Tuple[Optional["FileMetadata"], Union[List["Section"], str]]:
+    """
+    Read, parse and hash one file for cmd_ingest.
+
+    Module-level so it can run in a worker process. Errors are returned
+    rather than raised, so one bad file does not end the whole map().
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        (FileMetadata, top-level sections) on success, or
+        (None, message to print) if the file was skipped
+    """
+    from core.hashing import hash_and_read
+    from models import FileMetadata
+
+    try:
+        content_hash, content = hash_and_read(file_path)
+
+        handler, file_type, file_format = _detect_document(file_path, content)
+        doc = _parse_document(file_path, content, handler, file_type, file_format)
+
+        # Compute hash
+        content_hash = _document_hash(file_path, handler, content_hash)
+        if not content_hash:
+            return None, f"Warning: Could not compute hash for {file_path}"
+
+    except Exception as e:
+        return None, f"Error processing {file_path}: {e}"
+
+    meta = FileMetadata(
+        path=file_path,
+        type=doc.file_type,
+        frontmatter=doc.frontmatter,
+        hash=content_hash,
+    )
+    return meta, doc.sections
+
+
 def cmd_ingest(args) -> int:
     """Parse files from directory and store in Supabase."""
+    from handlers.factory import HandlerFactory
+    from concurrent.futures import ProcessPoolExecutor
+
     _ensure_supabase_imports()
     source_dir = args.source_dir
 
@@ -514,76 +626,71 @@ def cmd_ingest(args) -> int:
     if store is None:
         return 1
 
-    # Find all supported files in source directory
+    # Find all supported files (markdown plus handler-supported json and
+    # scripts) in one walk of the source tree
     source_path = Path(source_dir)
-    files = []
-    files.extend(source_path.glob("*.md"))
-    files.extend(source_path.glob("**/*.md"))
-
-    # Include handler-supported extensions (json + scripts)
-    for ext in HandlerFactory.list_supported_extensions():
-        files.extend(source_path.glob(f"*{ext}"))
-        files.extend(source_path.glob(f"**/*{ext}"))
-
-    # De-duplicate
-    files = list({str(p): p for p in files}.values())
+    suffixes = {".md", *HandlerFactory.list_supported_extensions()}
+    files = sorted(p for p in source_path.rglob("*") if p.suffix in suffixes)
 
     if not files:
         print(f"No supported files found in {source_dir}")
         return 0
 
-    # Parse and store each file
-    detector = FormatDetector()
-    parser = Parser()
+    from core.supabase_store import CircuitOpen
+
+    # Parse each file, then store them in batches: one bulk upsert per
+    # INGEST_BATCH_SIZE files instead of one request per file and section
     ingested_count = 0
+    pending = []
 
-    for file_path in files:
+    def flush() -> bool:
+        """Store the pending files; False if Supabase is refusing writes."""
+        nonlocal ingested_count
+        batch = pending[:]
+        pending.clear()
         try:
-            with open(file_path) as f:
-                content = f.read()
-
-            # Try handler first for supported component/script files
-            handler = None
-            try:
-                if HandlerFactory.is_supported(str(file_path)):
-                    handler = HandlerFactory.create_handler(str(file_path))
-            except (ValueError, FileNotFoundError):
-                handler = None
+            file_ids = store.store_files_bulk_with_retry(
+                [meta for _, meta, _ in batch],
+                [sections for _, _, sections in batch],
+            )
+        except CircuitOpen as e:
+            print(f"Error: {e}; stopping early", file=sys.stderr)
+            return False
+        except Exception as e:
+            for file_path, _, _ in batch:
+                print(f"Error processing {file_path}: {e}", file=sys.stderr)
+            return True
+        for (file_path, _, _), file_id in zip(batch, file_ids):
+            print(f"Stored: {file_path.name} (ID: {file_id})")
+        ingested_count += len(batch)
+        return True
+
+    # Parsing is CPU-bound and independent per file, so it runs on worker
+    # processes; results come back in order and are stored from here
+    paths = [str(file_path) for file_path in files]
+    workers = os.cpu_count() or 1
+    executor = None
+    if workers == 1 or len(paths) < INGEST_PARALLEL_MIN_FILES:
+        results = map(_parse_for_ingest, paths)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_parse_for_ingest, paths, chunksize=8)
 
-            if handler:
-                doc = handler.parse()
-            else:
-                # Detect format and type
-                file_type, file_format = detector.detect(str(file_path), content)
-                # Parse
-                doc = parser.parse(str(file_path), content, file_type, file_format)
-
-            # Compute hash
-            related_paths = []
-            if handler and hasattr(handler, "get_related_files"):
-                related_paths = handler.get_related_files()
-            if related_paths:
-                content_hash = compute_combined_hash(str(file_path), related_paths)
-            else:
-                content_hash = compute_file_hash(str(file_path))
-            if not content_hash:
-                print(f"Warning: Could not compute hash for {file_path}", file=sys.stderr)
+    try:
+        for file_path, (meta, sections) in zip(files, results):
+            if meta is None:
+                print(sections, file=sys.stderr)
                 continue
+            pending.append((file_path, meta, sections))
 
-            # Store in Supabase
-            file_id = store.store_file(
-                storage_path=str(file_path),
-                name=file_path.stem,
-                doc=doc,
-                content_hash=content_hash
-            )
-
-            print(f"Stored: {file_path.name} (ID: {file_id})")
-            ingested_count += 1
+            if len(pending) >= INGEST_BATCH_SIZE and not flush():
+                return 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}", file=sys.stderr)
-            continue
+    if pending and not flush():
+        return 1
 
     print(f"\nIngested {ingested_count} files successfully")
     return 0
@@ -591,6 +698,9 @@ def cmd_ingest(args) -> int:
 
 def cmd_checkout(args) -> int:
     """Checkout file to target path."""
+    from core.database import DatabaseStore
+    from core.checkout_manager import CheckoutManager
+
     file_id = args.file_id
     target_path = args.target_path
     user = args.user
@@ -642,6 +752,9 @@ def cmd_checkout(args) -> int:
 
 def cmd_checkin(args) -> int:
     """Checkin file from target path."""
+    from core.database import DatabaseStore
+    from core.checkout_manager import CheckoutManager
+
     target_path = args.target_path
     db_path = getattr(args, 'db', None)
 
@@ -675,6 +788,8 @@ def cmd_checkin(args) -> int:
 
 def cmd_list_library(args) -> int:
     """List files in library."""
+    from core.database import DatabaseStore
+
     db_path = getattr(args, 'db', None)
 
     if db_path:
@@ -707,16 +822,15 @@ def cmd_list_library(args) -> int:
         if not files:
             print("No files in library")
             return 0
+        # One request for all checkouts instead of one per listed file
+        checked_out_ids = {c.get("file_id") for c in store.get_active_checkouts()}
         print(f"{'Name':<30} {'Type':<15} {'Storage Path':<50} {'Checkout Status':<20}")
         print("-" * 115)
         for file_data in files:
             name = file_data.get("name", "")
             file_type = file_data.get("type", "unknown")
             storage_path = file_data.get("storage_path", "")
-            active_checkouts = store.get_active_checkouts()
-            checkout_status = "checked out" if any(
-                c.get("file_id") == file_data.get("id") for c in active_checkouts
-            ) else "available"
+            checkout_status = "checked out" if file_data.get("id") in checked_out_ids else "available"
             print(f"{name:<30} {file_type:<15} {storage_path:<50} {checkout_status:<20}")
         return 0
     except Exception as e:
@@ -726,6 +840,8 @@ def cmd_list_library(args) -> int:
 
 def cmd_status(args) -> int:
     """Show active checkouts."""
+    from core.database import DatabaseStore
+
     db_path = getattr(args, 'db', None)
     user = getattr(args, 'user', None)
 
@@ -809,6 +925,8 @@ def cmd_search_library(args) -> int:
 
 def cmd_get_section(args) -> int:
     """Retrieve and display a single section by ID."""
+    from core.query import QueryAPI
+
     file_path = None
     section_id = None
     if args.section_id is None:
@@ -816,7 +934,7 @@ def cmd_get_section(args) -> int:
             section_id = int(args.section_id_or_file)
         except ValueError:
             print("Error: Section ID must be an integer", file=sys.stderr)
-            sys.exit(1)
+            return 1
     else:
         file_path = args.section_id_or_file
         section_id = args.section_id
@@ -828,26 +946,14 @@ def cmd_get_section(args) -> int:
 
         if section is None:
             print(f"Error: Section {section_id} not found", file=sys.stderr)
-            sys.exit(1)
+            return 1
 
         # Validate section belongs to file if file_path provided
         if file_path:
-            import sqlite3
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT f.path
-                    FROM sections s
-                    JOIN files f ON s.file_id = f.id
-                    WHERE s.id = ?
-                    """,
-                    (section_id,),
-                )
-                row = cursor.fetchone()
-                if not row or row["path"] != file_path:
-                    print(f"Error: Section {section_id} does not belong to {file_path}", file=sys.stderr)
-                    sys.exit(1)
+            row = query_api.conn.execute(_SQL_SECTION_ROW, (section_id,)).fetchone()
+            if not row or row["path"] != file_path:
+                print(f"Error: Section {section_id} does not belong to {file_path}", file=sys.stderr)
+                return 1
 
         # Display section
         print(f"Section {section_id}: {section.title}")
@@ -859,11 +965,13 @@ def cmd_get_section(args) -> int:
         return 0
     except Exception as e:
         print(f"Error retrieving section: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 
 def cmd_next(args) -> int:
     """Retrieve and display the next section after given ID."""
+    from core.query import QueryAPI
+
     file_path = args.file
     section_id = args.section_id
     first_child = getattr(args, 'child', False)
@@ -894,6 +1002,8 @@ def cmd_next(args) -> int:
 
 def cmd_list_sections(args) -> int:
     """List all sections in a file with IDs and titles."""
+    from core.query import QueryAPI
+
     file_path = args.file
     db_path = args.db or get_default_db_path()
 
@@ -905,51 +1015,32 @@ def cmd_list_sections(args) -> int:
             print(f"No sections found for file: {file_path}")
             return 0
 
-        id_map = _build_section_id_map(db_path, file_path)
-
         # Display sections in tree format
         print(f"File: {file_path}")
         print()
-        _print_sections_with_ids(sections, indent=0, id_map=id_map)
+        _print_sections_with_ids(sections, indent=0)
 
         return 0
     except Exception as e:
         print(f"Error listing sections: {e}", file=sys.stderr)
-        sys.exit(1)
-
-
-def _build_section_id_map(db_path: str, file_path: str) -> dict:
-    """Build a mapping from section identity to ID for a specific file."""
-    import sqlite3
-    id_map = {}
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            """
-            SELECT s.id, s.title, s.level, s.line_start, s.line_end
-            FROM sections s
-            JOIN files f ON s.file_id = f.id
-            WHERE f.path = ?
-            """,
-            (file_path,),
-        )
-        for row in cursor.fetchall():
-            key = (row["title"], row["level"], row["line_start"], row["line_end"])
-            id_map[key] = row["id"]
-    return id_map
+        return 1
 
 
-def _print_sections_with_ids(sections, indent: int, id_map: dict) -> None:
-    """Print sections with IDs in tree format."""
-    for section in sections:
-        prefix = "  " * indent
+def _print_sections_with_ids(sections, indent: int) -> None:
+    """Print sections loaded from the database with their IDs in tree format."""
+    # Same traversal and single write as _print_sections
+    lines = []
+    stack = [(section, indent) for section in reversed(sections)]
+    while stack:
+        section, depth = stack.pop()
+        prefix = "  " * depth
         level_indicator = "#" * section.level
-        key = (section.title, section.level, section.line_start, section.line_end)
-        section_id = id_map.get(key, "?")
-        print(f"{prefix}{level_indicator} [{section_id}] {section.title}")
+        section_id = section.id if section.id is not None else "?"
+        lines.append(f"{prefix}{level_indicator} [{section_id}] {section.title}")
 
-        if section.children:
-            _print_sections_with_ids(section.children, indent + 1, id_map)
+        stack.extend((child, depth + 1) for child in reversed(section.children))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_compose(args) -> int:
@@ -1045,8 +1136,76 @@ def cmd_compose(args) -> int:
         return 1
 
 
+def _semantic_search_enabled() -> bool:
+    """True if ENABLE_EMBEDDINGS is on; otherwise say the keyword fallback is used."""
+    if os.getenv('ENABLE_EMBEDDINGS', 'false') != 'true':
+        print("Info: Embeddings not enabled. Set ENABLE_EMBEDDINGS=true to use vector search", file=sys.stderr)
+        print("Falling back to keyword search...", file=sys.stderr)
+        return False
+    return True
+
+
+def _get_hybrid_search(args, query_api):
+    """Build the HybridSearch used by the semantic commands, or None (error printed)."""
+    from core.hybrid_search import HybridSearch
+    from core.embedding_service import EmbeddingService
+
+    use_sm = not getattr(args, 'no_use_secret_manager', False)
+    secrets_cfg = getattr(args, 'secrets_config', None)
+    supabase_store = _get_supabase_store(use_secret_manager=use_sm, secrets_config=secrets_cfg)
+    if not supabase_store:
+        print("Error: Supabase credentials required for semantic search", file=sys.stderr)
+        return None
+
+    openai_key = os.getenv('OPENAI_API_KEY')
+    if not openai_key:
+        print("Error: OPENAI_API_KEY required for semantic search", file=sys.stderr)
+        return None
+
+    embedding_service = EmbeddingService(openai_key)
+    return HybridSearch(embedding_service, supabase_store, query_api)
+
+
+def _print_keyword_results(query_api, query: str) -> None:
+    """Print keyword search results for the semantic commands' fallback."""
+    results = query_api.search_sections(query)
+    if not results:
+        print(f"No sections found matching '{query}'")
+        return
+
+    print(f"Found {len(results)} section(s) matching '{query}' (keyword search):")
+    print()
+    print(f"{'ID':<6} {'Title':<40} {'Level':<6} {'File':<50}")
+    print("-" * 110)
+    for section_id, section in results:
+        row = query_api.conn.execute(_SQL_SECTION_ROW, (section_id,)).fetchone()
+        path = row["path"] if row else "unknown"
+        title = section.title[:37] + "..." if len(section.title) > 40 else section.title
+        file_display = path[:47] + "..." if len(path) > 50 else path
+        print(f"{section_id:<6} {title:<40} {section.level:<6} {file_display:<50}")
+
+
+def _print_semantic_results(query_api, query: str, results, vector_weight: float) -> None:
+    """Print hybrid search results as (score, id, title, level) rows."""
+    if not results:
+        print(f"No sections found matching '{query}'")
+        return
+
+    print(f"Found {len(results)} section(s) matching '{query}' (semantic search, weight={vector_weight}):")
+    print()
+    print(f"{'Score':<8} {'ID':<6} {'Title':<40} {'Level':<6}")
+    print("-" * 62)
+    for section_id, score in results:
+        row = query_api.conn.execute(_SQL_SECTION_ROW, (section_id,)).fetchone()
+        if row:
+            title = row["title"][:37] + "..." if len(row["title"]) > 40 else row["title"]
+            print(f"{score:<8.2f} {section_id:<6} {title:<40} {row['level']:<6}")
+
+
 def cmd_search_semantic(args) -> int:
     """Search sections using semantic similarity (vector search)."""
+    from core.query import QueryAPI
+
     _ensure_supabase_imports()
 
     query = args.query
@@ -1060,68 +1219,101 @@ def cmd_search_semantic(args) -> int:
         return 1
 
     try:
-        # Check if embeddings are enabled
-        import os
-        if os.getenv('ENABLE_EMBEDDINGS', 'false') != 'true':
-            print("Info: Embeddings not enabled. Set ENABLE_EMBEDDINGS=true to use vector search", file=sys.stderr)
-            print("Falling back to keyword search...", file=sys.stderr)
-            # Fall back to keyword search
-            from core.query import QueryAPI
-            query_api = QueryAPI(db_path)
-            results = query_api.search_sections(query)
-            if not results:
-                print(f"No sections found matching '{query}'")
-                return 0
+        query_api = QueryAPI(db_path)
 
-            print(f"Found {len(results)} section(s) matching '{query}' (keyword search):")
-            print()
-            print(f"{'ID':<6} {'Title':<40} {'Level':<6} {'File':<50}")
-            print("-" * 110)
-            for section_id, section, path in results:
-                title = section.title[:37] + "..." if len(section.title) > 40 else section.title
-                file_display = path[:47] + "..." if len(path) > 50 else path
-                print(f"{section_id:<6} {title:<40} {section.level:<6} {file_display:<50}")
+        # Check if embeddings are enabled
+        if not _semantic_search_enabled():
+            _print_keyword_results(query_api, query)
             return 0
 
         # Vector search enabled
-        from core.hybrid_search import HybridSearch
-        from core.query import QueryAPI
-
-        use_sm = not getattr(args, 'no_use_secret_manager', False)
-        secrets_cfg = getattr(args, 'secrets_config', None)
-        supabase_store = _get_supabase_store(use_secret_manager=use_sm, secrets_config=secrets_cfg)
-        if not supabase_store:
-            print("Error: Supabase credentials required for semantic search", file=sys.stderr)
+        hybrid = _get_hybrid_search(args, query_api)
+        if hybrid is None:
             return 1
 
-        # Get embedding service
-        from core.embedding_service import EmbeddingService
-        openai_key = os.getenv('OPENAI_API_KEY')
-        if not openai_key:
-            print("Error: OPENAI_API_KEY required for semantic search", file=sys.stderr)
+        # Perform hybrid search
+        results = hybrid.hybrid_search(query, limit, vector_weight)
+        _print_semantic_results(query_api, query, results, vector_weight)
+
+        return 0
+
+    except ImportError as e:
+        print(f"Error: Vector search components not available: {str(e)}", file=sys.stderr)
+        print("Ensure hybrid_search.py and embedding_service.py are implemented", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error performing semantic search: {str(e)}", file=sys.stderr)
+        return 1
+
+
+def cmd_search_semantic_batch(args) -> int:
+    """Run semantic search for each query in a file or on stdin, one query per line."""
+    from concurrent.futures import ThreadPoolExecutor
+    from core.query import QueryAPI
+
+    _ensure_supabase_imports()
+
+    limit = args.limit
+    vector_weight = args.vector_weight
+    db_path = args.db or get_default_db_path()
+
+    if not (0.0 <= vector_weight <= 1.0):
+        print("Error: vector_weight must be between 0.0 and 1.0", file=sys.stderr)
+        return 1
+
+    workers = getattr(args, 'workers', SEMANTIC_BATCH_WORKERS)
+    if workers < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        return 1
+
+    queries_file = getattr(args, 'queries_file', None)
+    if queries_file:
+        try:
+            with open(queries_file) as f:
+                queries = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"Error: Cannot read queries file: {e}", file=sys.stderr)
             return 1
+    else:
+        queries = [line.strip() for line in sys.stdin if line.strip()]
+    if not queries:
+        print("Error: No queries given", file=sys.stderr)
+        return 1
 
-        embedding_service = EmbeddingService(openai_key)
+    try:
         query_api = QueryAPI(db_path)
-        hybrid = HybridSearch(embedding_service, supabase_store, query_api)
 
-        # Perform hybrid search
-        results = hybrid.hybrid_search(query, limit, vector_weight)
-
-        if not results:
-            print(f"No sections found matching '{query}'")
+        if not _semantic_search_enabled():
+            for i, query in enumerate(queries):
+                if i:
+                    print()
+                _print_keyword_results(query_api, query)
             return 0
 
-        # Display results
-        print(f"Found {len(results)} section(s) matching '{query}' (semantic search, weight={vector_weight}):")
-        print()
-        print(f"{'Score':<8} {'ID':<6} {'Title':<40} {'Level':<6}")
-        print("-" * 62)
-        for section_id, score in results:
-            section = query_api.get_section(section_id)
-            if section:
-                title = section.title[:37] + "..." if len(section.title) > 40 else section.title
-                print(f"{score:<8.2f} {section_id:<6} {title:<40} {section.level:<6}")
+        hybrid = _get_hybrid_search(args, query_api)
+        if hybrid is None:
+            return 1
+
+        # One embeddings request for all queries (split only at the API's
+        # size and token limits) instead of one round-trip per query;
+        # rate-limit errors back off and retry
+        embeddings = hybrid.embedding_service.batch_generate_with_retry(queries)
+
+        def search(query_and_embedding):
+            query, query_embedding = query_and_embedding
+            return hybrid.hybrid_search(
+                query, limit, vector_weight, query_embedding=query_embedding
+            )
+
+        # Each search waits on a Supabase vector RPC, so a few run at once
+        # to overlap those round-trips; map() keeps results in query order
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            all_results = list(executor.map(search, zip(queries, embeddings)))
+
+        for i, (query, results) in enumerate(zip(queries, all_results)):
+            if i:
+                print()
+            _print_semantic_results(query_api, query, results, vector_weight)
 
         return 0
 
@@ -1136,6 +1328,8 @@ def cmd_search_semantic(args) -> int:
 
 def cmd_search_sections_query(args) -> int:
     """Search sections by query across all files or a specific file using FTS5 BM25 ranking."""
+    from core.query import QueryAPI
+
     query = args.query
     file_path = args.file if hasattr(args, 'file') and args.file else None
     db_path = args.db or get_default_db_path()
@@ -1157,37 +1351,32 @@ def cmd_search_sections_query(args) -> int:
         print(f"Found {len(ranked_results)} section(s) matching '{query}':")
         print()
 
+        # One prepared lookup per hit on QueryAPI's shared connection,
+        # rather than a new connection per section and per file path
+        conn = query_api.conn
         if file_path:
             print(f"{'ID':<6} {'Score':<8} {'Title':<40} {'Level':<6}")
             print("-" * 62)
             for section_id, score in ranked_results:
-                section = query_api.get_section(section_id)
-                if section:
-                    title = section.title[:37] + "..." if len(section.title) > 40 else section.title
-                    print(f"{section_id:<6} {score:<8.2f} {title:<40} {section.level:<6}")
+                row = conn.execute(_SQL_SECTION_ROW, (section_id,)).fetchone()
+                if row:
+                    title = row["title"][:37] + "..." if len(row["title"]) > 40 else row["title"]
+                    print(f"{section_id:<6} {score:<8.2f} {title:<40} {row['level']:<6}")
         else:
-            import sqlite3
             print(f"{'ID':<6} {'Score':<8} {'Title':<40} {'Level':<6} {'File':<50}")
             print("-" * 113)
             for section_id, score in ranked_results:
-                section = query_api.get_section(section_id)
-                if section:
-                    title = section.title[:37] + "..." if len(section.title) > 40 else section.title
-                    # Get file path
-                    with sqlite3.connect(db_path) as conn:
-                        cursor = conn.execute(
-                            "SELECT f.path FROM sections s JOIN files f ON s.file_id = f.id WHERE s.id = ?",
-                            (section_id,)
-                        )
-                        row = cursor.fetchone()
-                        path = row[0] if row else "unknown"
+                row = conn.execute(_SQL_SECTION_ROW, (section_id,)).fetchone()
+                if row:
+                    title = row["title"][:37] + "..." if len(row["title"]) > 40 else row["title"]
+                    path = row["path"]
                     file_display = path[:47] + "..." if len(path) > 50 else path
-                    print(f"{section_id:<6} {score:<8.2f} {title:<40} {section.level:<6} {file_display:<50}")
+                    print(f"{section_id:<6} {score:<8.2f} {title:<40} {row['level']:<6} {file_display:<50}")
 
         return 0
     except Exception as e:
         print(f"Error searching sections: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 
 def cmd_backup(args) -> int:
@@ -1254,6 +1443,9 @@ def cmd_restore(args) -> int:
 
 def main() -> int:
     """Main CLI entry point."""
+    # Resolved once for every --db default below; it stats the home dir
+    default_db = get_default_db_path()
+
     parser = argparse.ArgumentParser(
         description="skill-split - Intelligent Markdown/YAML Section Splitter",
         prog="skill-split",
@@ -1280,7 +1472,10 @@ def main() -> int:
     )
     store_parser.add_argument("file", help="Path to the file to store")
     store_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+    )
+    store_parser.add_argument(
+        "--force", action="store_true", help="Parse and store again even if the file is unchanged"
     )
     store_parser.set_defaults(func=cmd_store)
 
@@ -1290,7 +1485,7 @@ def main() -> int:
     )
     get_parser.add_argument("file", help="Path to the file to retrieve")
     get_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     get_parser.set_defaults(func=cmd_get)
 
@@ -1300,7 +1495,7 @@ def main() -> int:
     )
     tree_parser.add_argument("file", help="Path to the file")
     tree_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     tree_parser.set_defaults(func=cmd_tree)
 
@@ -1310,7 +1505,10 @@ def main() -> int:
     )
     verify_parser.add_argument("file", help="Path to the file to verify")
     verify_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+    )
+    verify_parser.add_argument(
+        "--force", action="store_true", help="Parse and store again even if the file is unchanged"
     )
     verify_parser.set_defaults(func=cmd_verify)
 
@@ -1381,7 +1579,7 @@ def main() -> int:
     get_section_parser.add_argument("section_id_or_file", help="Section ID or file path")
     get_section_parser.add_argument("section_id", nargs="?", type=int, help="Section ID if file path provided")
     get_section_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     get_section_parser.set_defaults(func=cmd_get_section)
 
@@ -1397,7 +1595,7 @@ def main() -> int:
         help="Navigate to first child subsection instead of next sibling"
     )
     next_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     next_parser.set_defaults(func=cmd_next)
 
@@ -1407,7 +1605,7 @@ def main() -> int:
     )
     list_sections_parser.add_argument("file", help="Path to the file")
     list_sections_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     list_sections_parser.set_defaults(func=cmd_list_sections)
 
@@ -1420,7 +1618,7 @@ def main() -> int:
         "--file", default=None, help="Limit search to specific file (optional)"
     )
     search_sections_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     search_sections_parser.set_defaults(func=cmd_search_sections_query)
 
@@ -1438,7 +1636,7 @@ def main() -> int:
     compose_parser.add_argument("--no-use-secret-manager", action="store_true", help="Disable SecretManager for this command")
     compose_parser.add_argument("--secrets-config", default=None, help="Path to secrets config file")
     compose_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     compose_parser.set_defaults(func=cmd_compose)
 
@@ -1452,10 +1650,28 @@ def main() -> int:
     search_semantic_parser.add_argument("--no-use-secret-manager", action="store_true", help="Disable SecretManager for this command")
     search_semantic_parser.add_argument("--secrets-config", default=None, help="Path to secrets config file")
     search_semantic_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     search_semantic_parser.set_defaults(func=cmd_search_semantic)
 
+    # Search-semantic-batch command (many queries, one embeddings request)
+    search_semantic_batch_parser = subparsers.add_parser(
+        "search-semantic-batch", help="Semantic search for each query in a file or on stdin (one per line)"
+    )
+    search_semantic_batch_parser.add_argument("--queries-file", default=None, help="File with one query per line (default: read stdin)")
+    search_semantic_batch_parser.add_argument(
+        "--workers", type=int, default=SEMANTIC_BATCH_WORKERS,
+        help=f"Searches run concurrently (default: {SEMANTIC_BATCH_WORKERS})"
+    )
+    search_semantic_batch_parser.add_argument("--limit", type=int, default=10, help="Max results per query (default: 10)")
+    search_semantic_batch_parser.add_argument("--vector-weight", type=float, default=0.7, help="Vector score weight (0.0-1.0, default: 0.7)")
+    search_semantic_batch_parser.add_argument("--no-use-secret-manager", action="store_true", help="Disable SecretManager for this command")
+    search_semantic_batch_parser.add_argument("--secrets-config", default=None, help="Path to secrets config file")
+    search_semantic_batch_parser.add_argument(
+        "--db", default=default_db, help="Path to database (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+    )
+    search_semantic_batch_parser.set_defaults(func=cmd_search_semantic_batch)
+
     # Backup command
     backup_parser = subparsers.add_parser(
         "backup", help="Create a database backup"
@@ -1464,7 +1680,7 @@ def main() -> int:
         "--filename", "-f", help="Optional backup filename (default: auto-generated timestamp)"
     )
     backup_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Path to database to backup (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Path to database to backup (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     backup_parser.set_defaults(func=cmd_backup)
 
@@ -1474,7 +1690,7 @@ def main() -> int:
     )
     restore_parser.add_argument("backup_file", help="Path to backup file (.sql.gz)")
     restore_parser.add_argument(
-        "--db", default=get_default_db_path(), help="Target database path (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
+        "--db", default=default_db, help="Target database path (default: env SKILL_SPLIT_DB or ~/.claude/databases/skill-split.db)"
     )
     restore_parser.add_argument(
         "--overwrite", "-o", action="store_true", help="Overwrite existing database"
@@ -90,7 +90,7 @@ Test skill content
 
         # Mock SupabaseStore
         monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_supabase_store)
-        mock_supabase_store.store_file.return_value = str(uuid4())
+        mock_supabase_store.store_files_bulk_with_retry.return_value = [str(uuid4())]
 
         # Import the command function
         from skill_split import cmd_ingest
@@ -106,8 +106,11 @@ Test skill content
         # Should succeed with return code 0
         assert result == 0
 
-        # Should have called store_file at least once
-        assert mock_supabase_store.store_file.called
+        # Should have stored the file in one bulk call
+        mock_supabase_store.store_files_bulk_with_retry.assert_called_once()
+        metas, sections = mock_supabase_store.store_files_bulk_with_retry.call_args.args
+        assert [meta.path for meta in metas] == [str(skill_file)]
+        assert "Overview" in [section.title for section in sections[0]]
 
     def test_ingest_command_prints_count(self, temp_skill_dir, mock_supabase_store, monkeypatch, capsys):
         """Test that ingest command prints count of stored files."""
@@ -117,7 +120,7 @@ Test skill content
 
         # Mock SupabaseStore
         monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_supabase_store)
-        mock_supabase_store.store_file.return_value = str(uuid4())
+        mock_supabase_store.store_files_bulk_with_retry.return_value = [str(uuid4()), str(uuid4())]
 
         from skill_split import cmd_ingest
 
@@ -129,6 +132,91 @@ Test skill content
         # Should print that files were ingested
         assert "ingested" in captured.out.lower() or "stored" in captured.out.lower()
 
+    def test_ingest_command_batches_bulk_stores(self, temp_skill_dir, mock_supabase_store, monkeypatch):
+        """Test that ingest sends one bulk store per INGEST_BATCH_SIZE files."""
+        monkeypatch.setenv('SUPABASE_URL', 'https://test.supabase.co')
+        monkeypatch.setenv('SUPABASE_KEY', 'test-key')
+        monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_supabase_store)
+        monkeypatch.setattr('skill_split.INGEST_BATCH_SIZE', 1)
+        mock_supabase_store.store_files_bulk_with_retry.return_value = [str(uuid4())]
+
+        from skill_split import cmd_ingest
+
+        result = cmd_ingest(argparse.Namespace(source_dir=str(temp_skill_dir)))
+
+        assert result == 0
+        assert mock_supabase_store.store_files_bulk_with_retry.call_count == 2
+        mock_supabase_store.store_file.assert_not_called()
+
+    def test_ingest_command_parses_on_worker_processes(self, temp_skill_dir, mock_supabase_store, monkeypatch):
+        """Test that parsing on a process pool stores the same files in order."""
+        monkeypatch.setenv('SUPABASE_URL', 'https://test.supabase.co')
+        monkeypatch.setenv('SUPABASE_KEY', 'test-key')
+        monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_supabase_store)
+        monkeypatch.setattr('skill_split.INGEST_PARALLEL_MIN_FILES', 1)
+        monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+        mock_supabase_store.store_files_bulk_with_retry.return_value = [str(uuid4()), str(uuid4())]
+
+        from skill_split import cmd_ingest
+
+        result = cmd_ingest(argparse.Namespace(source_dir=str(temp_skill_dir)))
+
+        assert result == 0
+        metas, sections = mock_supabase_store.store_files_bulk_with_retry.call_args.args
+        assert [Path(meta.path).name for meta in metas] == ["test_skill_1.md", "test_skill_2.md"]
+        assert all(meta.hash for meta in metas)
+        assert "Examples" in [section.title for section in sections[0]]
+
+
+class TestStoreCommand:
+    """Test the store command."""
+
+    def test_store_skips_unchanged_file(self, temp_skill_dir, tmp_path, monkeypatch, capsys):
+        """Test that storing an unchanged file again skips the parse, unless forced."""
+        from skill_split import cmd_store
+        from core.parser import Parser
+
+        skill = str(temp_skill_dir / "test_skill_1.md")
+        db = str(tmp_path / "store.db")
+        args = argparse.Namespace(file=skill, db=db, force=False)
+        assert cmd_store(args) == 0
+        capsys.readouterr()
+
+        parse_calls = []
+        original_parse = Parser.parse
+        monkeypatch.setattr(Parser, "parse", lambda self, *a: parse_calls.append(a) or original_parse(self, *a))
+
+        assert cmd_store(args) == 0
+        assert "Unchanged since last store" in capsys.readouterr().out
+        assert parse_calls == []
+
+        assert cmd_store(argparse.Namespace(file=skill, db=db, force=True)) == 0
+        assert "Unchanged" not in capsys.readouterr().out
+        assert len(parse_calls) == 1
+
+
+class TestVerifyCommand:
+    """Test the verify command."""
+
+    def test_verify_reuses_hash_for_round_trip(self, temp_skill_dir, tmp_path, monkeypatch, capsys):
+        """Test that verify hands its file hash to the validator instead of rehashing the file."""
+        from skill_split import cmd_verify
+        from core.hashing import compute_file_hash
+
+        skill = str(temp_skill_dir / "test_skill_1.md")
+        expected_hash = compute_file_hash(skill)
+
+        def fail(path):
+            raise AssertionError("validator re-read the file")
+
+        monkeypatch.setattr("core.validator.compute_file_hash", fail)
+
+        args = argparse.Namespace(file=skill, db=str(tmp_path / "verify.db"), force=False)
+        assert cmd_verify(args) == 0
+        out = capsys.readouterr().out
+        assert "Valid" in out
+        assert f"original_hash:    {expected_hash}" in out
+
 
 class TestCheckoutCommand:
     """Test the checkout command."""
@@ -144,7 +232,7 @@ class TestCheckoutCommand:
 
         # Mock CheckoutManager
         mock_checkout_manager = MagicMock()
-        monkeypatch.setattr('skill_split.CheckoutManager', lambda *args, **kwargs: mock_checkout_manager)
+        monkeypatch.setattr('core.checkout_manager.CheckoutManager', lambda *args, **kwargs: mock_checkout_manager)
         monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_supabase_store)
 
         # Mock the checkout operation
@@ -169,8 +257,8 @@ class TestCheckoutCommand:
         mock_manager = MagicMock()
         mock_manager.checkout_file.return_value = target_path
 
-        monkeypatch.setattr("skill_split.DatabaseStore", lambda *args, **kwargs: mock_store)
-        monkeypatch.setattr("skill_split.CheckoutManager", lambda *args, **kwargs: mock_manager)
+        monkeypatch.setattr("core.database.DatabaseStore", lambda *args, **kwargs: mock_store)
+        monkeypatch.setattr("core.checkout_manager.CheckoutManager", lambda *args, **kwargs: mock_manager)
 
         from skill_split import cmd_checkout
 
@@ -247,6 +335,30 @@ class TestListCommand:
         captured = capsys.readouterr()
         assert "test-skill" in captured.out
 
+    def test_list_command_fetches_checkouts_once(self, monkeypatch, capsys):
+        """Test that checkout status comes from a single get_active_checkouts call."""
+        monkeypatch.setenv('SUPABASE_URL', 'https://test.supabase.co')
+        monkeypatch.setenv('SUPABASE_KEY', 'test-key')
+
+        mock_store = MagicMock()
+        monkeypatch.setattr('skill_split.SupabaseStore', lambda *args, **kwargs: mock_store)
+
+        mock_store.get_all_files.return_value = [
+            {'id': 'f1', 'name': 'alpha', 'type': 'skill', 'storage_path': '/skills/a.md'},
+            {'id': 'f2', 'name': 'beta', 'type': 'skill', 'storage_path': '/skills/b.md'},
+        ]
+        mock_store.get_active_checkouts.return_value = [{'file_id': 'f2'}]
+
+        from skill_split import cmd_list_library
+
+        result = cmd_list_library(argparse.Namespace())
+
+        assert result == 0
+        mock_store.get_active_checkouts.assert_called_once_with()
+        lines = capsys.readouterr().out.splitlines()
+        assert "available" in next(line for line in lines if line.startswith("alpha"))
+        assert "checked out" in next(line for line in lines if line.startswith("beta"))
+
 
 class TestStatusCommand:
     """Test the status command."""
@@ -314,3 +426,61 @@ class TestSearchCommand:
         assert result == 0
         captured = capsys.readouterr()
         assert "test-skill" in captured.out
+
+
+class TestSearchSemanticBatchCommand:
+    """Test the search-semantic-batch command."""
+
+    def test_embeds_all_queries_in_one_batch(self, tmp_path, monkeypatch, capsys):
+        """Test that queries from stdin are embedded together and searched with those vectors."""
+        import io
+        import skill_split
+        from skill_split import cmd_search_semantic_batch
+
+        monkeypatch.setenv("ENABLE_EMBEDDINGS", "true")
+        monkeypatch.setattr("sys.stdin", io.StringIO("first query\n\nsecond query\n"))
+
+        hybrid = MagicMock()
+        hybrid.embedding_service.batch_generate_with_retry.return_value = [[0.1], [0.2]]
+        hybrid.hybrid_search.return_value = []
+        monkeypatch.setattr(skill_split, "_get_hybrid_search", lambda args, query_api: hybrid)
+
+        args = argparse.Namespace(limit=5, vector_weight=0.7, db=str(tmp_path / "semantic.db"))
+        assert cmd_search_semantic_batch(args) == 0
+
+        hybrid.embedding_service.batch_generate_with_retry.assert_called_once_with(["first query", "second query"])
+        assert [c.kwargs["query_embedding"] for c in hybrid.hybrid_search.call_args_list] == [[0.1], [0.2]]
+        out = capsys.readouterr().out
+        assert "No sections found matching 'first query'" in out
+        assert "No sections found matching 'second query'" in out
+
+    def test_concurrent_searches_print_in_query_order(self, tmp_path, monkeypatch, capsys):
+        """Test that queries from --queries-file searched on several workers print in file order."""
+        import time
+        import skill_split
+        from skill_split import cmd_search_semantic_batch
+
+        monkeypatch.setenv("ENABLE_EMBEDDINGS", "true")
+        queries = [f"query {i}" for i in range(4)]
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("\n".join(queries) + "\n")
+
+        def slow_first(query, limit, vector_weight, query_embedding=None):
+            # Earlier queries finish last
+            time.sleep(0.01 * (4 - int(query.split()[1])))
+            return []
+
+        hybrid = MagicMock()
+        hybrid.embedding_service.batch_generate_with_retry.return_value = [[0.0]] * 4
+        hybrid.hybrid_search.side_effect = slow_first
+        monkeypatch.setattr(skill_split, "_get_hybrid_search", lambda args, query_api: hybrid)
+
+        args = argparse.Namespace(
+            limit=5, vector_weight=0.7, db=str(tmp_path / "semantic.db"),
+            queries_file=str(queries_file), workers=4,
+        )
+        assert cmd_search_semantic_batch(args) == 0
+
+        out = capsys.readouterr().out
+        positions = [out.index(f"matching '{query}'") for query in queries]
+        assert positions == sorted(positions)
@@ -61,6 +61,11 @@ class TestSchemaCreation:
             )
             assert cursor.fetchone() is not None, "idx_sections_parent index should exist"
 
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_sections_file_line'"
+            )
+            assert cursor.fetchone() is not None, "idx_sections_file_line index should exist"
+
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_files_path'"
             )
@@ -81,6 +86,19 @@ class TestSchemaCreation:
             # Just verify that foreign keys are supported (they should be in SQLite 3.x)
             assert fk_setting in (0, 1), "foreign keys pragma should be queryable"
 
+    def test_connections_use_wal_and_normal_sync(self):
+        """Schema setup switches to WAL; every store connection is tuned."""
+        with sqlite3.connect(self.temp_db.name) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        conn = self.store._connect()
+        try:
+            # 1 == NORMAL (FULL, the default, is 2)
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        finally:
+            conn.close()
+
 
 class TestStoreAndRetrieve:
     """Test storing and retrieving files."""
@@ -146,6 +164,72 @@ class TestStoreAndRetrieve:
         assert sections[0].level == 0, "first section should be orphaned (blank line)"
         assert sections[1].title == "Test Skill", "second section should be 'Test Skill'"
 
+    def test_get_file_summary(self):
+        """Summary reports id, hash and nested section count without loading sections."""
+        content = self._load_fixture("simple_skill.md")
+        file_path = "/skills/test-skill/SKILL.md"
+        file_type, file_format = self.detector.detect(file_path, content)
+        doc = self.parser.parse(file_path, content, file_type, file_format)
+        content_hash = self._compute_hash(content)
+
+        assert self.store.get_file_summary(file_path) is None
+
+        file_id = self.store.store_file(file_path, doc, content_hash)
+        _, sections = self.store.get_file(file_path)
+
+        def count(nodes):
+            return sum(1 + count(node.children) for node in nodes)
+
+        assert self.store.get_file_summary(file_path) == {
+            "id": file_id,
+            "hash": content_hash,
+            "sections": count(sections),
+        }
+
+    def test_get_file_with_sections(self):
+        """One lookup tells a missing file from an empty one and returns the tree."""
+        content = self._load_fixture("simple_skill.md")
+        file_path = "/skills/test-skill/SKILL.md"
+        file_type, file_format = self.detector.detect(file_path, content)
+        doc = self.parser.parse(file_path, content, file_type, file_format)
+
+        assert self.store.get_file_with_sections(file_path) is None
+
+        file_id = self.store.store_file(file_path, doc, self._compute_hash(content))
+        found_id, sections = self.store.get_file_with_sections(file_path)
+        assert found_id == file_id
+        assert [s.title for s in sections] == [
+            s.title for s in self.store.get_section_tree(file_path)
+        ]
+
+        empty = ParsedDocument(
+            frontmatter="", sections=[], file_type=FileType.REFERENCE,
+            format=FileFormat.MARKDOWN_HEADINGS, original_path="/empty.md",
+        )
+        empty_id = self.store.store_file("/empty.md", empty, "h")
+        assert self.store.get_file_with_sections("/empty.md") == (empty_id, [])
+
+    def test_section_tree_carries_ids(self):
+        """Sections loaded as a tree carry their row IDs."""
+        content = self._load_fixture("simple_skill.md")
+        file_path = "/skills/test-skill/SKILL.md"
+        file_type, file_format = self.detector.detect(file_path, content)
+        doc = self.parser.parse(file_path, content, file_type, file_format)
+        self.store.store_file(file_path, doc, self._compute_hash(content))
+
+        tree_ids = []
+        stack = list(self.store.get_section_tree(file_path))
+        while stack:
+            section = stack.pop()
+            tree_ids.append(section.id)
+            stack.extend(section.children)
+
+        listed_ids = [section_id for section_id, _, _ in self.store.list_sections(file_path)]
+        assert sorted(tree_ids) == sorted(listed_ids)
+
+        # IDs don't affect equality with freshly parsed sections
+        assert self.store.get_section_tree(file_path)[0] == doc.sections[0]
+
     def test_store_duplicate_path_updates(self):
         """Storing same path twice should UPDATE not INSERT."""
         content = self._load_fixture("simple_skill.md")
@@ -211,6 +295,89 @@ class TestStoreAndRetrieve:
                     break
         assert found_new, "new section should be present"
 
+    def _flatten(self, sections):
+        """Flatten a section tree to comparable (level, title, content, depth) tuples."""
+        flat = []
+
+        def walk(items, depth):
+            for section in items:
+                flat.append((section.level, section.title, section.content, depth))
+                walk(section.children, depth + 1)
+
+        walk(sections, 0)
+        return flat
+
+    def test_restore_keeps_fts_index_consistent(self):
+        """Re-storing a file replaces its FTS entries instead of leaving stale ones."""
+        def make_doc(word):
+            parent = Section(level=1, title="Parent", content=f"{word} parent", line_start=1, line_end=4)
+            parent.add_child(Section(level=2, title="Child", content=f"{word} child", line_start=3, line_end=4))
+            return ParsedDocument(
+                frontmatter="",
+                sections=[parent],
+                file_type=FileType.SKILL,
+                format=FileFormat.MARKDOWN_HEADINGS,
+                original_path="/test/fts.md"
+            )
+
+        self.store.store_file("/test/fts.md", make_doc("alpha"), "hash1")
+        self.store.store_file("/test/fts.md", make_doc("beta"), "hash2")
+
+        assert self.store.search_snippets("alpha") == []
+        assert len(self.store.search_snippets("beta")) == 2
+
+        with sqlite3.connect(self.store.db_path) as conn:
+            conn.execute("INSERT INTO sections_fts(sections_fts) VALUES('integrity-check')")
+            parent_id, child_parent = conn.execute(
+                "SELECT p.id, c.parent_id FROM sections p JOIN sections c ON c.parent_id = p.id"
+            ).fetchone()
+        assert parent_id == child_parent
+
+    def test_get_section_stats(self):
+        """Aggregates match the stored sections; an empty database is all zeros."""
+        assert self.store.get_section_stats() == {
+            "total_sections": 0, "files": 0, "total_content_bytes": 0
+        }
+
+        doc = ParsedDocument(
+            frontmatter="",
+            sections=[
+                Section(level=1, title="A", content="abcd", line_start=1, line_end=2),
+                Section(level=1, title="B", content="ef", line_start=3, line_end=4),
+            ],
+            file_type=FileType.SKILL,
+            format=FileFormat.MARKDOWN_HEADINGS,
+            original_path="/test/stats.md"
+        )
+        self.store.store_file("/test/stats.md", doc, "hash1")
+
+        assert self.store.get_section_stats() == {
+            "total_sections": 2, "files": 1, "total_content_bytes": 6
+        }
+
+    def test_get_files_bulk_matches_get_file(self):
+        """get_files_bulk returns the same data as per-file get_file calls."""
+        content = self._load_fixture("simple_skill.md")
+        paths = ["/skills/a/SKILL.md", "/skills/b/SKILL.md"]
+
+        file_ids = []
+        for file_path in paths:
+            file_type, file_format = self.detector.detect(file_path, content)
+            doc = self.parser.parse(file_path, content, file_type, file_format)
+            file_ids.append(self.store.store_file(file_path, doc, self._compute_hash(content)))
+
+        missing_id = max(file_ids) + 100
+        results = self.store.get_files_bulk(file_ids + [missing_id])
+
+        assert set(results) == set(file_ids), "missing ids should be skipped"
+        for file_id, file_path in zip(file_ids, paths):
+            metadata, sections = results[file_id]
+            expected_metadata, expected_sections = self.store.get_file(file_path)
+            assert metadata == expected_metadata
+            assert self._flatten(sections) == self._flatten(expected_sections)
+
+        assert self.store.get_files_bulk([]) == {}
+
 
 class TestSectionHierarchy:
     """Test section hierarchy preservation."""
@@ -567,6 +734,34 @@ class TestDatabaseStoreFTS5:
         # File-restricted results should be subset of all results
         assert len(file_results) <= len(all_results)
 
+    def test_search_snippets_limits_and_highlights(self):
+        """search_snippets returns at most `limit` rows with a marked snippet."""
+        from models import ParsedDocument, Section, FileType, FileFormat
+
+        sections = [
+            Section(level=1, title=f"Part {i}", content=f"Configure the widget number {i}",
+                    line_start=i, line_end=i)
+            for i in range(1, 6)
+        ]
+        doc = ParsedDocument(
+            frontmatter="",
+            sections=sections,
+            file_type=FileType.SKILL,
+            format=FileFormat.MARKDOWN_HEADINGS,
+            original_path="/test/snippets.md"
+        )
+        self.store.store_file("/test/snippets.md", doc, "hash1")
+
+        results = self.store.search_snippets("widget", limit=3)
+
+        assert len(results) == 3
+        section_id, score, title, snippet = results[0]
+        assert title.startswith("Part ")
+        assert "[widget]" in snippet
+        assert self.store.search_snippets("   ") == []
+        # Unbalanced quotes are escaped instead of raising a MATCH syntax error
+        assert len(self.store.search_snippets('"widget', limit=10)) == 5
+
 
 class TestFTS5QuerySyntax:
     """Test FTS5 MATCH query syntax behavior."""
@@ -650,6 +845,31 @@ class TestFTS5QuerySyntax:
         results = self.store.search_sections_with_rank("")
         assert results == []
 
+    def test_fts5_punctuation_does_not_raise(self):
+        """Punctuation in a query is matched literally, not parsed as syntax."""
+        from models import ParsedDocument, Section, FileType
+
+        doc = ParsedDocument(
+            frontmatter="",
+            sections=[
+                Section(level=1, title="Config", content="Edit config.json first", line_start=1, line_end=2),
+                Section(level=1, title="Call", content="Then run foo(bar) once", line_start=3, line_end=4),
+            ],
+            file_type=FileType.SKILL,
+            format=FileFormat.MARKDOWN_HEADINGS,
+            original_path="/test/punct.md"
+        )
+        self.store.store_file("/test/punct.md", doc, "test_hash")
+
+        for query in ("config.json", "foo(bar", "foo:bar", "config.json AND edit"):
+            self.store.search_sections(query)
+            self.store.search_sections_with_rank(query)
+            self.store.search_snippets(query)
+
+        assert [s.title for _, s in self.store.search_sections("config.json")] == ["Config"]
+        assert [s.title for _, s in self.store.search_sections("foo(bar")] == ["Call"]
+        assert len(self.store.search_sections_with_rank("config.json AND edit")) == 1
+
 
 class TestQueryPreprocessing:
     """Test FTS5 query preprocessing logic."""
@@ -722,6 +942,12 @@ class TestQueryPreprocessing:
         assert '"c++"' in result
         assert '"python"' in result
 
+    def test_single_word_with_punctuation_quoted(self):
+        """A single token holding non-word characters is quoted."""
+        assert DatabaseStore.preprocess_fts5_query("config.json") == '"config.json"'
+        assert DatabaseStore.preprocess_fts5_query("foo(bar") == '"foo(bar"'
+        assert DatabaseStore.preprocess_fts5_query("python_3") == "python_3"
+
     def test_preprocessing_in_search_sections_with_rank(self):
         """search_sections_with_rank applies preprocessing."""
         from models import ParsedDocument, Section, FileFormat
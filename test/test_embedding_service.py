@@ -35,6 +35,17 @@ class TestEmbeddingServiceBasic:
             with pytest.raises(ValueError, match="API key not found"):
                 EmbeddingService()
 
+    @patch('core.embedding_service.OpenAI')
+    def test_init_unknown_model(self, mock_openai):
+        """Test initialization fails for a model without pricing."""
+        mock_openai.return_value = MagicMock()
+
+        with pytest.raises(ValueError, match="Unknown embedding model"):
+            EmbeddingService(api_key="test-key", model="ada-002")
+
+        service = EmbeddingService(api_key="test-key", model="text-embedding-ada-002")
+        assert service.estimate_cost(1_000_000) == pytest.approx(0.10)
+
     @patch('core.embedding_service.OpenAI')
     def test_generate_embedding_success(self, mock_openai):
         """Test successful embedding generation."""
@@ -147,6 +158,27 @@ class TestBatchGeneration:
         assert mock_client.embeddings.create.call_count >= 1
 
 
+    @patch('core.embedding_service.OpenAI')
+    def test_batch_generate_falls_back_on_short_response(self, mock_openai):
+        """Test batch generation embeds texts one by one if the batch response is short."""
+        batch_response = MagicMock()
+        batch_response.data = [MagicMock(embedding=[0.0])]
+        batch_response.usage = MagicMock(prompt_tokens=10)
+        single_responses = [
+            MagicMock(data=[MagicMock(embedding=[float(i)])], usage=MagicMock(prompt_tokens=5))
+            for i in (1, 2)
+        ]
+
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = [batch_response, *single_responses]
+        mock_openai.return_value = mock_client
+
+        service = EmbeddingService(api_key="test-key")
+        results = service.batch_generate(["text1", "text2"])
+
+        assert results == [[1.0], [2.0]]
+        assert mock_client.embeddings.create.call_count == 3
+
 class TestCaching:
     """Test embedding caching functionality."""
 
@@ -231,13 +263,13 @@ class TestCostEstimation:
 
         service = EmbeddingService(api_key="test-key")
 
-        # 1M tokens should cost $0.00002 (text-embedding-3-small pricing)
+        # 1M tokens should cost $0.02 (text-embedding-3-small pricing)
         cost = service.estimate_cost(1_000_000)
-        assert cost == pytest.approx(0.00002, abs=0.000001)
+        assert cost == pytest.approx(0.02)
 
-        # 100k tokens should cost $0.000002
+        # 100k tokens should cost $0.002
         cost = service.estimate_cost(100_000)
-        assert cost == pytest.approx(0.000002, abs=0.0000001)
+        assert cost == pytest.approx(0.002)
 
     @patch('core.embedding_service.OpenAI')
     def test_estimate_tokens(self, mock_openai):
@@ -254,6 +286,30 @@ class TestCostEstimation:
         tokens = service.estimate_tokens("")
         assert tokens >= 1
 
+    @patch('core.embedding_service.tiktoken', None)
+    @patch('core.embedding_service.OpenAI')
+    def test_count_tokens_falls_back_without_tiktoken(self, mock_openai):
+        """Test count_tokens uses the rough estimate when tiktoken is missing."""
+        mock_openai.return_value = MagicMock()
+
+        service = EmbeddingService(api_key="test-key")
+
+        text = "a" * 1000
+        assert service.count_tokens(text) == service.estimate_tokens(text)
+
+    @patch('core.embedding_service.OpenAI')
+    def test_count_tokens_uses_model_encoding(self, mock_openai):
+        """Test count_tokens counts with the cached model encoding."""
+        mock_openai.return_value = MagicMock()
+
+        service = EmbeddingService(api_key="test-key")
+        service._encoding = MagicMock()
+        service._encoding_loaded = True
+        service._encoding.encode.return_value = [1, 2, 3]
+
+        assert service.count_tokens("some text") == 3
+        service._encoding.encode.assert_called_once_with("some text", disallowed_special=())
+
     @patch('core.embedding_service.OpenAI')
     def test_token_usage_tracking(self, mock_openai):
         """Test token usage accumulation."""
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from core.hashing import compute_file_hash
+from core.hashing import compute_file_hash, hash_and_read
 
 
 def test_valid_file_hashing():
@@ -78,8 +78,8 @@ def test_different_content_produces_different_hash():
 
 def test_large_file_chunked_reading():
     """Test that large files are read in chunks correctly."""
-    # Create content larger than the 4096 byte chunk size
-    content = b"x" * 10000
+    # Create content larger than the 1 MiB chunk size
+    content = b"x" * (3 * 1024 * 1024 + 17)
 
     with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmp:
         tmp.write(content)
@@ -92,3 +92,28 @@ def test_large_file_chunked_reading():
         assert result == expected
     finally:
         Path(tmp_path).unlink()
+
+
+def test_hash_and_read_matches_file_hash_and_text_read(tmp_path):
+    """Test that hash_and_read returns the file hash and open().read() text."""
+    path = tmp_path / "skill.md"
+    path.write_bytes(b"# Title\r\nBody \xc3\xa9\r\n")
+
+    content_hash, content = hash_and_read(str(path))
+
+    assert content_hash == compute_file_hash(str(path))
+    with open(path) as f:
+        assert content == f.read()
+    assert content == "# Title\nBody \u00e9\n"
+
+
+def test_hash_and_read_large_file_matches_text_read(tmp_path):
+    """Test that memory-mapped large files hash and decode like small ones."""
+    path = tmp_path / "large.md"
+    path.write_bytes(b"line \xc3\xa9\r\nold mac\rend\n" * 10000)
+
+    content_hash, content = hash_and_read(str(path))
+
+    assert content_hash == compute_file_hash(str(path))
+    with open(path) as f:
+        assert content == f.read()
@@ -263,6 +263,24 @@ class TestHybridSearch:
         assert hybrid.metrics['total_latency_ms'] >= 0
         assert hybrid.metrics['last_search_at'] is not None
 
+    def test_hybrid_search_uses_precomputed_embedding(self):
+        """hybrid_search() skips embedding generation when given query_embedding."""
+        embedding_service = Mock()
+        query_api = Mock()
+        supabase_store = Mock()
+
+        vector_mock = Mock()
+        vector_mock.data = [{'section_id': 1, 'similarity': 0.9}]
+        supabase_store.client.rpc.return_value.execute.return_value = vector_mock
+        query_api.search_sections_with_rank.return_value = [(2, 2.0)]
+
+        hybrid = HybridSearch(embedding_service, supabase_store, query_api)
+        hybrid.hybrid_search("test", query_embedding=[0.4, 0.5])
+
+        embedding_service.generate_embedding.assert_not_called()
+        rpc_params = supabase_store.client.rpc.call_args.args[1]
+        assert rpc_params['query_embedding'] == [0.4, 0.5]
+
     def test_hybrid_search_respects_vector_weight(self):
         """hybrid_search() uses vector_weight parameter."""
         embedding_service = Mock()
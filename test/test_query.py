@@ -339,6 +339,29 @@ Content 3.
         assert tree[1].title == "Section 2"
         assert tree[2].title == "Section 3"
 
+    def test_list_sections_document_order_with_limit(self):
+        """Test list_sections returns (id, level, title) rows and honors limit/offset."""
+        content = """# Root
+
+## Child A
+
+## Child B
+
+# Other
+"""
+        file_path = "/test/list.md"
+        self._store_file(file_path, content)
+        self._store_file("/test/other.md", "# Elsewhere\n")
+
+        rows = self.query.list_sections(file_path)
+        assert [(level, title) for _, level, title in rows] == [
+            (1, "Root"), (2, "Child A"), (2, "Child B"), (1, "Other")
+        ]
+
+        assert self.query.list_sections(file_path, limit=2, offset=1) == rows[1:3]
+        assert len(self.query.list_sections()) == 5
+        assert list(self.query.iter_sections(file_path)) == rows
+
 
 class TestSearchSections:
     """Test QueryAPI.search_sections method."""
@@ -746,29 +769,27 @@ class TestCLISearchIntegration:
         # Should find sections with either term (FTS5 OR search)
         assert len(results) >= 0
 
-    def test_search_sections_delegates_to_ranked(self):
-        """search_sections() internally uses search_sections_with_rank()."""
+    def test_search_sections_matches_ranked_order(self):
+        """search_sections() returns the same hits, in the same BM25 order, as search_sections_with_rank()."""
         from models import ParsedDocument, Section, FileFormat
-        from unittest.mock import patch
 
         doc = ParsedDocument(
             file_type=FileType.SKILL,
             frontmatter="",
-            sections=[Section(level=1, title="Test", content="Content", line_start=1, line_end=2)],
+            sections=[
+                Section(level=1, title="Other", content="mentions test once", line_start=1, line_end=2),
+                Section(level=1, title="Test", content="test test test", line_start=3, line_end=4),
+            ],
             format=FileFormat.MARKDOWN_HEADINGS,
             original_path="/test/delegate.md"
         )
         self.store.store_file("/test/delegate.md", doc, "test_hash")
 
-        # Patch search_sections_with_rank to track calls
-        with patch.object(self.query, 'search_sections_with_rank') as mock_ranked:
-            mock_ranked.return_value = [(1, 2.5)]
-
-            results = self.query.search_sections("test")
+        results = self.query.search_sections("test")
+        ranked = self.query.search_sections_with_rank("test")
 
-            # Verify delegation
-            mock_ranked.assert_called_once()
-            assert len(results) > 0
+        assert [section_id for section_id, _ in results] == [section_id for section_id, _ in ranked]
+        assert results[0][1].title == "Test"
 
 
 class TestNextNavigation:
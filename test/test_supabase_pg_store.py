@@ -0,0 +1,65 @@
+"""Tests for the direct Postgres bulk writer."""
+import pytest
+from unittest.mock import MagicMock
+from core import supabase_pg_store
+from core.supabase_pg_store import SupabasePgStore
+from models import FileMetadata, FileType, Section
+
+
+@pytest.fixture
+def mock_connection(monkeypatch):
+    """Mock psycopg connection for testing."""
+    mock_psycopg = MagicMock()
+    monkeypatch.setattr(supabase_pg_store, 'psycopg', mock_psycopg)
+    return mock_psycopg.connect.return_value
+
+
+class TestStoreFilesBulk:
+    """Test COPY-based bulk writes."""
+
+    def test_copies_files_and_sections_in_one_transaction(self, mock_connection):
+        """Test that files are upserted and sections copied, then committed once."""
+        cur = mock_connection.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = [("uuid-b", "/b.md"), ("uuid-a", "/a.md")]
+        copies = [MagicMock(), MagicMock()]
+        cur.copy.return_value.__enter__.side_effect = copies
+
+        parent = Section(level=1, title="Parent", content="p", line_start=1, line_end=4)
+        parent.add_child(Section(level=2, title="Child", content="c", line_start=3, line_end=4))
+        metas = [
+            FileMetadata(path="/a.md", type=FileType.SKILL, frontmatter="", hash="h1"),
+            FileMetadata(path="/b.md", type=FileType.COMMAND, frontmatter="x: 1", hash="h2"),
+        ]
+
+        store = SupabasePgStore("postgresql://test")
+        file_ids = store.store_files_bulk(metas, [[parent], []])
+
+        assert file_ids == ["uuid-a", "uuid-b"]
+
+        file_rows = [call.args[0] for call in copies[0].write_row.call_args_list]
+        assert file_rows == [
+            ("a", "/a.md", "skill", None, "h1"),
+            ("b", "/b.md", "command", "x: 1", "h2"),
+        ]
+
+        section_rows = [call.args[0] for call in copies[1].write_row.call_args_list]
+        assert [row[4] for row in section_rows] == ["Parent", "Child"]
+        assert section_rows[1][2] == section_rows[0][0]
+        assert section_rows[0][1] == "uuid-a"
+
+        mock_connection.commit.assert_called_once()
+        mock_connection.rollback.assert_not_called()
+
+    def test_rolls_back_on_error(self, mock_connection):
+        """Test that a failed COPY rolls the whole batch back."""
+        cur = mock_connection.cursor.return_value.__enter__.return_value
+        cur.execute.side_effect = RuntimeError("connection lost")
+
+        store = SupabasePgStore("postgresql://test")
+        meta = FileMetadata(path="/a.md", type=FileType.SKILL, frontmatter="", hash="h1")
+
+        with pytest.raises(RuntimeError):
+            store.store_files_bulk([meta], [[]])
+
+        mock_connection.rollback.assert_called_once()
+        mock_connection.commit.assert_not_called()
@@ -3,7 +3,7 @@ import os
 import pytest
 from uuid import UUID, uuid4
 from unittest.mock import MagicMock, Mock, patch
-from core.supabase_store import SupabaseStore
+from core.supabase_store import CircuitOpen, SupabaseStore
 from models import ParsedDocument, FileType, FileFormat
 
 
@@ -29,6 +29,13 @@ class TestSupabaseConnection:
         assert store.url == url
         assert store.key == key
 
+    def test_context_manager_closes_http_session(self, mock_supabase_client):
+        """Test that leaving the context closes the pooled PostgREST session."""
+        with SupabaseStore(url="https://test.supabase.co", key="test-key") as store:
+            assert store.client is mock_supabase_client
+
+        mock_supabase_client.postgrest.aclose.assert_called_once()
+
 
 class TestStoreFile:
     """Test storing files in Supabase."""
@@ -38,15 +45,10 @@ class TestStoreFile:
         # Setup mock to return a UUID
         test_uuid = str(uuid4())
 
-        # Mock the SELECT query (checking for existing file)
-        mock_select_result = Mock()
-        mock_select_result.data = []  # No existing file
-        mock_supabase_client.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_select_result
-
-        # Mock the INSERT query
-        mock_insert_result = Mock()
-        mock_insert_result.data = [{"id": test_uuid}]
-        mock_supabase_client.table.return_value.insert.return_value.execute.return_value = mock_insert_result
+        # Mock the UPSERT query
+        mock_upsert_result = Mock()
+        mock_upsert_result.data = [{"id": test_uuid}]
+        mock_supabase_client.table.return_value.upsert.return_value.execute.return_value = mock_upsert_result
 
         store = SupabaseStore(url="https://test.supabase.co", key="test-key")
 
@@ -74,6 +76,11 @@ class TestStoreFile:
         assert str(uuid_obj) == file_id
         assert file_id == test_uuid
 
+        # Upserted on the unique storage_path, so re-uploads are idempotent
+        upsert_mock = mock_supabase_client.table.return_value.upsert
+        assert upsert_mock.call_args[1]["on_conflict"] == "storage_path"
+        assert upsert_mock.call_args[0][0]["storage_path"] == "/hidden/storage/test.md"
+
     def test_store_file_with_hierarchical_sections(self, mock_supabase_client):
         """Test that store_file stores sections with correct parent_id relationships."""
         from models import Section
@@ -83,12 +90,7 @@ class TestStoreFile:
         test_section_uuid_1 = str(uuid4())
         test_section_uuid_2 = str(uuid4())
 
-        # Mock SELECT query (checking for existing file)
-        mock_select_result = Mock()
-        mock_select_result.data = []  # No existing file
-        mock_supabase_client.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_select_result
-
-        # Mock file insert
+        # Mock file upsert
         mock_file_result = Mock()
         mock_file_result.data = [{"id": test_file_uuid}]
 
@@ -100,11 +102,11 @@ class TestStoreFile:
 
         # Setup table mock to return different results
         table_mock = mock_supabase_client.table.return_value
+        table_mock.upsert.return_value.execute.return_value = mock_file_result
         insert_mock = table_mock.insert.return_value
         insert_mock.execute.side_effect = [
-            mock_file_result,  # First call for file insert
-            mock_section_result_1,  # Second call for parent section
-            mock_section_result_2,  # Third call for child section
+            mock_section_result_1,  # First call for parent section
+            mock_section_result_2,  # Second call for child section
         ]
 
         store = SupabaseStore(url="https://test.supabase.co", key="test-key")
@@ -146,6 +148,89 @@ class TestStoreFile:
 
         # Verify sections were stored (implementation detail tested elsewhere)
 
+    def test_store_file_with_retry_retries_transient_errors(self, mock_supabase_client, monkeypatch):
+        """Test that a 503 is retried, honoring Retry-After, and then succeeds."""
+        sleeps = []
+        monkeypatch.setattr('core.supabase_store.time.sleep', sleeps.append)
+
+        error = Exception("Service Unavailable")
+        error.response = Mock(status_code=503, headers={"retry-after": "2"})
+
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+        store.store_file = Mock(side_effect=[error, "file-id"])
+
+        assert store.store_file_with_retry("/a.md", "a.md", Mock(), "hash") == "file-id"
+        assert store.store_file.call_count == 2
+        assert sleeps == [2.0]
+
+    def test_store_file_with_retry_opens_circuit(self, mock_supabase_client):
+        """Test that non-transient errors are not retried and trip the breaker."""
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+        store.store_file = Mock(side_effect=ValueError("bad row"))
+
+        for _ in range(SupabaseStore.CIRCUIT_BREAKER_THRESHOLD):
+            with pytest.raises(ValueError):
+                store.store_file_with_retry("/a.md", "a.md", Mock(), "hash")
+
+        assert store.store_file.call_count == SupabaseStore.CIRCUIT_BREAKER_THRESHOLD
+        with pytest.raises(CircuitOpen):
+            store.store_file_with_retry("/a.md", "a.md", Mock(), "hash")
+
+    def test_store_files_bulk_uses_one_request_per_table(self, mock_supabase_client):
+        """Test that store_files_bulk upserts files and inserts sections in bulk."""
+        from models import FileMetadata, Section
+
+        file_uuid_a = str(uuid4())
+        file_uuid_b = str(uuid4())
+
+        table_mock = mock_supabase_client.table.return_value
+        upsert_result = Mock()
+        upsert_result.data = [
+            {"id": file_uuid_b, "storage_path": "/b.md"},
+            {"id": file_uuid_a, "storage_path": "/a.md"},
+        ]
+        table_mock.upsert.return_value.execute.return_value = upsert_result
+
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+
+        parent = Section(level=1, title="Parent", content="p", line_start=1, line_end=4)
+        parent.add_child(Section(level=2, title="Child", content="c", line_start=3, line_end=4))
+        other = Section(level=1, title="Other", content="o", line_start=1, line_end=2)
+
+        metas = [
+            FileMetadata(path="/a.md", type=FileType.SKILL, frontmatter="", hash="h1"),
+            FileMetadata(path="/b.md", type=FileType.COMMAND, frontmatter="x: 1", hash="h2"),
+        ]
+
+        file_ids = store.store_files_bulk(metas, [[parent], [other]])
+
+        assert file_ids == [file_uuid_a, file_uuid_b]
+
+        files_payload = table_mock.upsert.call_args[0][0]
+        assert [row["storage_path"] for row in files_payload] == ["/a.md", "/b.md"]
+        # Same name as store_file gets from cmd_ingest: the file stem
+        assert [row["name"] for row in files_payload] == ["a", "b"]
+        assert files_payload[0]["frontmatter"] is None
+        assert table_mock.upsert.call_args[1]["on_conflict"] == "storage_path"
+
+        table_mock.delete.return_value.in_.assert_called_once_with(
+            "file_id", [file_uuid_a, file_uuid_b]
+        )
+
+        assert table_mock.insert.call_count == 1
+        rows = table_mock.insert.call_args[0][0]
+        assert [row["title"] for row in rows] == ["Parent", "Child", "Other"]
+        assert rows[1]["parent_id"] == rows[0]["id"]
+        assert rows[0]["parent_id"] is None
+        assert rows[2]["file_id"] == file_uuid_b
+
+    def test_store_files_bulk_empty_is_noop(self, mock_supabase_client):
+        """Test that store_files_bulk makes no requests for an empty batch."""
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+
+        assert store.store_files_bulk([], []) == []
+        mock_supabase_client.table.assert_not_called()
+
 
 class TestGetFile:
     """Test retrieving files from Supabase."""
@@ -313,6 +398,36 @@ class TestCheckoutTracking:
         assert all(c["user_name"] == "joey" for c in checkouts)
 
 
+class TestIngestCheckpoint:
+    """Test ingest progress checkpoints."""
+
+    def test_get_ingest_checkpoint_missing_returns_none(self, mock_supabase_client):
+        """Test that a script with no checkpoint row returns None."""
+        mock_result = Mock()
+        mock_result.data = []
+        select_mock = mock_supabase_client.table.return_value.select.return_value
+        select_mock.eq.return_value.limit.return_value.execute.return_value = mock_result
+
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+
+        assert store.get_ingest_checkpoint("batch_ingest_supabase") is None
+        mock_supabase_client.table.assert_called_with("ingest_progress")
+        select_mock.eq.assert_called_with("script", "batch_ingest_supabase")
+
+    def test_save_ingest_checkpoint_upserts_on_script(self, mock_supabase_client):
+        """Test that saving a checkpoint upserts one row per script."""
+        store = SupabaseStore(url="https://test.supabase.co", key="test-key")
+
+        store.save_ingest_checkpoint("batch_ingest_supabase", 1234, 987654321)
+
+        upsert_mock = mock_supabase_client.table.return_value.upsert
+        row = upsert_mock.call_args[0][0]
+        assert row["script"] == "batch_ingest_supabase"
+        assert row["last_ingested_id"] == 1234
+        assert row["source_db_mtime"] == 987654321
+        assert upsert_mock.call_args[1]["on_conflict"] == "script"
+
+
 class TestSupabaseSecretManagerIntegration:
     """Test SecretManager integration with SupabaseStore."""
 